@@ -13,6 +13,7 @@ conscious design decision, leaving the door open for keyword arguments
 to modify the meaning of the API call itself.
 """
 
+import bisect
 import collections
 import collections.abc
 import concurrent.futures
@@ -41,9 +42,11 @@ from . import events
 from . import exceptions
 from . import futures
 from . import protocols
+from . import queues
 from . import sslproto
 from . import staggered
 from . import tasks
+from . import timerwheel
 from . import transports
 from . import trsock
 from .log import logger
@@ -66,6 +69,10 @@ _HAS_IPv6 = hasattr(socket, 'AF_INET6')
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Upper bounds (in seconds) of the buckets of the histogram of the time
+# spent by work items waiting for a worker of the default executor.
+_EXECUTOR_WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
 # Used for deprecation and removal of `loop.create_datagram_endpoint()`'s
 # *reuse_address* parameter
 _unset = object()
@@ -381,6 +388,66 @@ class Server(events.AbstractServer):
         await waiter
 
 
+class _ExecutorMonitor:
+    """Bookkeeping of the work items submitted to the default executor.
+
+    The counters are updated from the worker threads, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.wait_time_total = 0.0
+        self.wait_time_counts = [0] * (len(_EXECUTOR_WAIT_TIME_BUCKETS) + 1)
+
+    def submit(self, executor, func, args):
+        with self._lock:
+            self.queued += 1
+        try:
+            cf = executor.submit(self._run, time.monotonic(), func, args)
+        except BaseException:
+            with self._lock:
+                self.queued -= 1
+            raise
+        cf.add_done_callback(self._on_done)
+        return cf
+
+    def snapshot(self):
+        with self._lock:
+            histogram = tuple(zip(_EXECUTOR_WAIT_TIME_BUCKETS + (float('inf'),),
+                                  self.wait_time_counts))
+            return {
+                'queued': self.queued,
+                'active_workers': self.active,
+                'completed': self.completed,
+                'wait_time_total': self.wait_time_total,
+                'wait_time_histogram': histogram,
+            }
+
+    def _run(self, submitted, func, args):
+        wait_time = time.monotonic() - submitted
+        index = bisect.bisect_left(_EXECUTOR_WAIT_TIME_BUCKETS, wait_time)
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.wait_time_total += wait_time
+            self.wait_time_counts[index] += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+    def _on_done(self, cf):
+        if cf.cancelled():
+            # The work item was cancelled before a worker picked it up.
+            with self._lock:
+                self.queued -= 1
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
@@ -389,7 +456,15 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Replaces _scheduled when enabled by set_timer_wheel().
+        self._timer_wheel = None
         self._default_executor = None
+        self._default_executor_max_workers = None
+        self._default_executor_max_queue_size = 0
+        # Futures of the callers waiting for room in the queue of the
+        # default executor, see _wait_default_executor_slot().
+        self._default_executor_waiters = collections.deque()
+        self._executor_monitor = _ExecutorMonitor()
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
         # event loop is not running
@@ -637,9 +712,15 @@ class BaseEventLoop(events.AbstractEventLoop):
             return
         if self._debug:
             logger.debug("Close %r", self)
+        # Wake up the callers waiting for room in the queue of the default
+        # executor while the loop still accepts their callbacks.
+        waiters = self._default_executor_waiters
+        while waiters:
+            waiters.popleft().cancel()
         self._closed = True
-        self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
@@ -702,10 +783,55 @@ class BaseEventLoop(events.AbstractEventLoop):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None:
+            heapq.heappush(self._scheduled, timer)
+        else:
+            self._timer_wheel.add(timer)
         timer._scheduled = True
         return timer
 
+    def set_timer_wheel(self, resolution):
+        """Select how the callbacks of call_at() and call_later() are kept.
+
+        By default, timers are kept in a binary heap.  If resolution
+        is a number of seconds, a hierarchical timer wheel with ticks of
+        that duration is used instead: scheduling and cancelling a timer
+        are then O(1), which pays off with many timeouts which are
+        constantly cancelled and rescheduled.  Timers still never run
+        before their deadline.  If resolution is None, switch back to
+        the heap.
+
+        Timers already scheduled are moved to the new data structure.
+        """
+        if resolution is not None:
+            if resolution <= 0:
+                raise ValueError(
+                    f'resolution must be a positive number, got {resolution!r}')
+            wheel = timerwheel.TimerWheel(resolution, self.time())
+        else:
+            wheel = None
+
+        if self._timer_wheel is not None:
+            handles = list(self._timer_wheel)
+            self._timer_wheel.clear()
+        else:
+            handles = []
+            for handle in self._scheduled:
+                if handle._cancelled:
+                    handle._scheduled = False
+                else:
+                    handles.append(handle)
+        self._scheduled = []
+        self._timer_cancelled_count = 0
+
+        self._timer_wheel = wheel
+        if wheel is None:
+            heapq.heapify(handles)
+            self._scheduled = handles
+        else:
+            for handle in handles:
+                wheel.add(handle)
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -725,6 +851,30 @@ class BaseEventLoop(events.AbstractEventLoop):
             del handle._source_traceback[-1]
         return handle
 
+    def call_soon_many(self, callbacks, *args):
+        """Arrange for several callbacks to be called as soon as possible.
+
+        Each item of *callbacks* is either a callable or a
+        (callable, context) pair, like the callbacks of a Future.  Every
+        callback is called with the positional arguments *args*, in the
+        order of *callbacks*.  The callbacks without a context all run in
+        a single copy of the current context.
+
+        The callbacks are run by a single Handle, which is returned:
+        cancelling it cancels all of them.
+        """
+        self._check_closed()
+        if self._debug:
+            self._check_thread()
+        handle = events._BatchHandle(callbacks, args, self)
+        if self._debug:
+            for callback, context in handle._callbacks:
+                self._check_callback(callback, 'call_soon_many')
+        if handle._source_traceback:
+            del handle._source_traceback[-1]
+        self._ready.append(handle)
+        return handle
+
     def _check_callback(self, callback, method):
         if (coroutines.iscoroutine(callback) or
                 coroutines.iscoroutinefunction(callback)):
@@ -774,13 +924,67 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._check_closed()
         if self._debug:
             self._check_callback(func, 'run_in_executor')
+        if executor is not None:
+            return futures.wrap_future(
+                executor.submit(func, *args), loop=self)
+
+        executor = self._default_executor
         if executor is None:
-            executor = self._default_executor
-            if executor is None:
-                executor = concurrent.futures.ThreadPoolExecutor()
-                self._default_executor = executor
-        return futures.wrap_future(
-            executor.submit(func, *args), loop=self)
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._default_executor_max_workers)
+            self._default_executor = executor
+        if self._default_executor_free_slots() <= 0:
+            raise queues.QueueFull(
+                'the queue of the default executor is full')
+        fut = futures.wrap_future(
+            self._executor_monitor.submit(executor, func, args), loop=self)
+        fut.add_done_callback(self._wakeup_default_executor_waiters)
+        return fut
+
+    def _default_executor_free_slots(self):
+        """Return the number of work items the queue of the default
+        executor can take."""
+        max_queue_size = self._default_executor_max_queue_size
+        if not max_queue_size:
+            return sys.maxsize
+        # The callers which were woken up but did not submit their work
+        # item yet have a reserved slot.
+        reserved = sum(1 for waiter in self._default_executor_waiters
+                       if waiter.done() and not waiter.cancelled())
+        return max_queue_size - self._executor_monitor.queued - reserved
+
+    async def _wait_default_executor_slot(self):
+        """Wait until the queue of the default executor has room for a
+        work item."""
+        waiters = self._default_executor_waiters
+        while True:
+            if self._default_executor_free_slots() > 0:
+                return
+            waiter = self.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except:
+                waiter.cancel()  # Just in case waiter is not done yet.
+                try:
+                    # Clean self._default_executor_waiters in case waiter
+                    # was not woken up.
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Pass on the slot reserved for this caller, if any.
+                self._wakeup_default_executor_waiters()
+                raise
+            waiters.remove(waiter)
+
+    def _wakeup_default_executor_waiters(self, fut=None):
+        free = self._default_executor_free_slots()
+        for waiter in self._default_executor_waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
 
     def set_default_executor(self, executor):
         if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
@@ -791,6 +995,62 @@ class BaseEventLoop(events.AbstractEventLoop):
                 DeprecationWarning, 2)
         self._default_executor = executor
 
+    def set_default_executor_limits(self, *, max_workers=None,
+                                    max_queue_size=None):
+        """Configure the default executor used by run_in_executor().
+
+        max_workers is the number of threads of the default executor.  It
+        can only be set before the default executor is created, that is
+        before the first call to run_in_executor() with executor=None.
+
+        max_queue_size bounds the number of work items waiting for a free
+        worker.  When the bound is reached, run_in_executor() raises
+        QueueFull and to_thread() waits until the queue has room.  Zero
+        means unbounded.
+
+        A None argument leaves the corresponding setting unchanged.
+        """
+        if max_workers is not None:
+            if max_workers <= 0:
+                raise ValueError('max_workers must be greater than 0')
+            if self._default_executor is not None:
+                raise RuntimeError(
+                    'the default executor has already been created')
+            self._default_executor_max_workers = max_workers
+        if max_queue_size is not None:
+            if max_queue_size < 0:
+                raise ValueError('max_queue_size must not be negative')
+            self._default_executor_max_queue_size = max_queue_size
+            self._wakeup_default_executor_waiters()
+
+    def get_default_executor_stats(self):
+        """Return a dict describing the load of the default executor.
+
+        The keys are:
+
+        - 'max_workers': number of threads of the executor;
+        - 'queue_depth': number of work items waiting for a worker;
+        - 'backlog': number of to_thread() calls waiting for room in the
+          queue of the executor;
+        - 'active_workers': number of work items being run;
+        - 'completed': number of work items run so far;
+        - 'wait_time_total': total time, in seconds, spent by the work
+          items waiting for a worker;
+        - 'wait_time_histogram': tuple of (upper bound in seconds, count)
+          pairs of the time spent by the work items waiting for a worker.
+        """
+        stats = self._executor_monitor.snapshot()
+        backlog = sum(1 for waiter in self._default_executor_waiters
+                      if not waiter.done())
+        max_workers = getattr(self._default_executor, '_max_workers',
+                              self._default_executor_max_workers)
+        return {
+            'max_workers': max_workers,
+            'queue_depth': stats.pop('queued'),
+            'backlog': backlog,
+            **stats,
+        }
+
     def _getaddrinfo_debug(self, host, port, family, type, proto, flags):
         msg = [f"{host}:{port!r}"]
         if family:
@@ -1779,7 +2039,11 @@ class BaseEventLoop(events.AbstractEventLoop):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is None:
+                self._timer_cancelled_count += 1
+            else:
+                self._timer_wheel.remove(handle)
+                handle._scheduled = False
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1789,6 +2053,9 @@ class BaseEventLoop(events.AbstractEventLoop):
         'call_later' callbacks.
         """
 
+        # With a timer wheel, _scheduled stays empty: cancelled timers
+        # are removed from the wheel right away.
+        timer_wheel = self._timer_wheel
         sched_count = len(self._scheduled)
         if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
             self._timer_cancelled_count / sched_count >
@@ -1815,6 +2082,11 @@ class BaseEventLoop(events.AbstractEventLoop):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
+        elif timer_wheel is not None:
+            when = timer_wheel.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
         elif self._scheduled:
             # Compute the desired timeout.
             when = self._scheduled[0]._when
@@ -1825,6 +2097,10 @@ class BaseEventLoop(events.AbstractEventLoop):
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
+        if timer_wheel is not None:
+            for handle in timer_wheel.pop_due(end_time):
+                handle._scheduled = False
+                self._ready.append(handle)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1840,11 +2116,12 @@ class BaseEventLoop(events.AbstractEventLoop):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
-        for i in range(ntodo):
-            handle = self._ready.popleft()
-            if handle._cancelled:
-                continue
-            if self._debug:
+        popleft = self._ready.popleft
+        if self._debug:
+            for i in range(ntodo):
+                handle = popleft()
+                if handle._cancelled:
+                    continue
                 try:
                     self._current_handle = handle
                     t0 = self.time()
@@ -1855,8 +2132,11 @@ class BaseEventLoop(events.AbstractEventLoop):
                                        _format_handle(handle), dt)
                 finally:
                     self._current_handle = None
-            else:
-                handle._run()
+        else:
+            for i in range(ntodo):
+                handle = popleft()
+                if not handle._cancelled:
+                    handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
     def _set_coroutine_origin_tracking(self, enabled):
@@ -96,10 +96,92 @@ class Handle:
         self = None  # Needed to break cycles when an exception occurs.
 
 
+class _BatchHandle(Handle):
+    """Handle of the callbacks scheduled by call_soon_many().
+
+    The callbacks are run in order, each in its own context, by a single
+    handle.  Cancelling the handle cancels all of them.
+    """
+
+    __slots__ = ('_callbacks',)
+
+    def __init__(self, callbacks, args, loop):
+        # Callbacks without a context share one copy of the current
+        # context.  The (callback, context) pairs of a Future are kept
+        # as they are.
+        shared_context = None
+        batch = []
+        for item in callbacks:
+            if isinstance(item, tuple):
+                callback, context = item
+            else:
+                callback = item
+                context = None
+            if context is None:
+                if shared_context is None:
+                    shared_context = contextvars.copy_context()
+                item = (callback, shared_context)
+            batch.append(item)
+        self._callbacks = batch
+        self._context = shared_context
+        self._loop = loop
+        self._callback = None
+        self._args = args
+        self._cancelled = False
+        self._repr = None
+        if self._loop.get_debug():
+            self._source_traceback = format_helpers.extract_stack(
+                sys._getframe(1))
+        else:
+            self._source_traceback = None
+
+    def _repr_info(self):
+        info = super()._repr_info()
+        if not self._cancelled:
+            callbacks = ', '.join(
+                format_helpers._format_callback_source(callback, self._args)
+                for callback, ctx in self._callbacks)
+            info.insert(1, f'callbacks=[{callbacks}]')
+        return info
+
+    def cancel(self):
+        super().cancel()
+        self._callbacks = None
+
+    def _run(self):
+        if self._cancelled:
+            # Run through call_soon() by AbstractEventLoop.call_soon_many().
+            return
+        callbacks = self._callbacks
+        for i, (callback, ctx) in enumerate(callbacks):
+            try:
+                ctx.run(callback, *self._args)
+            except (SystemExit, KeyboardInterrupt):
+                # Leave the rest of the batch to the next iteration, as if
+                # the callbacks had been scheduled one by one.
+                self._callbacks = callbacks[i + 1:]
+                if self._callbacks:
+                    self._loop.call_soon(self._run)
+                raise
+            except BaseException as exc:
+                cb = format_helpers._format_callback_source(
+                    callback, self._args)
+                msg = f'Exception in callback {cb}'
+                context = {
+                    'message': msg,
+                    'exception': exc,
+                    'handle': self,
+                }
+                if self._source_traceback:
+                    context['source_traceback'] = self._source_traceback
+                self._loop.call_exception_handler(context)
+        self = None  # Needed to break cycles when an exception occurs.
+
+
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
 
-    __slots__ = ['_scheduled', '_when']
+    __slots__ = ['_scheduled', '_when', '_wheel_bucket']
 
     def __init__(self, when, callback, args, loop, context=None):
         assert when is not None
@@ -108,6 +190,7 @@ class TimerHandle(Handle):
             del self._source_traceback[-1]
         self._when = when
         self._scheduled = False
+        self._wheel_bucket = None
 
     def _repr_info(self):
         info = super()._repr_info()
@@ -258,12 +341,20 @@ class AbstractEventLoop:
     def call_soon(self, callback, *args):
         return self.call_later(0, callback, *args)
 
+    def call_soon_many(self, callbacks, *args):
+        handle = _BatchHandle(callbacks, args, self)
+        self.call_soon(handle._run)
+        return handle
+
     def call_later(self, delay, callback, *args):
         raise NotImplementedError
 
     def call_at(self, when, callback, *args):
         raise NotImplementedError
 
+    def set_timer_wheel(self, resolution):
+        raise NotImplementedError
+
     def time(self):
         raise NotImplementedError
 
@@ -286,6 +377,13 @@ class AbstractEventLoop:
     def set_default_executor(self, executor):
         raise NotImplementedError
 
+    def set_default_executor_limits(self, *, max_workers=None,
+                                    max_queue_size=None):
+        raise NotImplementedError
+
+    def get_default_executor_stats(self):
+        raise NotImplementedError
+
     # Network I/O methods returning Futures.
 
     async def getaddrinfo(self, host, port, *,
@@ -3,7 +3,7 @@
 
 __all__ = ('CancelledError', 'InvalidStateError', 'TimeoutError',
            'IncompleteReadError', 'LimitOverrunError',
-           'SendfileNotAvailableError')
+           'SendfileNotAvailableError', 'TaskGroupError')
 
 
 class CancelledError(BaseException):
@@ -56,3 +56,17 @@ class LimitOverrunError(Exception):
 
     def __reduce__(self):
         return type(self), (self.args[0], self.consumed)
+
+
+class TaskGroupError(Exception):
+    """One or more tasks of a TaskGroup failed.
+
+    Attributes:
+    - errors: list of the exceptions raised by the failed tasks.
+    """
+    def __init__(self, message, errors):
+        super().__init__(message)
+        self.errors = errors
+
+    def __reduce__(self):
+        return type(self), (self.args[0], self.errors)
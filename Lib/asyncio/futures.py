@@ -145,6 +145,12 @@ class Future:
             return
 
         self._callbacks[:] = []
+        if len(callbacks) > 1:
+            # Run all the callbacks from a single Handle.
+            call_soon_many = getattr(self._loop, 'call_soon_many', None)
+            if call_soon_many is not None:
+                call_soon_many(callbacks, self)
+                return
         for callback, ctx in callbacks:
             self._loop.call_soon(callback, self, context=ctx)
 
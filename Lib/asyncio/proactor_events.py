@@ -159,7 +159,12 @@ class _ProactorBasePipeTransport(transports._FlowControlMixin,
             # just close our end.  First calling shutdown() seems to
             # cure it, but maybe using DisconnectEx() would be better.
             if hasattr(self._sock, 'shutdown'):
-                self._sock.shutdown(socket.SHUT_RDWR)
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # Unconnected sockets (e.g. UDP) and sockets reset
+                    # by the peer fail with ENOTCONN on Unix.
+                    pass
             self._sock.close()
             self._sock = None
             server = self._server
@@ -9,6 +9,8 @@ __all__ = 'BaseSelectorEventLoop',
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -29,6 +31,20 @@ from . import trsock
 from .log import logger
 
 
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+if _HAS_SENDMSG:
+    try:
+        SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (OSError, ValueError, AttributeError):
+        # Fall back to send()
+        _HAS_SENDMSG = False
+    else:
+        if SC_IOV_MAX <= 0:
+            # The limit is indeterminate: use the usual value of IOV_MAX.
+            SC_IOV_MAX = 1024
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -751,14 +767,23 @@ class _SelectorSocketTransport(_SelectorTransport):
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
 
+    # Pending data is kept as a deque of chunks, which are flushed with
+    # a single sendmsg() call when the platform supports it.  Chunks are
+    # bytes objects or memoryviews over bytes objects, so that they
+    # cannot be modified once written.
+    _buffer_factory = collections.deque
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
 
         self._read_ready_cb = None
         super().__init__(loop, sock, protocol, extra, server)
+        # Number of bytes in self._buffer, see get_write_buffer_size().
+        self._buffer_size = 0
         self._eof = False
         self._paused = False
         self._empty_waiter = None
+        self._use_sendmsg = _HAS_SENDMSG
 
         # Disable the Nagle algorithm -- small writes will be
         # sent without waiting for the TCP ACK.  This generally
@@ -916,23 +941,92 @@ class _SelectorSocketTransport(_SelectorTransport):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
-                if not data:
-                    return
+                if n:
+                    if n == len(data):
+                        return
+                    if type(data) is bytes:
+                        data = memoryview(data)[n:]
+                    else:
+                        data = data[n:]
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        data = self._make_chunk(data)
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data):
+        """Write a list (or any iterable) of data bytes to the transport.
+
+        The chunks are not concatenated: they are queued as they are and
+        sent with a single sendmsg() call when possible.
+        """
+        chunks = []
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(f'data argument must be a bytes-like object, '
+                                f'not {type(data).__name__!r}')
+            if data:
+                chunks.append(self._make_chunk(data))
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to writelines; sendfile is in progress')
+        if not chunks:
+            return
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        self._buffer_size += sum(map(len, chunks))
+        if self._buffer:
+            # A write handler is already registered.
+            self._buffer.extend(chunks)
+        else:
+            self._buffer.extend(chunks)
+            # Optimization: try to send now.
+            self._write_ready()
+            if self._buffer:
+                # Not all was written; register write handler.
+                self._loop._add_writer(self._sock_fd, self._write_ready)
         self._maybe_pause_protocol()
 
+    @staticmethod
+    def _make_chunk(data):
+        # Mutable buffers are copied: the caller is free to reuse them
+        # as soon as write() returns.
+        if type(data) is bytes:
+            return data
+        if (type(data) is memoryview and type(data.obj) is bytes and
+                data.itemsize == 1 and data.c_contiguous):
+            return data
+        return bytes(data)
+
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
+    def _force_close(self, exc):
+        super()._force_close(exc)
+        self._buffer_size = 0
+
     def _write_ready(self):
+        if self._use_sendmsg:
+            self._write_sendmsg()
+        else:
+            self._write_send()
+
+    def _write_sendmsg(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
         try:
-            n = self._sock.send(self._buffer)
+            n = self._sock.sendmsg(itertools.islice(self._buffer, SC_IOV_MAX))
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -940,21 +1034,66 @@ class _SelectorSocketTransport(_SelectorTransport):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
+            self._fatal_error(exc, 'Fatal write error on socket transport')
+            if self._empty_waiter is not None:
+                self._empty_waiter.set_exception(exc)
+        else:
+            self._consume_buffer(n)
+            self._on_write_ready_done()
+
+    def _write_send(self):
+        assert self._buffer, 'Data should not be empty'
+
+        if self._conn_lost:
+            return
+        buffer = self._buffer
+        if len(buffer) > 1:
+            # Without sendmsg(), coalesce the pending chunks.
+            data = b''.join(buffer)
+            buffer.clear()
+            buffer.append(data)
+        try:
+            n = self._sock.send(buffer[0])
+        except (BlockingIOError, InterruptedError):
+            pass
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            self._loop._remove_writer(self._sock_fd)
+            buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
         else:
-            if n:
-                del self._buffer[:n]
-            self._maybe_resume_protocol()  # May append to buffer.
-            if not self._buffer:
-                self._loop._remove_writer(self._sock_fd)
-                if self._empty_waiter is not None:
-                    self._empty_waiter.set_result(None)
-                if self._closing:
-                    self._call_connection_lost(None)
-                elif self._eof:
-                    self._sock.shutdown(socket.SHUT_WR)
+            self._consume_buffer(n)
+            self._on_write_ready_done()
+
+    def _consume_buffer(self, n):
+        """Drop the first n bytes of the buffer, which were sent."""
+        self._buffer_size -= n
+        buffer = self._buffer
+        while n:
+            data = buffer.popleft()
+            size = len(data)
+            if size > n:
+                if type(data) is bytes:
+                    data = memoryview(data)
+                buffer.appendleft(data[n:])
+                break
+            n -= size
+
+    def _on_write_ready_done(self):
+        self._maybe_resume_protocol()  # May append to buffer.
+        if not self._buffer:
+            self._loop._remove_writer(self._sock_fd)
+            if self._empty_waiter is not None:
+                self._empty_waiter.set_result(None)
+            if self._closing:
+                self._call_connection_lost(None)
+            elif self._eof:
+                self._sock.shutdown(socket.SHUT_WR)
 
     def write_eof(self):
         if self._closing or self._eof:
@@ -1,7 +1,9 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
-    'open_connection', 'start_server')
+    'open_connection', 'start_server', 'ConnectionPool')
 
+import collections
+import inspect
 import socket
 import sys
 import warnings
@@ -14,6 +16,7 @@ from . import coroutines
 from . import events
 from . import exceptions
 from . import format_helpers
+from . import locks
 from . import protocols
 from .log import logger
 from .tasks import sleep
@@ -387,6 +390,176 @@ class StreamWriter:
         await self._protocol._drain_helper()
 
 
+class _ChunkedBuffer:
+    """Read buffer of StreamReader.
+
+    Received data is kept as a deque of the bytes objects passed to
+    feed_data() plus an offset into the first one, so that consuming
+    data from the front of the buffer never moves the rest of it.  A
+    read that matches a received chunk exactly returns that chunk
+    without copying it.
+    """
+
+    def __init__(self):
+        self._chunks = collections.deque()
+        self._offset = 0  # Number of bytes consumed in self._chunks[0].
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __bytes__(self):
+        if not self._chunks:
+            return b''
+        if len(self._chunks) == 1:
+            chunk = self._chunks[0]
+            if self._offset == 0:
+                return chunk
+            return chunk[self._offset:]
+        return b''.join(self._iter_views())
+
+    def _iter_views(self):
+        offset = self._offset
+        for chunk in self._chunks:
+            if offset:
+                yield memoryview(chunk)[offset:]
+                offset = 0
+            else:
+                yield chunk
+
+    def append(self, data):
+        if not isinstance(data, bytes):
+            # Copy mutable buffers, the caller is free to reuse them.
+            data = bytes(data)
+        self._chunks.append(data)
+        self._size += len(data)
+
+    def clear(self):
+        self._chunks.clear()
+        self._offset = 0
+        self._size = 0
+
+    def find(self, sub, start=0):
+        """Return the lowest index of *sub* in the buffer, or -1.
+
+        The search begins at index *start*.
+        """
+        sublen = len(sub)
+        pos = 0      # Index in the buffer of the current chunk.
+        tail = b''   # The (sublen - 1) bytes preceding the current chunk.
+        offset = self._offset
+        for chunk in self._chunks:
+            size = len(chunk) - offset
+            if tail:
+                # Look for an occurrence straddling the chunk boundary.
+                window = tail + chunk[offset:offset + sublen - 1]
+                winpos = pos - len(tail)
+                i = window.find(sub, max(start - winpos, 0))
+                if i != -1:
+                    return winpos + i
+            if start - pos < size:
+                i = chunk.find(sub, offset + max(start - pos, 0))
+                if i != -1:
+                    return pos + i - offset
+            if sublen > 1:
+                tail = (tail + chunk[max(offset, len(chunk) - sublen + 1):])
+                tail = tail[-(sublen - 1):]
+            pos += size
+            offset = 0
+        return -1
+
+    def startswith(self, prefix, start=0):
+        if start + len(prefix) > self._size:
+            return False
+        return self.find(prefix, start) == start
+
+    def discard(self, n):
+        """Remove the first *n* bytes from the buffer."""
+        n = min(n, self._size)
+        self._size -= n
+        chunks = self._chunks
+        n += self._offset
+        while chunks and n >= len(chunks[0]):
+            n -= len(chunks.popleft())
+        self._offset = n
+
+    def consume(self, n):
+        """Remove the first *n* bytes from the buffer and return them.
+
+        Fewer bytes are returned if the buffer is shorter than *n*.
+        """
+        n = min(n, self._size)
+        if not n:
+            return b''
+        chunks = self._chunks
+        first = chunks[0]
+        offset = self._offset
+        end = offset + n
+        self._size -= n
+        if end < len(first):
+            self._offset = end
+            return first[offset:end]
+        if end == len(first):
+            chunks.popleft()
+            self._offset = 0
+            return first[offset:] if offset else first
+        # The data spans several chunks: join views of them.
+        parts = []
+        remaining = n
+        while remaining:
+            chunk = chunks[0]
+            size = min(len(chunk) - offset, remaining)
+            parts.append(memoryview(chunk)[offset:offset + size])
+            remaining -= size
+            offset += size
+            if offset == len(chunk):
+                chunks.popleft()
+                offset = 0
+        self._offset = offset
+        return b''.join(parts)
+
+    def consume_into(self, buffer):
+        """Move bytes from the front of the buffer into *buffer*.
+
+        Return the number of bytes copied.
+        """
+        with memoryview(buffer) as view, view.cast('B') as view:
+            return self._copy_into(view)
+
+    def _copy_into(self, view):
+        n = min(len(view), self._size)
+        copied = 0
+        chunks = self._chunks
+        offset = self._offset
+        while copied < n:
+            chunk = chunks[0]
+            size = min(len(chunk) - offset, n - copied)
+            view[copied:copied + size] = memoryview(chunk)[offset:offset + size]
+            copied += size
+            offset += size
+            if offset == len(chunk):
+                chunks.popleft()
+                offset = 0
+        self._offset = offset
+        self._size -= n
+        return n
+
+    def consume_view(self, n):
+        """Remove the first *n* bytes from the buffer, return a memoryview.
+
+        The data is not copied if it was received in a single chunk.
+        """
+        n = min(n, self._size)
+        if n and self._offset + n <= len(self._chunks[0]):
+            view = memoryview(self._chunks[0])[self._offset:self._offset + n]
+            self.discard(n)
+            return view
+        return memoryview(self.consume(n))
+
+
 class StreamReader:
 
     _source_traceback = None
@@ -403,7 +576,7 @@ class StreamReader:
             self._loop = events.get_event_loop()
         else:
             self._loop = loop
-        self._buffer = bytearray()
+        self._buffer = _ChunkedBuffer()
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
         self._exception = None
@@ -474,7 +647,7 @@ class StreamReader:
         if not data:
             return
 
-        self._buffer.extend(data)
+        self._buffer.append(data)
         self._wakeup_waiter()
 
         if (self._transport is not None and
@@ -542,7 +715,7 @@ class StreamReader:
             return e.partial
         except exceptions.LimitOverrunError as e:
             if self._buffer.startswith(sep, e.consumed):
-                del self._buffer[:e.consumed + seplen]
+                self._buffer.discard(e.consumed + seplen)
             else:
                 self._buffer.clear()
             self._maybe_resume_transport()
@@ -635,10 +808,9 @@ class StreamReader:
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
+        chunk = self._buffer.consume(isep + seplen)
         self._maybe_resume_transport()
-        return bytes(chunk)
+        return chunk
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -684,13 +856,41 @@ class StreamReader:
             await self._wait_for_data('read')
 
         # This will work right even if buffer is less than n bytes
-        data = bytes(self._buffer[:n])
-        del self._buffer[:n]
+        data = self._buffer.consume(n)
 
         self._maybe_resume_transport()
         return data
 
-    async def readexactly(self, n):
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into *buffer*.
+
+        Return the number of bytes read.  Like read(n), this waits for
+        at least one byte; 0 is returned if EOF was received before any
+        byte is read.
+
+        *buffer* must be a writable bytes-like object.  Reading into a
+        preallocated buffer avoids creating a new bytes object for
+        every read.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view:
+            if not view.nbytes:
+                return 0
+
+            if not self._buffer and not self._eof:
+                await self._wait_for_data('readinto')
+
+            n = self._buffer.consume_into(view)
+
+        self._maybe_resume_transport()
+        return n
+
+    async def readexactly(self, n, *, view=False):
         """Read exactly `n` bytes.
 
         Raise an IncompleteReadError if EOF is reached before `n` bytes can be
@@ -699,6 +899,10 @@ class StreamReader:
 
         if n is zero, return empty bytes object.
 
+        If view is true, return a read-only memoryview instead of a bytes
+        object.  The data is not copied when it was received in a single
+        chunk, which is typical of the payload of large frames.
+
         Returned value is not limited with limit, configured at stream
         creation.
 
@@ -712,7 +916,7 @@ class StreamReader:
             raise self._exception
 
         if n == 0:
-            return b''
+            return memoryview(b'') if view else b''
 
         while len(self._buffer) < n:
             if self._eof:
@@ -722,12 +926,10 @@ class StreamReader:
 
             await self._wait_for_data('readexactly')
 
-        if len(self._buffer) == n:
-            data = bytes(self._buffer)
-            self._buffer.clear()
+        if view:
+            data = self._buffer.consume_view(n)
         else:
-            data = bytes(self._buffer[:n])
-            del self._buffer[:n]
+            data = self._buffer.consume(n)
         self._maybe_resume_transport()
         return data
 
@@ -739,3 +941,250 @@ class StreamReader:
         if val == b'':
             raise StopAsyncIteration
         return val
+
+
+class ConnectionPool:
+    """A pool of reusable connections opened with open_connection().
+
+    Connections are kept per (host, port) key.  At most max_size
+    connections of a key are in use at the same time: acquire() waits
+    for a connection to be released beyond that.  Released connections
+    are kept idle and reused last in, first out, which keeps the most
+    recently used connections warm and lets the others expire after
+    idle_timeout seconds (never if None).
+
+    health_check, if not None, is called with (reader, writer) before an
+    idle connection is reused; it returns a boolean or an awaitable
+    resolving to a boolean.  Connections failing the check are closed.
+
+    The remaining keyword arguments are passed to open_connection(),
+    e.g. ssl: reusing connections saves the TLS handshakes.
+    """
+
+    def __init__(self, *, max_size=10, idle_timeout=None, health_check=None,
+                 limit=_DEFAULT_LIMIT, **kwds):
+        if max_size <= 0:
+            raise ValueError('max_size must be greater than 0')
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError('idle_timeout must be None or positive')
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check
+        self._limit = limit
+        self._kwds = kwds
+        # key => Semaphore limiting the connections in use
+        self._semaphores = {}
+        # key => deque of (reader, writer, release time), most recent last
+        self._idle = {}
+        # writer => (key, reader)
+        self._in_use = {}
+        self._expire_handle = None
+        self._closed = False
+        # statistics
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def __repr__(self):
+        info = [f'max_size={self._max_size}',
+                f'in_use={len(self._in_use)}',
+                f'idle={sum(map(len, self._idle.values()))}']
+        if self._closed:
+            info.append('closed')
+        return '<{} {}>'.format(self.__class__.__name__, ' '.join(info))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def is_closed(self):
+        return self._closed
+
+    def stats(self):
+        """Return a dict of statistics of the pool.
+
+        hits and misses count the acquisitions which reused an idle
+        connection and which opened a new one; hit_rate is their ratio.
+        wait_time and max_wait_time are the total and the longest time
+        in seconds spent waiting for a connection to be released.
+        """
+        acquired = self._hits + self._misses
+        return {
+            'in_use': len(self._in_use),
+            'idle': sum(map(len, self._idle.values())),
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / acquired if acquired else 0.0,
+            'waits': self._waits,
+            'wait_time': self._wait_time,
+            'max_wait_time': self._max_wait_time,
+        }
+
+    async def acquire(self, host=None, port=None):
+        """Return a (reader, writer) pair connected to host and port.
+
+        An idle connection is reused if possible, otherwise a new one is
+        opened.  The connection must be given back with release().
+        """
+        if self._closed:
+            raise RuntimeError('ConnectionPool is closed')
+        loop = events.get_running_loop()
+        key = (host, port)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = locks.Semaphore(
+                self._max_size)
+
+        if semaphore.locked():
+            start = loop.time()
+            await semaphore.acquire()
+            waited = loop.time() - start
+            self._waits += 1
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+        else:
+            await semaphore.acquire()
+
+        try:
+            if self._closed:
+                raise RuntimeError('ConnectionPool is closed')
+            conn = await self._get_idle(key, loop)
+            if conn is None:
+                conn = await open_connection(host, port, limit=self._limit,
+                                             **self._kwds)
+                self._misses += 1
+            else:
+                self._hits += 1
+        except BaseException:
+            semaphore.release()
+            raise
+
+        reader, writer = conn
+        self._in_use[writer] = (key, reader)
+        return reader, writer
+
+    def release(self, writer, *, discard=False):
+        """Give back a connection returned by acquire().
+
+        The connection is closed instead of being kept idle if discard
+        is true, if the pool is closed or if it can not be reused: the
+        stream was closed, or it holds data that was not read.
+        """
+        try:
+            key, reader = self._in_use.pop(writer)
+        except KeyError:
+            raise ValueError(
+                f'{writer!r} was not acquired from this pool') from None
+        if discard or self._closed or not self._is_reusable(reader, writer):
+            writer.close()
+        else:
+            loop = writer._loop
+            idle = self._idle.setdefault(key, collections.deque())
+            idle.append((reader, writer, loop.time()))
+            if self._idle_timeout is not None and self._expire_handle is None:
+                self._expire_handle = loop.call_later(self._idle_timeout,
+                                                      self._expire, loop)
+        self._semaphores[key].release()
+
+    def connection(self, host=None, port=None):
+        """Return an asynchronous context manager acquiring a connection.
+
+        The (reader, writer) pair is released on exit; the connection is
+        discarded if an exception was raised.
+
+            async with pool.connection(host, port) as (reader, writer):
+                ...
+        """
+        return _PoolConnection(self, host, port)
+
+    async def close(self):
+        """Close the idle connections and the pool.
+
+        Connections in use are closed when they are released.
+        """
+        self._closed = True
+        if self._expire_handle is not None:
+            self._expire_handle.cancel()
+            self._expire_handle = None
+        writers = []
+        for idle in self._idle.values():
+            for reader, writer, released in idle:
+                writer.close()
+                writers.append(writer)
+        self._idle.clear()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except Exception:
+                # the error of a connection being dropped doesn't matter
+                pass
+
+    def _is_reusable(self, reader, writer):
+        return not (writer.is_closing() or reader.at_eof() or
+                    reader._buffer or reader.exception() is not None)
+
+    async def _get_idle(self, key, loop):
+        idle = self._idle.get(key)
+        if not idle:
+            return None
+        self._expire_idle(idle, loop.time())
+        while idle:
+            reader, writer, released = idle.pop()
+            if not self._is_reusable(reader, writer):
+                writer.close()
+                continue
+            if self._health_check is not None:
+                try:
+                    healthy = self._health_check(reader, writer)
+                    if inspect.isawaitable(healthy):
+                        healthy = await healthy
+                except BaseException:
+                    writer.close()
+                    raise
+                if not healthy:
+                    writer.close()
+                    continue
+            return reader, writer
+        return None
+
+    def _expire_idle(self, idle, now):
+        if self._idle_timeout is None:
+            return
+        while idle and now - idle[0][2] >= self._idle_timeout:
+            reader, writer, released = idle.popleft()
+            writer.close()
+
+    def _expire(self, loop):
+        self._expire_handle = None
+        now = loop.time()
+        oldest = None
+        for key, idle in list(self._idle.items()):
+            self._expire_idle(idle, now)
+            if not idle:
+                del self._idle[key]
+            elif oldest is None or idle[0][2] < oldest:
+                oldest = idle[0][2]
+        if oldest is not None:
+            self._expire_handle = loop.call_at(oldest + self._idle_timeout,
+                                               self._expire, loop)
+
+
+class _PoolConnection:
+
+    def __init__(self, pool, host, port):
+        self._pool = pool
+        self._host = host
+        self._port = port
+        self._writer = None
+
+    async def __aenter__(self):
+        reader, self._writer = await self._pool.acquire(self._host,
+                                                        self._port)
+        return reader, self._writer
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._pool.release(self._writer, discard=exc_type is not None)
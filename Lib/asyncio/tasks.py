@@ -1,7 +1,7 @@
 """Support for tasks, coroutines and the scheduler."""
 
 __all__ = (
-    'Task', 'create_task',
+    'Task', 'create_task', 'TaskGroup',
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
     'wait', 'wait_for', 'as_completed', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
@@ -384,6 +384,199 @@ def create_task(coro, *, name=None):
     return task
 
 
+class TaskGroup:
+    """Asynchronous context manager for managing a group of tasks.
+
+    Example use:
+
+        async with asyncio.TaskGroup() as group:
+            task1 = group.create_task(some_coroutine(...))
+            task2 = group.create_task(other_coroutine(...))
+        print("Both tasks have completed now.")
+
+    All tasks are awaited when the context manager exits.
+
+    Any time a task belonging to the group fails with an exception
+    other than CancelledError, all remaining tasks in the group are
+    cancelled.  Once every task has finished, the collected exceptions
+    are raised as a single TaskGroupError.  KeyboardInterrupt and
+    SystemExit are re-raised as they are.
+    """
+
+    def __init__(self, *, name=None):
+        self._name = name
+        self._entered = False
+        self._exiting = False
+        self._aborting = False
+        self._loop = None
+        self._parent_task = None
+        self._parent_cancel_requested = False
+        self._tasks = set()
+        self._errors = []
+        self._base_error = None
+        self._on_completed_fut = None
+
+    def __repr__(self):
+        info = ['']
+        if self._name is not None:
+            info.append(f'name={self._name!r}')
+        if self._tasks:
+            info.append(f'tasks={len(self._tasks)}')
+        if self._errors:
+            info.append(f'errors={len(self._errors)}')
+        if self._aborting:
+            info.append('cancelling')
+        elif self._entered:
+            info.append('entered')
+        info_str = ' '.join(info)
+        return f'<TaskGroup{info_str}>'
+
+    async def __aenter__(self):
+        if self._entered:
+            raise RuntimeError(
+                f"TaskGroup {self!r} has been already entered")
+        self._entered = True
+
+        if self._loop is None:
+            self._loop = events.get_running_loop()
+
+        self._parent_task = current_task(self._loop)
+        if self._parent_task is None:
+            raise RuntimeError(
+                f'TaskGroup {self!r} cannot determine the parent task')
+
+        return self
+
+    async def __aexit__(self, et, exc, tb):
+        self._exiting = True
+        propagate_cancellation_error = None
+
+        if (exc is not None and self._is_base_error(exc) and
+                self._base_error is None):
+            self._base_error = exc
+
+        if et is exceptions.CancelledError:
+            if not self._parent_cancel_requested:
+                # The parent task was cancelled from the outside, the
+                # cancellation has to be propagated once all tasks
+                # of the group are done.
+                propagate_cancellation_error = exc
+
+        if et is not None and not self._aborting:
+            # The body of the "async with" block failed or was
+            # cancelled: cancel the whole group.
+            self._abort()
+
+        # A while-loop is needed because "self._on_completed_fut" can be
+        # cancelled several times if the parent task is being cancelled
+        # repeatedly.
+        while self._tasks:
+            if self._on_completed_fut is None:
+                self._on_completed_fut = self._loop.create_future()
+
+            try:
+                await self._on_completed_fut
+            except exceptions.CancelledError as ex:
+                # The group never cancels its parent task while
+                # exiting, so this cancellation came from the outside.
+                propagate_cancellation_error = ex
+                if not self._aborting:
+                    self._abort()
+
+            self._on_completed_fut = None
+
+        assert not self._tasks
+
+        if self._base_error is not None:
+            raise self._base_error
+
+        if propagate_cancellation_error is not None and not self._errors:
+            raise propagate_cancellation_error
+
+        if et is not None and et is not exceptions.CancelledError:
+            self._errors.append(exc)
+
+        if self._errors:
+            errors = self._errors
+            # Break the reference cycles between the group, its errors
+            # and their tracebacks.
+            self._errors = None
+            raise exceptions.TaskGroupError(
+                'unhandled errors in a TaskGroup', errors)
+
+    def create_task(self, coro, *, name=None):
+        """Create a new task in this group and return it.
+
+        The task is cancelled together with the rest of the group.
+        """
+        if not self._entered:
+            raise RuntimeError(f"TaskGroup {self!r} has not been entered")
+        if self._exiting and not self._tasks:
+            raise RuntimeError(f"TaskGroup {self!r} is finished")
+        if self._aborting:
+            # Close the coroutine to avoid a "never awaited" warning.
+            coro.close()
+            raise RuntimeError(f"TaskGroup {self!r} is shutting down")
+        task = self._loop.create_task(coro)
+        _set_task_name(task, name)
+        # The same bound method is used for every task of the group, so
+        # spawning a task does not allocate a new callback object.
+        task.add_done_callback(self._on_task_done)
+        self._tasks.add(task)
+        return task
+
+    def _is_base_error(self, exc):
+        assert isinstance(exc, BaseException)
+        return isinstance(exc, (SystemExit, KeyboardInterrupt))
+
+    def _abort(self):
+        self._aborting = True
+        # Cancel every pending task in a single pass.  The done callbacks
+        # run later, so iterating over self._tasks here is safe.
+        for t in self._tasks:
+            if not t.done():
+                t.cancel()
+
+    def _on_task_done(self, task):
+        self._tasks.discard(task)
+
+        if self._on_completed_fut is not None and not self._tasks:
+            if not self._on_completed_fut.done():
+                self._on_completed_fut.set_result(True)
+
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is None:
+            return
+
+        self._errors.append(exc)
+        if self._is_base_error(exc) and self._base_error is None:
+            self._base_error = exc
+
+        if self._parent_task.done():
+            # Not sure if this case is possible, but we want to handle
+            # it anyways.
+            self._loop.call_exception_handler({
+                'message': f'Task {task!r} has errored out but its parent '
+                           f'task {self._parent_task} is already completed',
+                'exception': exc,
+                'task': task,
+            })
+            return
+
+        if not self._aborting:
+            self._abort()
+            if not self._exiting:
+                # The parent task is still running the body of the
+                # "async with" block: interrupt it so that __aexit__()
+                # is reached quickly.  The resulting CancelledError is
+                # swallowed by __aexit__().
+                self._parent_cancel_requested = True
+                self._parent_task.cancel()
+
+
 # wait() and as_completed() similar to those in PEP 3148.
 
 FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
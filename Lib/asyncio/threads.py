@@ -0,0 +1,32 @@
+"""High-level support for working with threads in asyncio"""
+
+import functools
+import contextvars
+
+from . import base_events
+from . import events
+
+
+__all__ = "to_thread",
+
+
+async def to_thread(func, /, *args, **kwargs):
+    """Asynchronously run function *func* in a separate thread.
+
+    Any *args and **kwargs supplied for this function are directly passed
+    to *func*. Also, the current :class:`contextvars.Context` is propagated,
+    allowing context variables from the main thread to be accessed in the
+    separate thread.
+
+    The function runs in the default executor of the running loop, so it
+    is subject to the limits set with loop.set_default_executor_limits():
+    when the queue of the executor is full, wait until it has room.
+
+    Return a coroutine that can be awaited to get the eventual result of *func*.
+    """
+    loop = events.get_running_loop()
+    if isinstance(loop, base_events.BaseEventLoop):
+        await loop._wait_default_executor_slot()
+    ctx = contextvars.copy_context()
+    func_call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(None, func_call)
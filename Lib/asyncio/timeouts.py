@@ -0,0 +1,159 @@
+"""Timeouts as asynchronous context managers."""
+
+__all__ = ('Timeout', 'timeout', 'timeout_at')
+
+import enum
+
+from . import events
+from . import exceptions
+from . import tasks
+
+
+class _State(enum.Enum):
+    CREATED = 'created'
+    ENTERED = 'active'
+    EXPIRING = 'expiring'
+    EXPIRED = 'expired'
+    EXITED = 'finished'
+
+
+class Timeout:
+    """Asynchronous context manager limiting the time spent in its body.
+
+    When the deadline is reached, the current task is cancelled in
+    place, and the resulting CancelledError is turned into TimeoutError
+    when it propagates out of the block.  No task is created: the only
+    resource used is a single TimerHandle.
+
+    Use timeout() or timeout_at() rather than instantiating this class
+    directly.
+    """
+
+    def __init__(self, when):
+        self._state = _State.CREATED
+        self._timeout_handler = None
+        self._task = None
+        self._when = when
+
+    def when(self):
+        """Return the deadline, or None if it is not set."""
+        return self._when
+
+    def reschedule(self, when):
+        """Change the deadline to *when*, or remove it if *when* is None.
+
+        The deadline is an absolute time, in the loop.time() reference.
+        """
+        if self._state is not _State.ENTERED:
+            raise RuntimeError(
+                f'Cannot change state of {self._state.value} Timeout')
+
+        self._when = when
+
+        if self._timeout_handler is not None:
+            self._timeout_handler.cancel()
+
+        if when is None:
+            self._timeout_handler = None
+        else:
+            loop = events.get_running_loop()
+            if when <= loop.time():
+                self._timeout_handler = loop.call_soon(self._on_timeout)
+            else:
+                self._timeout_handler = loop.call_at(when, self._on_timeout)
+
+    def expired(self):
+        """Return True if the deadline was reached."""
+        return self._state in (_State.EXPIRING, _State.EXPIRED)
+
+    def __repr__(self):
+        info = ['']
+        if self._state is _State.ENTERED:
+            when = round(self._when, 3) if self._when is not None else None
+            info.append(f'when={when}')
+        info_str = ' '.join(info)
+        return f'<Timeout [{self._state.value}]{info_str}>'
+
+    async def __aenter__(self):
+        if self._state is not _State.CREATED:
+            raise RuntimeError('Timeout has already been entered')
+        task = tasks.current_task()
+        if task is None:
+            raise RuntimeError('Timeout should be used inside a task')
+        self._state = _State.ENTERED
+        self._task = task
+        self.reschedule(self._when)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._timeout_handler is not None:
+            self._timeout_handler.cancel()
+            self._timeout_handler = None
+
+        if self._state is _State.EXPIRING:
+            self._state = _State.EXPIRED
+            if self._task._must_cancel:
+                # The block finished before the cancellation requested at
+                # the deadline was delivered: withdraw it, otherwise it
+                # would cancel the code following the block.
+                self._task._must_cancel = False
+            elif exc_type is exceptions.CancelledError:
+                # Without Task.uncancel(), a cancellation requested by
+                # someone else after the deadline expired can't be told
+                # apart from ours, so it becomes a TimeoutError too.
+                raise exceptions.TimeoutError from exc_val
+        elif self._state is _State.ENTERED:
+            self._state = _State.EXITED
+
+        return None
+
+    def _on_timeout(self):
+        assert self._state is _State.ENTERED
+        # The handle has fired, there is no need to cancel it.
+        self._timeout_handler = None
+        task = self._task
+        waiter = task._fut_waiter
+        if task._must_cancel or (waiter is not None and waiter.cancelled()):
+            # The task is already being cancelled by someone else: let that
+            # CancelledError propagate rather than report a timeout.
+            return
+        task.cancel()
+        self._state = _State.EXPIRING
+
+
+def timeout(delay):
+    """Timeout async context manager.
+
+    Useful in cases when you want to apply timeout logic around a block
+    of code or in cases when asyncio.wait_for is not suitable.  For
+    example:
+
+    >>> async with asyncio.timeout(10):  # 10 seconds timeout
+    ...     await long_running_task()
+
+    delay - value in seconds or None to disable timeout logic
+
+    long_running_task() is interrupted by raising CancelledError in the
+    current task, and the context manager converts CancelledError into
+    TimeoutError.
+    """
+    loop = events.get_running_loop()
+    return Timeout(loop.time() + delay if delay is not None else None)
+
+
+def timeout_at(when):
+    """Schedule the timeout at absolute time.
+
+    Like timeout() but argument gives absolute time in the same clock
+    system as loop.time().
+
+    Please note: it is not POSIX time but a time with undefined starting
+    base, e.g. the time of the system power on.
+
+    >>> async with asyncio.timeout_at(loop.time() + 10):
+    ...     await long_running_task()
+
+    when - a deadline when timeout occurs or None to disable timeout
+    logic
+    """
+    return Timeout(when)
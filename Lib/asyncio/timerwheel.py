@@ -0,0 +1,227 @@
+"""Hierarchical timer wheel.
+
+This is an alternative to the binary heap used by BaseEventLoop to keep
+track of the TimerHandle objects created by call_at() and call_later(),
+see BaseEventLoop.set_timer_wheel().
+
+Time is divided into ticks of a fixed resolution.  The wheel has
+_LEVELS levels of _SLOTS slots each: a slot of level 0 holds the
+handles of a single tick, a slot of level 1 holds _SLOTS ticks, and
+so on.  A handle is stored on the lowest level where its tick shares
+all the upper bits with the current tick, so scheduling and
+cancelling a handle are O(1).  When the current tick enters a slot of
+an upper level, the handles of that slot are moved ("cascaded") to
+the lower levels.
+
+The wheel never makes a handle due before its deadline: the handles
+of the last, partially elapsed, tick are compared with the end time
+one by one.
+"""
+
+import math
+
+
+_LEVEL_BITS = 6
+_SLOTS = 1 << _LEVEL_BITS
+_SLOT_MASK = _SLOTS - 1
+
+# 64 ** 6 ticks is more than two years with a resolution of 1 ms.
+# Handles scheduled further away wait in an overflow bucket.
+_LEVELS = 6
+_TOP_SHIFT = _LEVELS * _LEVEL_BITS
+
+
+def _when_key(handle):
+    return handle._when
+
+
+class TimerWheel:
+    """Hierarchical timer wheel holding TimerHandle objects.
+
+    *resolution* is the duration of a tick in seconds and *now* the
+    current time of the event loop.
+    """
+
+    def __init__(self, resolution, now):
+        self._resolution = resolution
+        self._levels = [[{} for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        # Per level, a bit mask of the slots which may be non-empty.
+        # Bits are cleared lazily by _next_event().
+        self._occupied = [0] * _LEVELS
+        self._overflow = {}
+        self._count = 0
+        self._tick = self._to_tick(now)
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} resolution={self._resolution} '
+                f'timers={self._count}>')
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for level in self._levels:
+            for bucket in level:
+                yield from bucket.values()
+        yield from self._overflow.values()
+
+    def _to_tick(self, when):
+        return int(when // self._resolution)
+
+    def _insert(self, handle, tick):
+        diff = tick ^ self._tick
+        level = (diff.bit_length() - 1) // _LEVEL_BITS if diff else 0
+        if level >= _LEVELS:
+            bucket = self._overflow
+        else:
+            slot = (tick >> (level * _LEVEL_BITS)) & _SLOT_MASK
+            bucket = self._levels[level][slot]
+            self._occupied[level] |= 1 << slot
+        bucket[id(handle)] = handle
+        handle._wheel_bucket = bucket
+
+    def _reinsert(self, handles):
+        for handle in handles:
+            when = handle._when
+            if math.isfinite(when):
+                self._insert(handle, max(self._to_tick(when), self._tick))
+            elif when > 0:
+                self._overflow[id(handle)] = handle
+                handle._wheel_bucket = self._overflow
+            else:
+                # -inf or NaN: due as soon as possible, like with heapq.
+                self._insert(handle, self._tick)
+
+    def add(self, handle):
+        """Schedule a TimerHandle."""
+        self._count += 1
+        try:
+            tick = int(handle._when // self._resolution)
+        except (OverflowError, ValueError):
+            # Infinite or NaN deadline
+            self._reinsert((handle,))
+            return
+        # Inlined _insert()
+        current = self._tick
+        if tick < current:
+            tick = current
+        diff = tick ^ current
+        level = (diff.bit_length() - 1) // _LEVEL_BITS if diff else 0
+        if level >= _LEVELS:
+            bucket = self._overflow
+        else:
+            slot = (tick >> (level * _LEVEL_BITS)) & _SLOT_MASK
+            bucket = self._levels[level][slot]
+            self._occupied[level] |= 1 << slot
+        bucket[id(handle)] = handle
+        handle._wheel_bucket = bucket
+
+    def remove(self, handle):
+        """Unschedule a TimerHandle previously passed to add()."""
+        bucket = handle._wheel_bucket
+        if bucket is not None:
+            del bucket[id(handle)]
+            handle._wheel_bucket = None
+            self._count -= 1
+
+    def clear(self):
+        for handle in self:
+            handle._wheel_bucket = None
+        for level in self._levels:
+            for bucket in level:
+                bucket.clear()
+        self._occupied = [0] * _LEVELS
+        self._overflow.clear()
+        self._count = 0
+
+    def _next_event(self):
+        """Return (tick, level) of the next slot to process, or None.
+
+        On level 0 the slot holds handles which become due during the
+        tick, on the upper levels the slot must be cascaded when the
+        tick is reached.
+        """
+        tick = self._tick
+        for level in range(_LEVELS):
+            mask = self._occupied[level]
+            if not mask:
+                continue
+            shift = level * _LEVEL_BITS
+            slots = self._levels[level]
+            current = (tick >> shift) & _SLOT_MASK
+            pending = mask >> current
+            while pending:
+                slot = current + (pending & -pending).bit_length() - 1
+                if slots[slot]:
+                    self._occupied[level] = mask
+                    base = tick >> (shift + _LEVEL_BITS) << _LEVEL_BITS
+                    return max((base | slot) << shift, tick), level
+                mask &= ~(1 << slot)
+                pending = mask >> current
+            self._occupied[level] = mask
+        if self._overflow:
+            return ((tick >> _TOP_SHIFT) + 1) << _TOP_SHIFT, _LEVELS
+        return None
+
+    def _cascade(self):
+        tick = self._tick
+        if self._overflow and not tick & ((1 << _TOP_SHIFT) - 1):
+            handles = list(self._overflow.values())
+            self._overflow.clear()
+            self._reinsert(handles)
+        for level in range(_LEVELS - 1, 0, -1):
+            slot = (tick >> (level * _LEVEL_BITS)) & _SLOT_MASK
+            bucket = self._levels[level][slot]
+            if bucket:
+                handles = list(bucket.values())
+                bucket.clear()
+                self._occupied[level] &= ~(1 << slot)
+                self._reinsert(handles)
+
+    def next_deadline(self):
+        """Return the time of the next wakeup, or None if the wheel is empty.
+
+        The result is never later than the deadline of the earliest
+        handle.
+        """
+        event = self._next_event()
+        if event is None:
+            return None
+        tick, level = event
+        if level == 0:
+            bucket = self._levels[0][tick & _SLOT_MASK]
+            return min(handle._when for handle in bucket.values())
+        return tick * self._resolution
+
+    def pop_due(self, end_time):
+        """Remove and return the handles due before *end_time*.
+
+        The handles are returned sorted by deadline.
+        """
+        # Handles scheduled in the past sit in the slot of the current
+        # tick, which is examined handle by handle.
+        end_tick = max(self._to_tick(end_time), self._tick)
+        due = []
+        while self._count:
+            event = self._next_event()
+            if event is None or event[0] > end_tick:
+                break
+            self._tick = tick = event[0]
+            self._cascade()
+            bucket = self._levels[0][tick & _SLOT_MASK]
+            if tick < end_tick:
+                due.extend(bucket.values())
+                bucket.clear()
+            else:
+                for key, handle in list(bucket.items()):
+                    if handle._when < end_time:
+                        due.append(handle)
+                        del bucket[key]
+                break
+        if end_tick > self._tick:
+            self._tick = end_tick
+        for handle in due:
+            handle._wheel_bucket = None
+        self._count -= len(due)
+        due.sort(key=_when_key)
+        return due
@@ -1,9 +1,12 @@
-"""Selector event loop for Unix with signal handling."""
+"""Selector and proactor event loops for Unix with signal handling."""
 
+import collections
 import errno
+import functools
 import io
 import itertools
 import os
+import select
 import selectors
 import signal
 import socket
@@ -11,6 +14,7 @@ import stat
 import subprocess
 import sys
 import threading
+import time
 import warnings
 
 from . import base_events
@@ -20,18 +24,25 @@ from . import coroutines
 from . import events
 from . import exceptions
 from . import futures
+from . import proactor_events
 from . import selector_events
 from . import tasks
 from . import transports
 from .log import logger
 
+try:
+    import _uring
+except ImportError:  # pragma: no cover
+    _uring = None
+
 
 __all__ = (
-    'SelectorEventLoop',
+    'SelectorEventLoop', 'ProactorEventLoop',
+    'SelectorProactor', 'UringProactor',
     'AbstractChildWatcher', 'SafeChildWatcher',
     'FastChildWatcher',
     'MultiLoopChildWatcher', 'ThreadedChildWatcher',
-    'DefaultEventLoopPolicy',
+    'DefaultEventLoopPolicy', 'ProactorEventLoopPolicy',
 )
 
 
@@ -44,16 +55,13 @@ def _sighandler_noop(signum, frame):
     pass
 
 
-class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
-    """Unix event loop.
+class _UnixEventLoopMixin:
+    """Signal handling, subprocesses and UNIX Domain Socket support.
 
-    Adds signal handling and UNIX Domain Socket support to SelectorEventLoop.
+    Shared by the selector and the proactor event loops of Unix, which
+    must create the _signal_handlers dict and the self-pipe.
     """
 
-    def __init__(self, selector=None):
-        super().__init__(selector)
-        self._signal_handlers = {}
-
     def close(self):
         super().close()
         if not sys.is_finalizing():
@@ -174,14 +182,6 @@ class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
         if sig not in signal.valid_signals():
             raise ValueError(f'invalid signal number {sig}')
 
-    def _make_read_pipe_transport(self, pipe, protocol, waiter=None,
-                                  extra=None):
-        return _UnixReadPipeTransport(self, pipe, protocol, waiter, extra)
-
-    def _make_write_pipe_transport(self, pipe, protocol, waiter=None,
-                                   extra=None):
-        return _UnixWritePipeTransport(self, pipe, protocol, waiter, extra)
-
     async def _make_subprocess_transport(self, protocol, args, shell,
                                          stdin, stdout, stderr, bufsize,
                                          extra=None, **kwargs):
@@ -327,6 +327,26 @@ class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
 
         return server
 
+
+class _UnixSelectorEventLoop(_UnixEventLoopMixin,
+                             selector_events.BaseSelectorEventLoop):
+    """Unix event loop.
+
+    Adds signal handling and UNIX Domain Socket support to SelectorEventLoop.
+    """
+
+    def __init__(self, selector=None):
+        super().__init__(selector)
+        self._signal_handlers = {}
+
+    def _make_read_pipe_transport(self, pipe, protocol, waiter=None,
+                                  extra=None):
+        return _UnixReadPipeTransport(self, pipe, protocol, waiter, extra)
+
+    def _make_write_pipe_transport(self, pipe, protocol, waiter=None,
+                                   extra=None):
+        return _UnixWritePipeTransport(self, pipe, protocol, waiter, extra)
+
     async def _sock_sendfile_native(self, sock, file, offset, count):
         try:
             os.sendfile
@@ -799,6 +819,573 @@ class _UnixSubprocessTransport(base_subprocess.BaseSubprocessTransport):
                 stdin_w.close()
 
 
+# Marks a completion callback which resubmitted its operation
+_RESUBMITTED = object()
+
+
+class _ProactorFuture(futures.Future):
+    """Future of an operation of a Unix proactor.
+
+    Cancelling the future cancels the operation.
+    """
+
+    def __init__(self, proactor, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._proactor = proactor
+        # Identifies the pending operation in the proactor
+        self._key = None
+
+    def cancel(self):
+        if not self.done() and self._proactor is not None:
+            self._proactor._cancel(self)
+            self._proactor = None
+        return super().cancel()
+
+    def set_exception(self, exception):
+        super().set_exception(exception)
+        self._proactor = None
+
+    def set_result(self, result):
+        super().set_result(result)
+        self._proactor = None
+
+
+class _BaseUnixProactor:
+    """Base class of the proactors of Unix.
+
+    Subclasses implement the operations on buffers and _wait(), used
+    by the other operations.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._results = []
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if not self._results:
+            self._poll(timeout)
+        tmp = self._results
+        self._results = []
+        return tmp
+
+    def _future(self):
+        return _ProactorFuture(self, loop=self._loop)
+
+    def _result(self, value):
+        fut = self._loop.create_future()
+        fut.set_result(value)
+        return fut
+
+    def _wait(self, conn, write, func, fut=None):
+        """Call func() when conn is readable, or writable if write is true.
+
+        The result of func() is the result of the returned future.  If
+        func() raises BlockingIOError, it is called again on the next
+        readiness of conn.
+        """
+        raise NotImplementedError
+
+    def _wait_readable(self, conn):
+        return self._wait(conn, False, lambda: None)
+
+    def connect(self, conn, address):
+        try:
+            conn.connect(address)
+        except (BlockingIOError, InterruptedError):
+            pass
+        else:
+            return self._result(None)
+
+        def finish_connect():
+            err = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err != 0:
+                raise OSError(err, f'Connect call failed {address}')
+
+        return self._wait(conn, True, finish_connect)
+
+    def sendfile(self, sock, file, offset, count):
+        fileno = file.fileno()
+        total = count
+
+        def send():
+            nonlocal offset, count
+            while count:
+                sent = os.sendfile(sock.fileno(), fileno, offset, count)
+                if not sent:
+                    # EOF
+                    break
+                offset += sent
+                count -= sent
+            return total - count
+
+        return self._wait(sock, True, send)
+
+    def recvfrom(self, conn, nbytes, flags=0):
+        return self._wait(conn, False,
+                          functools.partial(conn.recvfrom, nbytes, flags))
+
+    def sendto(self, conn, buf, flags=0, addr=None):
+        if addr is None:
+            func = functools.partial(conn.send, buf, flags)
+        else:
+            func = functools.partial(conn.sendto, buf, flags, addr)
+        return self._wait(conn, True, func)
+
+    def _stop_serving(self, obj):
+        # obj is a listening socket, closed by
+        # BaseProactorEventLoop._stop_serving() once its pending accept()
+        # is cancelled.
+        pass
+
+
+class SelectorProactor(_BaseUnixProactor):
+    """Proactor emulating completion-based I/O with a selector.
+
+    An operation is attempted at once and, if it would block, retried
+    when the selector reports the file descriptor as ready.  This is the
+    fallback of UringProactor where io_uring is not available.
+    """
+
+    _READ = 0
+    _WRITE = 1
+
+    def __init__(self, selector=None):
+        super().__init__()
+        if selector is None:
+            selector = selectors.DefaultSelector()
+        logger.debug('Using selector: %s', selector.__class__.__name__)
+        self._selector = selector
+        # file descriptor => (read operations, write operations), where
+        # an operation is a (future, function) tuple
+        self._operations = {}
+
+    def __repr__(self):
+        info = ['fd#=%s' % len(self._operations),
+                'result#=%s' % len(self._results)]
+        if self._selector is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def _check_closed(self):
+        if self._selector is None:
+            raise RuntimeError('SelectorProactor is closed')
+
+    def _run(self, fut, func):
+        """Run an operation, return False if it would block."""
+        try:
+            result = func()
+        except (BlockingIOError, InterruptedError):
+            return False
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+        return True
+
+    def _update(self, fd):
+        readers, writers = self._operations[fd]
+        events = ((selectors.EVENT_READ if readers else 0) |
+                  (selectors.EVENT_WRITE if writers else 0))
+        try:
+            key = self._selector.get_key(fd)
+        except KeyError:
+            key = None
+        if not events:
+            del self._operations[fd]
+            if key is not None:
+                self._selector.unregister(fd)
+        elif key is None:
+            self._selector.register(fd, events)
+        elif key.events != events:
+            self._selector.modify(fd, events)
+
+    def _register(self, conn, direction, func, *, wait=False):
+        self._check_closed()
+        fd = conn.fileno()
+        fut = self._future()
+        operations = self._operations.get(fd)
+        if not wait and (operations is None or not operations[direction]):
+            # Operations on a file descriptor complete in order
+            if self._run(fut, func):
+                return fut
+        if operations is None:
+            operations = (collections.deque(), collections.deque())
+            self._operations[fd] = operations
+        operations[direction].append((fut, func))
+        fut._key = fd, direction
+        self._update(fd)
+        return fut
+
+    def _wait(self, conn, write, func, fut=None):
+        return self._register(conn, self._WRITE if write else self._READ,
+                              func, wait=True)
+
+    def _cancel(self, fut):
+        fd, direction = fut._key
+        operations = self._operations.get(fd)
+        if operations is None:
+            return
+        queue = operations[direction]
+        for op in queue:
+            if op[0] is fut:
+                queue.remove(op)
+                break
+        self._update(fd)
+
+    def _process(self, queue):
+        while queue:
+            fut, func = queue[0]
+            if not self._run(fut, func):
+                break
+            queue.popleft()
+            self._results.append(fut)
+
+    def _poll(self, timeout=None):
+        for key, events in self._selector.select(timeout):
+            operations = self._operations.get(key.fd)
+            if operations is None:
+                continue
+            if events & selectors.EVENT_READ:
+                self._process(operations[self._READ])
+            if events & selectors.EVENT_WRITE:
+                self._process(operations[self._WRITE])
+            self._update(key.fd)
+
+    def recv(self, conn, nbytes, flags=0):
+        if isinstance(conn, socket.socket):
+            func = functools.partial(conn.recv, nbytes, flags)
+        else:
+            func = functools.partial(os.read, conn.fileno(), nbytes)
+        return self._register(conn, self._READ, func)
+
+    def recv_into(self, conn, buf, flags=0):
+        if isinstance(conn, socket.socket):
+            func = functools.partial(conn.recv_into, buf, 0, flags)
+        else:
+            func = functools.partial(os.readv, conn.fileno(), [buf])
+        return self._register(conn, self._READ, func)
+
+    def send(self, conn, buf, flags=0):
+        view = memoryview(buf).cast('B')
+        total = len(view)
+        if isinstance(conn, socket.socket):
+            def write(view):
+                return conn.send(view, flags)
+        else:
+            write = functools.partial(os.write, conn.fileno())
+
+        def send():
+            nonlocal view
+            while view:
+                view = view[write(view):]
+            return total
+
+        return self._register(conn, self._WRITE, send)
+
+    def accept(self, listener):
+        def accept():
+            conn, addr = listener.accept()
+            conn.setblocking(False)
+            return conn, addr
+
+        return self._register(listener, self._READ, accept)
+
+    def close(self):
+        if self._selector is None:
+            # already closed
+            return
+        for readers, writers in list(self._operations.values()):
+            for fut, func in list(readers) + list(writers):
+                fut.cancel()
+        self._operations.clear()
+        self._results = []
+        self._selector.close()
+        self._selector = None
+
+
+class UringProactor(_BaseUnixProactor):
+    """Proactor implementation using io_uring.
+
+    Operations are queued in the submission queue of the ring and handed
+    to the kernel in a single system call per event loop iteration, which
+    also waits for their completions.  OSError is raised if io_uring is
+    not available.
+    """
+
+    def __init__(self, entries=256):
+        super().__init__()
+        if _uring is None:
+            raise OSError(errno.ENOSYS, 'io_uring is not available')
+        self._ring = _uring.Ring(entries)
+        # key => (future, object, callback, cleanup, prepare, args)
+        self._cache = {}
+        self._keys = itertools.count(1)
+
+    def __repr__(self):
+        info = ['operation#=%s' % len(self._cache),
+                'result#=%s' % len(self._results)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def _check_closed(self):
+        if self._ring is None:
+            raise RuntimeError('UringProactor is closed')
+
+    def _register(self, fut, obj, callback, prepare, *args, cleanup=None):
+        """Queue an operation with prepare(key, *args).
+
+        callback(result) is called on completion; cleanup(result) is
+        called instead if the future was cancelled but the operation
+        succeeded.
+        """
+        self._check_closed()
+        key = next(self._keys)
+        prepare(key, *args)
+        fut._key = key
+        # we only store obj to prevent it from being garbage
+        # collected too early.
+        self._cache[key] = (fut, obj, callback, cleanup, prepare, args)
+        return fut
+
+    def _cancel(self, fut):
+        if self._ring is not None and fut._key in self._cache:
+            if self._ring.cancel(fut._key):
+                # The operation had not been submitted
+                del self._cache[fut._key]
+
+    def _poll(self, timeout=None):
+        for key, res in self._ring.submit_and_wait(timeout):
+            try:
+                fut, obj, callback, cleanup, prepare, args = \
+                    self._cache.pop(key)
+            except KeyError:
+                continue
+            if fut.done():
+                if res >= 0 and cleanup is not None:
+                    cleanup(res)
+                continue
+            if res == -errno.EINTR:
+                # Interrupted by a signal (seen on terminals): retry the
+                # operation as the system calls do since PEP 475
+                self._register(fut, obj, callback, prepare, *args,
+                               cleanup=cleanup)
+                continue
+            try:
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+                value = callback(res)
+            except OSError as exc:
+                fut.set_exception(exc)
+                self._results.append(fut)
+            else:
+                if value is not _RESUBMITTED:
+                    fut.set_result(value)
+                    self._results.append(fut)
+
+    def _wait(self, conn, write, func, fut=None):
+        if fut is None:
+            fut = self._future()
+
+        def finish_poll(res):
+            try:
+                return func()
+            except (BlockingIOError, InterruptedError):
+                self._wait(conn, write, func, fut)
+                return _RESUBMITTED
+
+        events = select.POLLOUT if write else select.POLLIN
+        return self._register(fut, conn, finish_poll,
+                              self._ring.poll, conn.fileno(), events)
+
+    def recv(self, conn, nbytes, flags=0):
+        buf = bytearray(nbytes)
+
+        def finish_recv(res):
+            del buf[res:]
+            return bytes(buf)
+
+        if isinstance(conn, socket.socket):
+            return self._register(self._future(), conn, finish_recv,
+                                  self._ring.recv, conn.fileno(), buf, flags)
+        return self._register(self._future(), conn, finish_recv,
+                              self._ring.read, conn.fileno(), buf)
+
+    def recv_into(self, conn, buf, flags=0):
+        def finish_recv(res):
+            return res
+
+        if isinstance(conn, socket.socket):
+            return self._register(self._future(), conn, finish_recv,
+                                  self._ring.recv, conn.fileno(), buf, flags)
+        return self._register(self._future(), conn, finish_recv,
+                              self._ring.read, conn.fileno(), buf)
+
+    def send(self, conn, buf, flags=0):
+        view = memoryview(buf).cast('B')
+        total = len(view)
+        if not total:
+            return self._result(0)
+        fut = self._future()
+        if isinstance(conn, socket.socket):
+            prepare, args = self._ring.send, (flags,)
+        else:
+            prepare, args = self._ring.write, ()
+
+        def start_send(view):
+            def finish_send(res):
+                if res < len(view):
+                    # Partial write: send the rest with the same future
+                    start_send(view[res:])
+                    return _RESUBMITTED
+                return total
+
+            self._register(fut, conn, finish_send,
+                           prepare, conn.fileno(), view, *args)
+
+        start_send(view)
+        return fut
+
+    def accept(self, listener):
+        def finish_accept(res):
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=res)
+            conn.setblocking(False)
+            try:
+                addr = conn.getpeername()
+            except OSError:
+                # The peer already disconnected
+                addr = None
+            return conn, addr
+
+        return self._register(self._future(), listener, finish_accept,
+                              self._ring.accept, listener.fileno(),
+                              cleanup=os.close)
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+
+        # Cancel remaining registered operations.
+        for fut, *_ in list(self._cache.values()):
+            if not fut.done():
+                fut.cancel()
+
+        # Wait until all cancelled operations complete: the kernel may
+        # still be using their buffers.  Display progress every second if
+        # the loop is still running.
+        msg_update = 1.0
+        start_time = time.monotonic()
+        next_msg = start_time + msg_update
+        while self._cache:
+            if next_msg <= time.monotonic():
+                logger.debug('%r is running after closing for %.1f seconds',
+                             self, time.monotonic() - start_time)
+                next_msg = time.monotonic() + msg_update
+
+            # handle a few events, or timeout
+            self._poll(msg_update)
+
+        self._results = []
+        self._ring.close()
+        self._ring = None
+
+
+class _UnixProactorWritePipeTransport(
+        proactor_events._ProactorBaseWritePipeTransport):
+    """Write pipe transport of the proactor event loop.
+
+    The write end of a pipe cannot be read: the closing of the other end
+    is detected when the pipe is reported as readable (POLLERR/POLLHUP).
+    Character devices are readable on their own, so like
+    _UnixWritePipeTransport only pipes and sockets are watched.
+    """
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        mode = os.fstat(self._sock.fileno()).st_mode
+        if (stat.S_ISSOCK(mode) or
+                (stat.S_ISFIFO(mode) and not sys.platform.startswith("aix"))):
+            self._read_fut = self._loop._proactor._wait_readable(self._sock)
+            self._read_fut.add_done_callback(self._pipe_closed)
+
+    def _pipe_closed(self, fut):
+        if fut.cancelled():
+            # the transport has been closed
+            return
+        if self._closing:
+            assert self._read_fut is None
+            return
+        assert fut is self._read_fut, (fut, self._read_fut)
+        self._read_fut = None
+        if self._write_fut is not None:
+            self._force_close(BrokenPipeError())
+        else:
+            self.close()
+
+
+class _UnixProactorEventLoop(_UnixEventLoopMixin,
+                             proactor_events.BaseProactorEventLoop):
+    """Unix event loop using a proactor.
+
+    The proactor defaults to UringProactor, or to SelectorProactor where
+    io_uring is not available.  add_reader() and add_writer() are not
+    supported.
+    """
+
+    def __init__(self, proactor=None):
+        if proactor is None:
+            try:
+                proactor = UringProactor()
+            except OSError:
+                proactor = SelectorProactor()
+        super().__init__(proactor)
+        self._signal_handlers = {}
+
+    def run_forever(self):
+        try:
+            assert self._self_reading_future is None
+            self.call_soon(self._loop_self_reading)
+            super().run_forever()
+        finally:
+            if self._self_reading_future is not None:
+                self._self_reading_future.cancel()
+                self._self_reading_future = None
+
+    def _loop_self_reading(self, f=None):
+        if (f is not None and f.done() and not f.cancelled() and
+                f.exception() is None):
+            # Signal numbers written by the wakeup file descriptor
+            self._process_self_data(f.result())
+        super()._loop_self_reading(f)
+
+    def _make_read_pipe_transport(self, pipe, protocol, waiter=None,
+                                  extra=None):
+        os.set_blocking(pipe.fileno(), False)
+        return super()._make_read_pipe_transport(pipe, protocol, waiter,
+                                                 extra)
+
+    def _make_write_pipe_transport(self, pipe, protocol, waiter=None,
+                                   extra=None):
+        os.set_blocking(pipe.fileno(), False)
+        return _UnixProactorWritePipeTransport(self, pipe, protocol,
+                                               waiter, extra)
+
+    async def _sock_sendfile_native(self, sock, file, offset, count):
+        if not hasattr(os, 'sendfile'):
+            raise exceptions.SendfileNotAvailableError(
+                "os.sendfile() is not available")
+        return await super()._sock_sendfile_native(sock, file, offset, count)
+
+
 class AbstractChildWatcher:
     """Abstract base class for monitoring child processes.
 
@@ -1389,5 +1976,11 @@ class _UnixDefaultEventLoopPolicy(events.BaseDefaultEventLoopPolicy):
         self._watcher = watcher
 
 
+class ProactorEventLoopPolicy(_UnixDefaultEventLoopPolicy):
+    """UNIX event loop policy creating proactor event loops."""
+    _loop_factory = _UnixProactorEventLoop
+
+
 SelectorEventLoop = _UnixSelectorEventLoop
+ProactorEventLoop = _UnixProactorEventLoop
 DefaultEventLoopPolicy = _UnixDefaultEventLoopPolicy
@@ -14,6 +14,7 @@ from concurrent.futures._base import (FIRST_COMPLETED,
                                       BrokenExecutor,
                                       Future,
                                       Executor,
+                                      CompletionQueue,
                                       wait,
                                       as_completed)
 
@@ -26,10 +27,13 @@ __all__ = (
     'BrokenExecutor',
     'Future',
     'Executor',
+    'CompletionQueue',
     'wait',
     'as_completed',
     'ProcessPoolExecutor',
     'ThreadPoolExecutor',
+    'WorkStealingThreadPoolExecutor',
+    'InterpreterPoolExecutor',
 )
 
 
@@ -39,6 +43,7 @@ def __dir__():
 
 def __getattr__(name):
     global ProcessPoolExecutor, ThreadPoolExecutor
+    global WorkStealingThreadPoolExecutor, InterpreterPoolExecutor
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
@@ -50,4 +55,14 @@ def __getattr__(name):
         ThreadPoolExecutor = te
         return te
 
+    if name == 'WorkStealingThreadPoolExecutor':
+        from .thread import WorkStealingThreadPoolExecutor as wte
+        WorkStealingThreadPoolExecutor = wte
+        return wte
+
+    if name == 'InterpreterPoolExecutor':
+        from .interpreter import InterpreterPoolExecutor as ie
+        InterpreterPoolExecutor = ie
+        return ie
+
     raise AttributeError(f"module {__name__} has no attribute {name}")
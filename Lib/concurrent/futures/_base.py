@@ -4,21 +4,22 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
 import threading
 import time
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
 ALL_COMPLETED = 'ALL_COMPLETED'
-_AS_COMPLETED = '_AS_COMPLETED'
 
 # Possible future states (for internal use by the futures package).
 PENDING = 'PENDING'
 RUNNING = 'RUNNING'
 # The future was cancelled by the user...
 CANCELLED = 'CANCELLED'
-# ...and _Waiter.add_cancelled() was called by a worker.
+# ...and the add_cancelled() method of its waiters was called by a worker.
 CANCELLED_AND_NOTIFIED = 'CANCELLED_AND_NOTIFIED'
 FINISHED = 'FINISHED'
 
@@ -57,144 +58,185 @@ class InvalidStateError(Error):
     """The operation is not allowed in this state."""
     pass
 
-class _Waiter(object):
-    """Provides the event that wait() and as_completed() block on."""
-    def __init__(self):
-        self.event = threading.Event()
-        self.finished_futures = []
-
-    def add_result(self, future):
-        self.finished_futures.append(future)
-
-    def add_exception(self, future):
-        self.finished_futures.append(future)
-
-    def add_cancelled(self, future):
-        self.finished_futures.append(future)
-
-class _AsCompletedWaiter(_Waiter):
-    """Used by as_completed()."""
-
-    def __init__(self):
-        super(_AsCompletedWaiter, self).__init__()
-        self.lock = threading.Lock()
-
-    def add_result(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_result(future)
-            self.event.set()
-
-    def add_exception(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_exception(future)
-            self.event.set()
+class _CompletionQueueWaiter(object):
+    """The waiter a CompletionQueue installs on its pending futures.
 
-    def add_cancelled(self, future):
-        with self.lock:
-            super(_AsCompletedWaiter, self).add_cancelled(future)
-            self.event.set()
-
-class _FirstCompletedWaiter(_Waiter):
-    """Used by wait(return_when=FIRST_COMPLETED)."""
-
-    def add_result(self, future):
-        super().add_result(future)
-        self.event.set()
-
-    def add_exception(self, future):
-        super().add_exception(future)
-        self.event.set()
-
-    def add_cancelled(self, future):
-        super().add_cancelled(future)
-        self.event.set()
-
-class _AllCompletedWaiter(_Waiter):
-    """Used by wait(return_when=FIRST_EXCEPTION and ALL_COMPLETED)."""
+    Futures call the add_result(), add_exception() and add_cancelled()
+    methods of their waiters, with the condition of the future held.
+    """
 
-    def __init__(self, num_pending_calls, stop_on_exception):
-        self.num_pending_calls = num_pending_calls
-        self.stop_on_exception = stop_on_exception
-        self.lock = threading.Lock()
-        super().__init__()
+    __slots__ = ('queue',)
 
-    def _decrement_pending_calls(self):
-        with self.lock:
-            self.num_pending_calls -= 1
-            if not self.num_pending_calls:
-                self.event.set()
+    def __init__(self, queue):
+        self.queue = queue
 
     def add_result(self, future):
-        super().add_result(future)
-        self._decrement_pending_calls()
+        self.queue._put(future)
 
-    def add_exception(self, future):
-        super().add_exception(future)
-        if self.stop_on_exception:
-            self.event.set()
-        else:
-            self._decrement_pending_calls()
+    add_exception = add_cancelled = add_result
 
-    def add_cancelled(self, future):
-        super().add_cancelled(future)
-        self._decrement_pending_calls()
+class CompletionQueue(object):
+    """A queue of futures, returned in the order in which they complete.
 
-class _AcquireFutures(object):
-    """A context manager that does an ordered acquire of Future conditions."""
+    The futures push themselves to the queue when they finish or are
+    cancelled, so waiting for any number of futures costs an acquisition of
+    the condition of each future when it is added and when it is returned.
+    """
 
-    def __init__(self, futures):
-        self.futures = sorted(futures, key=id)
+    def __init__(self, fs=()):
+        """Initializes the queue.
 
-    def __enter__(self):
-        for future in self.futures:
-            future._condition.acquire()
-
-    def __exit__(self, *args):
-        for future in self.futures:
-            future._condition.release()
-
-def _create_and_install_waiters(fs, return_when):
-    if return_when == _AS_COMPLETED:
-        waiter = _AsCompletedWaiter()
-    elif return_when == FIRST_COMPLETED:
-        waiter = _FirstCompletedWaiter()
-    else:
-        pending_count = sum(
-                f._state not in [CANCELLED_AND_NOTIFIED, FINISHED] for f in fs)
+        Args:
+            fs: An iterable of Futures (possibly created by different
+                Executors) to add to the queue.
+        """
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        # The number of threads blocked in get()
+        self._getters = 0
+        self._waiter = _CompletionQueueWaiter(self)
+        self._pending = set()
+        # (future, registered) pairs, registered being true if the waiter
+        # of the queue is installed on the future.
+        self._finished = collections.deque()
+        self.update(fs)
+
+    def __len__(self):
+        """The number of futures which were not returned yet."""
+        return len(self._pending) + len(self._finished)
+
+    def add(self, future):
+        """Add a future to the queue.
+
+        A future which already completed can be returned immediately.  Adding
+        a future which is pending in the queue has no effect.
+        """
+        self.update((future,))
 
-        if return_when == FIRST_EXCEPTION:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=True)
-        elif return_when == ALL_COMPLETED:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=False)
-        else:
-            raise ValueError("Invalid return condition: %r" % return_when)
+    def update(self, fs):
+        """Add the futures of the iterable fs to the queue, like add()."""
+        finished = []
+        pending = []
+        for f in fs:
+            # Completed futures never change state, no need to lock them.
+            if f._state in [CANCELLED_AND_NOTIFIED, FINISHED]:
+                finished.append((f, False))
+            else:
+                pending.append(f)
+
+        with self._mutex:
+            if pending:
+                new = []
+                for f in pending:
+                    if f not in self._pending:
+                        self._pending.add(f)
+                        new.append(f)
+                pending = new
+            self._finished.extend(finished)
+            if finished and self._getters:
+                self._not_empty.notify(len(finished))
+
+        # The futures are marked pending before installing the waiter, as
+        # _put() ignores futures which are not pending.
+        finished = []
+        for f in pending:
+            # Condition.acquire() is cheaper than its context manager.
+            condition = f._condition
+            condition.acquire()
+            try:
+                if f._state in [CANCELLED_AND_NOTIFIED, FINISHED]:
+                    finished.append(f)
+                else:
+                    f._waiters.append(self._waiter)
+            finally:
+                condition.release()
+        if finished:
+            with self._mutex:
+                for f in finished:
+                    self._pending.discard(f)
+                    self._finished.append((f, False))
+                if self._getters:
+                    self._not_empty.notify(len(finished))
+
+    def _put(self, future):
+        # Called by the future, with its condition held.
+        with self._mutex:
+            try:
+                self._pending.remove(future)
+            except KeyError:
+                # The queue was closed.
+                return
+            self._finished.append((future, True))
+            if self._getters:
+                self._not_empty.notify()
 
-    for f in fs:
-        f._waiters.append(waiter)
+    def _uninstall(self, future):
+        condition = future._condition
+        condition.acquire()
+        try:
+            future._waiters.remove(self._waiter)
+        finally:
+            condition.release()
 
-    return waiter
+    def get(self, timeout=None):
+        """Remove and return the next future to complete.
 
+        Args:
+            timeout: The maximum number of seconds to wait. If None, then
+                there is no limit on the wait time.
 
-def _yield_finished_futures(fs, waiter, ref_collect):
-    """
-    Iterate on the list *fs*, yielding finished futures one by one in
-    reverse order.
-    Before yielding a future, *waiter* is removed from its waiters
-    and the future is removed from each set in the collection of sets
-    *ref_collect*.
-
-    The aim of this function is to avoid keeping stale references after
-    the future is yielded and before the iterator resumes.
-    """
-    while fs:
-        f = fs[-1]
-        for futures_set in ref_collect:
-            futures_set.remove(f)
-        with f._condition:
-            f._waiters.remove(waiter)
-        del f
-        # Careful not to keep a reference to the popped value
-        yield fs.pop()
+        Raises:
+            TimeoutError: If no future completed before the given timeout.
+        """
+        with self._mutex:
+            if not self._finished:
+                self._getters += 1
+                try:
+                    if timeout is None:
+                        while not self._finished:
+                            self._not_empty.wait()
+                    else:
+                        end_time = timeout + time.monotonic()
+                        while not self._finished:
+                            remaining = end_time - time.monotonic()
+                            if remaining <= 0:
+                                raise TimeoutError()
+                            self._not_empty.wait(remaining)
+                finally:
+                    self._getters -= 1
+            future, registered = self._finished.popleft()
+        if registered:
+            self._uninstall(future)
+        return future
+
+    def drain(self):
+        """Remove and return a list of the futures which already completed."""
+        with self._mutex:
+            finished = self._finished
+            self._finished = collections.deque()
+        fs = []
+        for future, registered in finished:
+            if registered:
+                self._uninstall(future)
+            fs.append(future)
+        return fs
+
+    def close(self):
+        """Remove all the futures from the queue.
+
+        The pending futures will not be added to the queue when they
+        complete.
+        """
+        with self._mutex:
+            pending = self._pending
+            self._pending = set()
+            finished = self._finished
+            self._finished = collections.deque()
+        for future in pending:
+            self._uninstall(future)
+        for future, registered in finished:
+            if registered:
+                self._uninstall(future)
 
 
 def as_completed(fs, timeout=None):
@@ -220,44 +262,26 @@ def as_completed(fs, timeout=None):
 
     fs = set(fs)
     total_futures = len(fs)
-    with _AcquireFutures(fs):
-        finished = set(
-                f for f in fs
-                if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        pending = fs - finished
-        waiter = _create_and_install_waiters(fs, _AS_COMPLETED)
-    finished = list(finished)
+    completed = CompletionQueue(fs)
+    # The queue drops its references to the futures as they are yielded
+    del fs
     try:
-        yield from _yield_finished_futures(finished, waiter,
-                                           ref_collect=(fs,))
-
-        while pending:
+        for unfinished in range(total_futures, 0, -1):
             if timeout is None:
                 wait_timeout = None
             else:
                 wait_timeout = end_time - time.monotonic()
-                if wait_timeout < 0:
-                    raise TimeoutError(
-                            '%d (of %d) futures unfinished' % (
-                            len(pending), total_futures))
-
-            waiter.event.wait(wait_timeout)
-
-            with waiter.lock:
-                finished = waiter.finished_futures
-                waiter.finished_futures = []
-                waiter.event.clear()
-
-            # reverse to keep finishing order
-            finished.reverse()
-            yield from _yield_finished_futures(finished, waiter,
-                                               ref_collect=(fs, pending))
-
+            try:
+                finished = [completed.get(wait_timeout)]
+            except TimeoutError:
+                raise TimeoutError(
+                        '%d (of %d) futures unfinished' % (
+                        unfinished, total_futures)) from None
+            # Careful not to keep a reference to the yielded future
+            yield finished.pop()
     finally:
-        # Remove waiter from unfinished futures
-        for f in fs:
-            with f._condition:
-                f._waiters.remove(waiter)
+        # Remove the waiter from unfinished futures
+        completed.close()
 
 DoneAndNotDoneFutures = collections.namedtuple(
         'DoneAndNotDoneFutures', 'done not_done')
@@ -285,30 +309,52 @@ def wait(fs, timeout=None, return_when=ALL_COMPLETED):
         completed. The second set, named 'not_done', contains uncompleted
         futures.
     """
-    with _AcquireFutures(fs):
-        done = set(f for f in fs
-                   if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        not_done = set(fs) - done
-
-        if (return_when == FIRST_COMPLETED) and done:
-            return DoneAndNotDoneFutures(done, not_done)
-        elif (return_when == FIRST_EXCEPTION) and done:
-            if any(f for f in done
-                   if not f.cancelled() and f.exception() is not None):
-                return DoneAndNotDoneFutures(done, not_done)
-
-        if len(done) == len(fs):
+    fs = set(fs)
+    done = set(f for f in fs
+               if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
+    not_done = fs - done
+
+    if (return_when == FIRST_COMPLETED) and done:
+        return DoneAndNotDoneFutures(done, not_done)
+    elif (return_when == FIRST_EXCEPTION) and done:
+        if any(f for f in done
+               if not f.cancelled() and f.exception() is not None):
             return DoneAndNotDoneFutures(done, not_done)
 
-        waiter = _create_and_install_waiters(fs, return_when)
-
-    waiter.event.wait(timeout)
-    for f in fs:
-        with f._condition:
-            f._waiters.remove(waiter)
+    if not not_done:
+        return DoneAndNotDoneFutures(done, not_done)
+    if return_when not in [FIRST_COMPLETED, FIRST_EXCEPTION, ALL_COMPLETED]:
+        raise ValueError("Invalid return condition: %r" % return_when)
+    if timeout is not None and timeout <= 0:
+        # Just polling, no need to install waiters
+        return DoneAndNotDoneFutures(done, not_done)
 
-    done.update(waiter.finished_futures)
-    return DoneAndNotDoneFutures(done, set(fs) - done)
+    if timeout is not None:
+        end_time = timeout + time.monotonic()
+    completed = CompletionQueue(not_done)
+    try:
+        while completed:
+            if timeout is None:
+                wait_timeout = None
+            else:
+                wait_timeout = end_time - time.monotonic()
+            try:
+                f = completed.get(wait_timeout)
+            except TimeoutError:
+                break
+            # The futures which completed meanwhile count as well.
+            finished = [f, *completed.drain()]
+            done.update(finished)
+            if return_when == FIRST_COMPLETED:
+                break
+            if return_when == FIRST_EXCEPTION and any(
+                    f for f in finished
+                    if not f.cancelled() and f.exception() is not None):
+                break
+        done.update(completed.drain())
+    finally:
+        completed.close()
+    return DoneAndNotDoneFutures(done, fs - done)
 
 class Future(object):
     """Represents the result of an asynchronous computation."""
@@ -552,6 +598,50 @@ class Future(object):
             self._condition.notify_all()
         self._invoke_callbacks()
 
+def _map(executor, submit, fn, args_iter, timeout, buffersize):
+    """Submits fn(*args) for the args of args_iter and iterates the results.
+
+    The calls are submitted with submit(executor, fn, *args). If buffersize
+    is not None, at most buffersize calls are submitted ahead of the results
+    being consumed and the iterator only keeps a weak reference to the
+    executor: the remaining calls are not submitted once it is gone.
+    """
+    if timeout is not None:
+        end_time = timeout + time.monotonic()
+
+    if buffersize is None:
+        fs = [submit(executor, fn, *args) for args in args_iter]
+    else:
+        fs = collections.deque(
+            submit(executor, fn, *args)
+            for args in itertools.islice(args_iter, buffersize))
+        executor = weakref.ref(executor)
+
+    # Yield must be hidden in closure so that the futures are submitted
+    # before the first iterator value is required.
+    def result_iterator():
+        try:
+            # reverse to keep finishing order
+            fs.reverse()
+            while fs:
+                if buffersize is not None:
+                    # Keep the window full while waiting for the result
+                    ex = executor()
+                    if ex is not None:
+                        for args in itertools.islice(args_iter, 1):
+                            fs.appendleft(submit(ex, fn, *args))
+                    del ex
+                # Careful not to keep a reference to the popped future
+                if timeout is None:
+                    yield fs.pop().result()
+                else:
+                    yield fs.pop().result(end_time - time.monotonic())
+        finally:
+            for future in fs:
+                future.cancel()
+    return result_iterator()
+
+
 class Executor(object):
     """This is an abstract base class for concrete asynchronous executors."""
 
@@ -580,7 +670,7 @@ class Executor(object):
         raise NotImplementedError()
     submit.__text_signature__ = '($self, fn, /, *args, **kwargs)'
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -592,6 +682,10 @@ class Executor(object):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The maximum number of calls submitted ahead of the
+                results being consumed. If None, then all the calls are
+                submitted before the iterator is returned. Otherwise the
+                iterables are consumed lazily, as the results are.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -602,27 +696,10 @@ class Executor(object):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
-        if timeout is not None:
-            end_time = timeout + time.monotonic()
-
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
-
-        # Yield must be hidden in closure so that the futures are submitted
-        # before the first iterator value is required.
-        def result_iterator():
-            try:
-                # reverse to keep finishing order
-                fs.reverse()
-                while fs:
-                    # Careful not to keep a reference to the popped future
-                    if timeout is None:
-                        yield fs.pop().result()
-                    else:
-                        yield fs.pop().result(end_time - time.monotonic())
-            finally:
-                for future in fs:
-                    future.cancel()
-        return result_iterator()
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+        return _map(self, type(self).submit, fn, zip(*iterables),
+                    timeout, buffersize)
 
     def shutdown(self, wait=True):
         """Clean-up the resources associated with the Executor.
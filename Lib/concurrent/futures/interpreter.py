@@ -0,0 +1,299 @@
+# Licensed to PSF under a Contributor Agreement.
+
+"""Implements InterpreterPoolExecutor.
+
+Each worker thread of the pool owns a subinterpreter with its own modules
+and globals.  Calls are pickled with protocol 5 and passed to the
+interpreter through a pair of channels: buffers (memoryview and bytearray
+objects, or any object whose __reduce_ex__ returns a PickleBuffer) are sent
+out-of-band, so the receiving interpreter gets a memoryview of the sender's
+memory instead of a copy.
+"""
+
+import copyreg
+import functools
+import io
+import os
+import pickle
+import sys
+import threading
+import traceback
+
+from concurrent.futures import _base
+from concurrent.futures import thread
+import _xxsubinterpreters as _interpreters
+
+# Functions and classes defined by the main script are found in the
+# interpreters under "__mp_main__" (see _prepare_main()).
+if '__main__' in sys.modules:
+    sys.modules.setdefault('__mp_main__', sys.modules['__main__'])
+
+# Run in the interpreter when a worker starts.
+_BOOTSTRAP = """if True:
+    import sys
+    sys.path[:] = _path.split('\\0')
+    from concurrent.futures import interpreter as _interpreter
+    _interpreter._init_worker(_tasks, _results, _main_name, _main_path)
+    """
+
+# Run in the interpreter for every call.  The main module may have been
+# replaced by _prepare_main(), so do not rely on any of its globals.
+_SERVE = ("__import__('sys').modules['concurrent.futures.interpreter']"
+          "._serve()")
+
+# The channels of the worker, in its interpreter.
+_channels = None
+
+# The interpreter of the current worker thread.
+_local = threading.local()
+
+
+# Hack to embed stringification of remote traceback in local traceback
+
+class _RemoteTraceback(Exception):
+    def __init__(self, tb):
+        self.tb = tb
+    def __str__(self):
+        return self.tb
+
+class _ExceptionWithTraceback:
+    def __init__(self, exc, tb):
+        tb = traceback.format_exception(type(exc), exc, tb)
+        tb = ''.join(tb)
+        self.exc = exc
+        self.tb = '\n"""\n%s"""' % tb
+    def __reduce__(self):
+        return _rebuild_exc, (self.exc, self.tb)
+
+def _rebuild_exc(exc, tb):
+    exc.__cause__ = _RemoteTraceback(tb)
+    return exc
+
+
+def _rebuild_memoryview(buffer, format, shape):
+    m = memoryview(buffer)
+    if m.format != format or m.shape != shape:
+        m = m.cast('B').cast(format, shape)
+    return m
+
+def _reduce_memoryview(m):
+    if not m.c_contiguous:
+        m = memoryview(bytearray(m)).cast('B').cast(m.format, m.shape)
+    return _rebuild_memoryview, (pickle.PickleBuffer(m), m.format, m.shape)
+
+class _Pickler(pickle.Pickler):
+    '''Pickler which also supports memoryview objects.'''
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[memoryview] = _reduce_memoryview
+
+
+def _send(cid, obj):
+    buffers = []
+    def buffer_callback(buffer):
+        m = memoryview(buffer)
+        if not m.c_contiguous:
+            return True
+        buffers.append(m)
+        return False
+
+    f = io.BytesIO()
+    _Pickler(f, 5, buffer_callback=buffer_callback).dump(obj)
+    data = f.getbuffer()
+    # Everything is pickled before sending, so a pickling error leaves the
+    # channel empty.
+    _interpreters.channel_send(cid, data)
+    _interpreters.channel_send(cid, len(buffers))
+    for buffer in buffers:
+        _interpreters.channel_send(cid, buffer)
+
+def _recv(cid):
+    data = _interpreters.channel_recv(cid)
+    nbuffers = _interpreters.channel_recv(cid)
+    buffers = [_interpreters.channel_recv(cid) for i in range(nbuffers)]
+    return pickle.loads(data, buffers=buffers)
+
+
+def _main_module_info():
+    # Mirrors what multiprocessing.spawn does for child processes.
+    main_module = sys.modules['__main__']
+    spec = getattr(main_module, '__spec__', None)
+    if spec is not None:
+        name = spec.name
+        if name == '__main__' or name.endswith('.__main__'):
+            # The main module of a package is not re-run.
+            return '', ''
+        return name, ''
+    path = getattr(main_module, '__file__', None)
+    if path is None:
+        # Interactive session or "python -c".
+        return '', ''
+    return '', os.path.abspath(path)
+
+def _prepare_main(name, path):
+    """Run the main module of the parent as __mp_main__.
+
+    Called in the interpreter of a worker.
+    """
+    if not name and not path:
+        return
+    import runpy
+    import types
+    main_module = types.ModuleType('__mp_main__')
+    if name:
+        main_content = runpy.run_module(name, run_name='__mp_main__',
+                                        alter_sys=True)
+    else:
+        main_content = runpy.run_path(path, run_name='__mp_main__')
+    main_module.__dict__.update(main_content)
+    sys.modules['__main__'] = sys.modules['__mp_main__'] = main_module
+
+def _init_worker(tasks, results, main_name, main_path):
+    """Prepare the interpreter of a worker.
+
+    Called in the interpreter of a worker.
+    """
+    global _channels
+    _channels = tasks, results
+    _prepare_main(main_name, main_path)
+
+def _serve():
+    """Run a single call received from the worker thread.
+
+    Called in the interpreter of a worker.
+    """
+    tasks, results = _channels
+    try:
+        fn, args, kwargs = _recv(tasks)
+        result = (True, fn(*args, **kwargs))
+    except BaseException as e:
+        result = (False, _ExceptionWithTraceback(e, e.__traceback__))
+    # Drop any reference to the buffers of the caller.
+    fn = args = kwargs = None
+    try:
+        _send(results, result)
+    except BaseException as e:
+        _send(results, (False, _ExceptionWithTraceback(e, e.__traceback__)))
+
+
+class _Interpreter(object):
+    """A subinterpreter and the channels used to run calls in it."""
+
+    def __init__(self):
+        self.id = _interpreters.create()
+        self.tasks = self.results = None
+        try:
+            self.tasks = _interpreters.channel_create()
+            self.results = _interpreters.channel_create()
+            main_name, main_path = _main_module_info()
+            _interpreters.run_string(self.id, _BOOTSTRAP, {
+                '_tasks': self.tasks,
+                '_results': self.results,
+                '_path': '\0'.join(sys.path),
+                '_main_name': main_name,
+                '_main_path': main_path,
+            })
+        except BaseException:
+            self.close()
+            raise
+
+    def call(*args, **kwargs):
+        self, fn, *args = args
+        _send(self.tasks, (fn, args, kwargs))
+        _interpreters.run_string(self.id, _SERVE)
+        ok, value = _recv(self.results)
+        if ok:
+            return value
+        try:
+            raise value
+        finally:
+            # Break a reference cycle with the exception in value
+            value = None
+
+    def close(self):
+        for cid in (self.tasks, self.results):
+            if cid is not None:
+                try:
+                    _interpreters.channel_destroy(cid)
+                except _interpreters.ChannelNotFoundError:
+                    pass
+        _interpreters.destroy(self.id)
+
+
+def _call(*args, **kwargs):
+    return _local.interpreter.call(*args, **kwargs)
+
+
+class InterpreterPoolExecutor(thread.ThreadPoolExecutor):
+    """Executor running calls in subinterpreters.
+
+    Each worker thread runs the calls it picks up in its own subinterpreter,
+    which is created when the thread starts and destroyed when it exits.
+
+    The subinterpreters share the GIL: CPU-bound calls are serialised and
+    run no faster than in a single thread.  Only the calls which release
+    the GIL, for I/O for example, overlap.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=()):
+        """Initializes a new InterpreterPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of interpreters that can be used
+                to execute the given calls.  Defaults to the number of
+                processors on the machine, but at most 4: the interpreters
+                share the GIL, so more of them do not run more calls at
+                once.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize each interpreter.
+            initargs: A tuple of arguments to pass to the initializer.
+        """
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        if not thread_name_prefix:
+            thread_name_prefix = ("InterpreterPoolExecutor-%d"
+                                  % self._counter())
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs)
+
+    def submit(*args, **kwargs):
+        if len(args) >= 2:
+            self, fn, *args = args
+        elif not args:
+            raise TypeError("descriptor 'submit' of 'InterpreterPoolExecutor' "
+                            "object needs an argument")
+        elif 'fn' in kwargs:
+            fn = kwargs.pop('fn')
+            self, *args = args
+            import warnings
+            warnings.warn("Passing 'fn' as keyword argument is deprecated",
+                          DeprecationWarning, stacklevel=2)
+        else:
+            raise TypeError('submit expected at least 1 positional argument, '
+                            'got %d' % (len(args)-1))
+
+        return super(InterpreterPoolExecutor, self).submit(_call, fn,
+                                                           *args, **kwargs)
+    submit.__text_signature__ = _base.Executor.submit.__text_signature__
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    @staticmethod
+    def _run_worker(executor_reference, work_queue, initializer, initargs):
+        try:
+            interp = _Interpreter()
+        except BaseException:
+            _base.LOGGER.critical('Exception creating an interpreter:',
+                                  exc_info=True)
+            executor = executor_reference()
+            if executor is not None:
+                executor._initializer_failed()
+            return
+        _local.interpreter = interp
+        if initializer is not None:
+            initializer = functools.partial(interp.call, initializer)
+        try:
+            thread._worker(executor_reference, work_queue,
+                           initializer, initargs)
+        finally:
+            del _local.interpreter
+            interp.close()
@@ -58,6 +58,7 @@ import weakref
 from functools import partial
 import itertools
 import sys
+import time
 import traceback
 
 # Workers are created as daemon threads and processes. This is done to allow the
@@ -109,6 +110,14 @@ def _python_exit():
 # (Futures in the call queue cannot be cancelled).
 EXTRA_QUEUED_CALLS = 1
 
+# Tuning of the automatic chunksize of map(): chunks are sized so that their
+# overhead (pickling, IPC and scheduling) stays below _AUTO_CHUNK_OVERHEAD of
+# their run time, but without running for more than _AUTO_CHUNK_MAX_TIME
+# seconds so that the work stays balanced between the workers.
+_AUTO_CHUNK_OVERHEAD = 0.05
+_AUTO_CHUNK_MAX_TIME = 0.1
+_AUTO_CHUNK_MAX_SIZE = 2 ** 16
+
 
 # On Windows, WaitForMultipleObjects is used to wait for processes to finish.
 # It can wait on, at most, 63 objects. There is an overhead of two objects:
@@ -145,10 +154,11 @@ class _WorkItem(object):
         self.kwargs = kwargs
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
+        self.exit_pid = exit_pid
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -197,18 +207,87 @@ def _process_chunk(fn, chunk):
     """
     return [fn(*args) for args in chunk]
 
+def _process_chunk_timed(fn, chunk):
+    """ Processes a chunk like _process_chunk, also returning the time spent.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return results, time.perf_counter() - start
+
+class _ChunkSizer(object):
+    """Tunes the chunksize of map() from the timings of the completed chunks.
+
+    The workers measure the time spent running each chunk; the overhead of a
+    chunk is the rest of the time between its submission and its result.
+    The smallest overhead seen is used since the chunks also wait in the
+    queues while all the workers are busy.
+    """
+    def __init__(self):
+        self.chunksize = 1
+        self._item_time = None
+        self._overhead = None
+        self._lock = threading.Lock()
+
+    def get_chunks(self, *iterables):
+        """ Iterates over zip()ed iterables in chunks of the current size. """
+        it = zip(*iterables)
+        while True:
+            chunk = tuple(itertools.islice(it, self.chunksize))
+            if not chunk:
+                return
+            yield (chunk,)
+
+    def submit(self, executor, fn, chunk):
+        start = time.perf_counter()
+        future = executor.submit(_process_chunk_timed, fn, chunk)
+        future.add_done_callback(partial(self._chunk_done, len(chunk), start))
+        return future
+
+    def _chunk_done(self, size, start, future):
+        elapsed = time.perf_counter() - start
+        if future.cancelled() or future.exception() is not None:
+            return
+        _, run_time = future.result()
+        with self._lock:
+            item_time = run_time / size
+            if self._item_time is None:
+                self._item_time = item_time
+            else:
+                # exponential moving average
+                self._item_time += (item_time - self._item_time) / 4
+            overhead = max(elapsed - run_time, 0.0)
+            if self._overhead is None or overhead < self._overhead:
+                self._overhead = overhead
+
+            chunk_time = min(self._overhead / _AUTO_CHUNK_OVERHEAD,
+                             _AUTO_CHUNK_MAX_TIME)
+            if self._item_time > 0:
+                chunksize = chunk_time / self._item_time
+            else:
+                chunksize = _AUTO_CHUNK_MAX_SIZE
+            # Grow progressively: the first timings are the least reliable
+            chunksize = min(chunksize, 2 * self.chunksize,
+                            _AUTO_CHUNK_MAX_SIZE)
+            self.chunksize = max(int(chunksize), 1)
+
 
-def _sendback_result(result_queue, work_id, result=None, exception=None):
+def _sendback_result(result_queue, work_id, result=None, exception=None,
+                     exit_pid=None):
     """Safely send back the given result or exception"""
     try:
         result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception))
+                                     exception=exception, exit_pid=exit_pid))
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
-        result_queue.put(_ResultItem(work_id, exception=exc))
+        result_queue.put(_ResultItem(work_id, exception=exc,
+                                     exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs):
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    shm_threshold=None, max_tasks=None, max_memory=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -220,7 +299,15 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        shm_threshold: The minimum size of the buffers of the results sent
+            back through shared memory, or None
+        max_tasks: The maximum number of tasks a worker runs before it
+            exits and gets replaced, or None
+        max_memory: The resident memory in bytes after which a worker exits
+            and gets replaced, or None
     """
+    if shm_threshold is not None:
+        from multiprocessing.shared_memory import _SharedMemoryPickle
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -229,25 +316,52 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
             # The parent will notice that the process stopped and
             # mark the pool broken
             return
+    num_tasks = 0
+    exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
+
+        if max_tasks is not None:
+            num_tasks += 1
+            if num_tasks >= max_tasks:
+                exit_pid = os.getpid()
+
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
-            _sendback_result(result_queue, call_item.work_id, exception=exc)
         else:
-            _sendback_result(result_queue, call_item.work_id, result=r)
+            exc = None
+            if shm_threshold is not None:
+                r = _SharedMemoryPickle(r, shm_threshold)
+
+        if max_memory is not None and exit_pid is None:
+            rss = mp.util._resident_memory()
+            if rss is not None and rss > max_memory:
+                exit_pid = os.getpid()
+
+        # The result carries the pid of a worker about to exit, so that the
+        # queue management thread replaces it
+        if exc is not None:
+            _sendback_result(result_queue, call_item.work_id, exception=exc,
+                             exit_pid=exit_pid)
+            del exc
+        else:
+            _sendback_result(result_queue, call_item.work_id, result=r,
+                             exit_pid=exit_pid)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
         # open files or shared memory that is not needed anymore
         del call_item
 
+        if exit_pid is not None:
+            return
+
 
 def _add_call_item_to_queue(pending_work_items,
                             work_ids,
@@ -420,6 +534,17 @@ def _queue_management_worker(executor_reference,
                     work_item.future.set_result(result_item.result)
                 # Delete references to object. See issue16284
                 del work_item
+            if result_item.exit_pid is not None:
+                # The worker exited after reaching its task or memory limit:
+                # start a replacement while there is work left for it.
+                p = processes.pop(result_item.exit_pid)
+                p.join()
+                del p
+                executor = executor_reference()
+                if executor is not None and (pending_work_items or
+                                             not shutting_down()):
+                    executor._adjust_process_count()
+                executor = None
             # Delete reference to result_item
             del result_item
 
@@ -496,7 +621,9 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *,
+                 shared_memory_threshold=None, max_tasks_per_child=None,
+                 max_memory_per_child=None, forkserver_preload=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -504,9 +631,25 @@ class ProcessPoolExecutor(_base.Executor):
                 execute the given calls. If None or not given then as many
                 worker processes will be created as the machine has processors.
             mp_context: A multiprocessing context to launch the workers. This
-                object should provide SimpleQueue, Queue and Process.
+                object should provide SimpleQueue, Queue and Process. If None
+                and workers get replaced, the 'forkserver' context is used
+                where available, else the 'spawn' context.
             initializer: A callable used to initialize worker processes.
             initargs: A tuple of arguments to pass to the initializer.
+            shared_memory_threshold: If not None, the results are pickled
+                with protocol 5 and their buffers of at least this many bytes
+                are sent back through shared memory instead of the result
+                pipe.
+            max_tasks_per_child: The maximum number of tasks a worker process
+                can complete before it exits and is replaced with a fresh
+                worker process.
+            max_memory_per_child: The resident memory in bytes of a worker
+                process after which it exits, once its current task is done,
+                and is replaced with a fresh worker process.
+            forkserver_preload: Names of modules imported by the forkserver
+                process before it starts workers, so that they start with the
+                modules imported already. It only has an effect with the
+                'forkserver' context, if the forkserver is not running yet.
         """
         _check_system_limits()
 
@@ -525,15 +668,56 @@ class ProcessPoolExecutor(_base.Executor):
 
             self._max_workers = max_workers
 
+        if max_tasks_per_child is not None:
+            if not isinstance(max_tasks_per_child, int):
+                raise TypeError("max_tasks_per_child must be an integer")
+            elif max_tasks_per_child <= 0:
+                raise ValueError("max_tasks_per_child must be >= 1")
+        if max_memory_per_child is not None and max_memory_per_child <= 0:
+            raise ValueError("max_memory_per_child must be >= 1")
+        recycle = (max_tasks_per_child is not None or
+                   max_memory_per_child is not None)
+
         if mp_context is None:
-            mp_context = mp.get_context()
+            if recycle:
+                # Workers are started by the queue management thread when
+                # recycled: forking a multithreaded process is not safe.
+                if 'forkserver' in mp.get_all_start_methods():
+                    mp_context = mp.get_context('forkserver')
+                else:
+                    mp_context = mp.get_context('spawn')
+            else:
+                mp_context = mp.get_context()
+        elif recycle and mp_context.get_start_method() == 'fork':
+            raise ValueError("max_tasks_per_child and max_memory_per_child "
+                             "are incompatible with the 'fork' "
+                             "multiprocessing start method; supply a "
+                             "different mp_context.")
         self._mp_context = mp_context
+        self._max_tasks_per_child = max_tasks_per_child
+        self._max_memory_per_child = max_memory_per_child
+
+        # Workers started by a forkserver have these modules imported
+        # already, if asked for and the forkserver is not running yet.
+        if forkserver_preload:
+            mp_context._preload(['concurrent.futures.process',
+                                 *forkserver_preload])
 
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
         self._initializer = initializer
         self._initargs = initargs
 
+        if shared_memory_threshold is not None:
+            if shared_memory_threshold < 0:
+                raise ValueError("shared_memory_threshold must be >= 0")
+            if os.name != 'nt':
+                # The workers must share the resource tracker of the
+                # executor, which unlinks the blocks they create.
+                from multiprocessing import resource_tracker
+                resource_tracker.ensure_running()
+        self._shm_threshold = shared_memory_threshold
+
         # Management thread
         self._queue_management_thread = None
 
@@ -604,7 +788,10 @@ class ProcessPoolExecutor(_base.Executor):
                 args=(self._call_queue,
                       self._result_queue,
                       self._initializer,
-                      self._initargs))
+                      self._initargs,
+                      self._shm_threshold,
+                      self._max_tasks_per_child,
+                      self._max_memory_per_child))
             p.start()
             self._processes[p.pid] = p
 
@@ -647,7 +834,7 @@ class ProcessPoolExecutor(_base.Executor):
     submit.__text_signature__ = _base.Executor.submit.__text_signature__
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -658,6 +845,12 @@ class ProcessPoolExecutor(_base.Executor):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the chunksize is tuned from the measured run time of
+                the items and overhead of the chunks.
+            buffersize: The maximum number of chunks submitted ahead of the
+                results being consumed. If None, then all the chunks are
+                submitted before the iterator is returned, unless chunksize is
+                None: twice as many chunks as workers are then submitted ahead.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -668,12 +861,25 @@ class ProcessPoolExecutor(_base.Executor):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+
+        if chunksize is None:
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            sizer = _ChunkSizer()
+            results = _base._map(self, sizer.submit, fn,
+                                 sizer.get_chunks(*iterables),
+                                 timeout, buffersize)
+            return _chain_from_iterable_of_lists(
+                chunk_results for chunk_results, _ in results)
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True):
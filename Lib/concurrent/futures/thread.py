@@ -7,9 +7,11 @@ __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import atexit
 from concurrent.futures import _base
+import heapq
 import itertools
 import queue
 import threading
+import time
 import weakref
 import os
 
@@ -204,7 +206,7 @@ class ThreadPoolExecutor(_base.Executor):
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
-            t = threading.Thread(name=thread_name, target=_worker,
+            t = threading.Thread(name=thread_name, target=self._run_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._work_queue,
                                        self._initializer,
@@ -214,6 +216,10 @@ class ThreadPoolExecutor(_base.Executor):
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    # Run by each worker thread; subclasses may wrap it to set up and tear
+    # down per-thread state.
+    _run_worker = staticmethod(_worker)
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
@@ -235,3 +241,381 @@ class ThreadPoolExecutor(_base.Executor):
             for t in self._threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+class _WorkerQueue(object):
+    """The work items of a worker of a WorkStealingThreadPoolExecutor.
+
+    Entries are (priority, sequence, submit time, work item) tuples kept in a
+    heap: the worker and the thieves pop the entry of lowest priority which
+    was submitted first.  The queue is closed while its worker is idle or
+    exiting; only the executor queues entries to it then, holding its
+    lock.  The counters are only updated by the worker.
+    """
+    def __init__(self):
+        self.heap = []
+        self.lock = threading.Lock()
+        self.closed = False
+        self.wakeup = threading.Event()
+        self.completed = 0
+        self.steals = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, entry):
+        with self.lock:
+            self.closed = False
+            heapq.heappush(self.heap, entry)
+
+    def try_push(self, entry):
+        # Queue entry unless the queue is closed
+        with self.lock:
+            if self.closed:
+                return False
+            heapq.heappush(self.heap, entry)
+            return True
+
+    def close(self):
+        # Close the queue, unless entries were queued in the meantime
+        with self.lock:
+            if self.heap:
+                return False
+            self.closed = True
+            return True
+
+    def pop(self):
+        if not self.heap:
+            return None
+        with self.lock:
+            if self.heap:
+                return heapq.heappop(self.heap)
+        return None
+
+    def put(self, item):
+        # Called with None by _python_exit() to wake up the worker
+        self.wakeup.set()
+
+    def record_wait(self, submit_time):
+        wait_time = time.monotonic() - submit_time
+        self.completed += 1
+        self.wait_time += wait_time
+        if wait_time > self.max_wait_time:
+            self.max_wait_time = wait_time
+
+
+def _work_stealing_worker(executor_reference, work_queue, initializer,
+                          initargs, idle_timeout):
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            executor = executor_reference()
+            if executor is not None:
+                executor._initializer_failed()
+            return
+    try:
+        while True:
+            entry = work_queue.pop()
+            if entry is None:
+                executor = executor_reference()
+                if executor is not None:
+                    entry = executor._steal(work_queue)
+                del executor
+            if entry is not None:
+                work_queue.record_wait(entry[2])
+                work_item = entry[3]
+                del entry
+                work_item.run()
+                # Delete references to object. See issue16284
+                del work_item
+                continue
+
+            executor = executor_reference()
+            # Exit if:
+            #   - The interpreter is shutting down OR
+            #   - The executor that owns the worker has been collected OR
+            #   - The executor that owns the worker has been shutdown.
+            if _shutdown or executor is None or executor._shutdown:
+                if executor is not None and not executor._retire(work_queue):
+                    continue
+                return
+            if not executor._go_idle(work_queue):
+                continue
+            del executor
+
+            if work_queue.wakeup.wait(idle_timeout):
+                continue
+            executor = executor_reference()
+            if executor is None or executor._reap(work_queue):
+                return
+            del executor
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+
+
+class WorkStealingThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor giving each worker thread its own work queue.
+
+    Work items are handed to an idle worker, or else queued to the worker
+    submitting them or to the workers in turn; workers running out of work
+    steal it from the longest queue.  Once all the workers are started and
+    busy, submit() only locks the queue it picked, so submitters and
+    workers rarely contend on the same lock, which lets many short work
+    items scale to more threads.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), idle_timeout=None):
+        """Initializes a new WorkStealingThreadPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of threads that can be used to
+                execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize worker threads.
+            initargs: A tuple of arguments to pass to the initializer.
+            idle_timeout: The number of seconds after which idle threads
+                exit. If None, then the threads live as long as the executor.
+        """
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs)
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError("idle_timeout must be None or >= 0")
+        self._idle_timeout = idle_timeout
+        # _WorkerQueue of the running workers, and of the idle ones
+        self._queues = []
+        self._idle = []
+        self._local = threading.local()
+        self._sequence = itertools.count().__next__
+        self._next_queue = itertools.count().__next__
+        self._thread_count = itertools.count().__next__
+        # counters of the workers which exited
+        self._retired = _WorkerQueue()
+
+    def submit(*args, priority=0, **kwargs):
+        """Submits a callable to be executed with the given arguments.
+
+        Schedules the callable to be executed as fn(*args, **kwargs) and
+        returns a Future instance representing the execution of the callable.
+        Each worker runs the work items of its queue of lowest priority
+        first; priority is not passed to the callable.  It does not order
+        the work items queued to different workers.
+
+        Returns:
+            A Future representing the given call.
+        """
+        if len(args) >= 2:
+            self, fn, *args = args
+        elif not args:
+            raise TypeError("descriptor 'submit' of "
+                            "'WorkStealingThreadPoolExecutor' object "
+                            "needs an argument")
+        elif 'fn' in kwargs:
+            fn = kwargs.pop('fn')
+            self, *args = args
+            import warnings
+            warnings.warn("Passing 'fn' as keyword argument is deprecated",
+                          DeprecationWarning, stacklevel=2)
+        else:
+            raise TypeError('submit expected at least 1 positional argument, '
+                            'got %d' % (len(args)-1))
+
+        f = _base.Future()
+        w = _WorkItem(f, fn, args, kwargs)
+        entry = (priority, self._sequence(), time.monotonic(), w)
+
+        # Fast path: all the workers are started and busy, queue the work
+        # item without taking the executor lock.  A closed queue belongs to
+        # a worker going idle or exiting, handled by the slow path.
+        queues = self._queues
+        if (not self._idle and len(queues) >= self._max_workers
+                and not (self._broken or self._shutdown or _shutdown)):
+            work_queue = getattr(self._local, 'work_queue', None)
+            if work_queue is None:
+                try:
+                    work_queue = queues[self._next_queue() % len(queues)]
+                except (IndexError, ZeroDivisionError):
+                    work_queue = None
+            if work_queue is not None and work_queue.try_push(entry):
+                # A worker may have gone idle since the check: it missed
+                # the entry, so wake it up to steal it.
+                if self._idle:
+                    self._wake_idle()
+                return f
+
+        with self._shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+
+            if self._idle:
+                # Most recently idle first: the others can time out
+                work_queue = self._idle.pop()
+                work_queue.push(entry)
+                work_queue.wakeup.set()
+            elif len(self._queues) < self._max_workers:
+                self._start_worker().push(entry)
+            else:
+                work_queue = getattr(self._local, 'work_queue', None)
+                if work_queue is None or work_queue not in self._queues:
+                    work_queue = self._queues[
+                        self._next_queue() % len(self._queues)]
+                work_queue.push(entry)
+            return f
+    submit.__text_signature__ = '($self, fn, /, *args, priority=0, **kwargs)'
+
+    def _start_worker(self):
+        # When the executor gets lost, the weakref callback will wake up
+        # the worker threads.
+        def weakref_cb(_, queues=self._queues):
+            for work_queue in list(queues):
+                work_queue.wakeup.set()
+
+        work_queue = _WorkerQueue()
+        thread_name = '%s_%d' % (self._thread_name_prefix or self,
+                                 self._thread_count())
+        t = threading.Thread(name=thread_name, target=self._run_worker,
+                             args=(weakref.ref(self, weakref_cb),
+                                   work_queue,
+                                   self._initializer,
+                                   self._initargs,
+                                   self._idle_timeout))
+        t.daemon = True
+        self._queues.append(work_queue)
+        t.start()
+        self._threads.add(t)
+        _threads_queues[t] = work_queue
+        return work_queue
+
+    @staticmethod
+    def _run_worker(executor_reference, work_queue, *args):
+        executor = executor_reference()
+        if executor is not None:
+            # Work items submitted by the worker go to its own queue
+            executor._local.work_queue = work_queue
+        del executor
+        _work_stealing_worker(executor_reference, work_queue, *args)
+
+    def _steal(self, work_queue):
+        queues = self._queues
+        if not queues:
+            return None
+        victim = max(queues, key=len)
+        if victim is work_queue:
+            return None
+        entry = victim.pop()
+        if entry is not None:
+            work_queue.steals += 1
+        return entry
+
+    def _go_idle(self, work_queue):
+        # Register the worker as idle, unless there is work to steal.  The
+        # slow path of submit() is serialized by the lock.  The fast path
+        # pushes then checks _idle, so the worker registers then checks
+        # the queues: one of them sees the other.
+        with self._shutdown_lock:
+            if self._shutdown or _shutdown:
+                return False
+            if not work_queue.close():
+                return False
+            work_queue.wakeup.clear()
+            self._idle.append(work_queue)
+            if any(self._queues):
+                self._idle.remove(work_queue)
+                with work_queue.lock:
+                    work_queue.closed = False
+                return False
+            return True
+
+    def _wake_idle(self):
+        with self._shutdown_lock:
+            if self._idle:
+                # Most recently idle first: the others can time out
+                self._idle.pop().wakeup.set()
+
+    def _reap(self, work_queue):
+        # The worker timed out: it exits if submit() did not pick it.
+        with self._shutdown_lock:
+            if work_queue not in self._idle:
+                return False
+            self._idle.remove(work_queue)
+            self._remove_worker(work_queue)
+            return True
+
+    def _retire(self, work_queue):
+        # The worker exits, unless work items were queued in the meantime.
+        with self._shutdown_lock:
+            if not work_queue.close():
+                return False
+            if work_queue in self._idle:
+                self._idle.remove(work_queue)
+            if work_queue in self._queues:
+                self._remove_worker(work_queue)
+            return True
+
+    def _remove_worker(self, work_queue):
+        self._queues.remove(work_queue)
+        self._threads.discard(threading.current_thread())
+        retired = self._retired
+        retired.completed += work_queue.completed
+        retired.steals += work_queue.steals
+        retired.wait_time += work_queue.wait_time
+        retired.max_wait_time = max(retired.max_wait_time,
+                                    work_queue.max_wait_time)
+
+    def _initializer_failed(self):
+        with self._shutdown_lock:
+            self._broken = ('A thread initializer failed, the thread pool '
+                            'is not usable anymore')
+            # Drain and close work queues and mark pending futures failed
+            for work_queue in self._queues:
+                with work_queue.lock:
+                    work_queue.closed = True
+                    entries, work_queue.heap = work_queue.heap, []
+                for entry in entries:
+                    entry[3].future.set_exception(
+                        BrokenThreadPool(self._broken))
+
+    def shutdown(self, wait=True):
+        with self._shutdown_lock:
+            self._shutdown = True
+            self._idle.clear()
+            for work_queue in self._queues:
+                work_queue.wakeup.set()
+            threads = list(self._threads)
+        if wait:
+            for t in threads:
+                t.join()
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+    def stats(self):
+        """Returns a dict of statistics of the executor.
+
+        The keys are 'max_workers', 'workers' and 'idle_workers' for the
+        threads; 'queue_depth', the number of work items waiting for a worker;
+        'completed', the number of work items run so far, and 'steals' how
+        many were stolen from another worker; 'wait_time_total' and
+        'wait_time_max', the total and longest time in seconds spent by the
+        work items waiting for a worker.
+        """
+        with self._shutdown_lock:
+            queues = [self._retired, *self._queues]
+            return {
+                'max_workers': self._max_workers,
+                'workers': len(self._queues),
+                'idle_workers': len(self._idle),
+                'queue_depth': sum(map(len, queues)),
+                'completed': sum(q.completed for q in queues),
+                'steals': sum(q.steals for q in queues),
+                'wait_time_total': sum(q.wait_time for q in queues),
+                'wait_time_max': max(q.max_wait_time for q in queues),
+            }
@@ -824,6 +824,10 @@ class FrozenImporter:
             raise ImportError('{!r} is not a frozen module'.format(name),
                               name=name)
         code = _call_with_frames_removed(_imp.get_frozen_object, name)
+        if (_bootstrap_external is not None and
+                code.co_filename == '<frozen {}>'.format(name)):
+            # Frozen from the standard library by _freeze_importlib.
+            _bootstrap_external._fix_up_frozen_module(module)
         exec(code, module.__dict__)
 
     @classmethod
@@ -953,6 +957,12 @@ def _sanity_check(name, package, level):
 _ERR_MSG_PREFIX = 'No module named '
 _ERR_MSG = _ERR_MSG_PREFIX + '{!r}'
 
+# Called with the spec of each module found by _find_and_load() and
+# returning the spec to load it with; set by
+# importlib.util.enable_lazy_imports().
+_lazy_imports = None
+
+
 def _find_and_load_unlocked(name, import_):
     path = None
     parent = name.rpartition('.')[0]
@@ -972,6 +982,8 @@ def _find_and_load_unlocked(name, import_):
     if spec is None:
         raise ModuleNotFoundError(_ERR_MSG.format(name), name=name)
     else:
+        if _lazy_imports is not None:
+            spec = _lazy_imports(spec)
         module = _load_unlocked(spec)
     if parent:
         # Set the module as an attribute on its parent.
@@ -411,30 +411,7 @@ def cache_from_source(path, debug_override=None, *, optimization=None):
     if sys.platform != 'riscos' or extn:
         almost_filename += BYTECODE_SUFFIXES[0]
     if sys.pycache_prefix is not None:
-        # We need an absolute path to the py file to avoid the possibility of
-        # collisions within sys.pycache_prefix, if someone has two different
-        # `foo/bar.py` on their system and they import both of them using the
-        # same sys.pycache_prefix. Let's say sys.pycache_prefix is
-        # `C:\Bytecode`; the idea here is that if we get `Foo\Bar`, we first
-        # make it absolute (`C:\Somewhere\Foo\Bar`), then make it root-relative
-        # (`Somewhere\Foo\Bar`), so we end up placing the bytecode file in an
-        # unambiguous `C:\Bytecode\Somewhere\Foo\Bar\`.
-        if not _path_isabs(head):
-            head = _path_join(_os.getcwd(), head)
-
-        # Strip initial drive from a Windows path. We know we have an absolute
-        # path here, so the second part of the check rules out a POSIX path that
-        # happens to contain a colon at the second character.
-        if head[1] == ':' and head[0] not in path_separators:
-            head = head[2:]
-
-        # Strip initial path separator from `head` to complete the conversion
-        # back to a root-relative path before joining.
-        rv = _path_join(
-            sys.pycache_prefix,
-            head.lstrip(path_separators),
-            filename,
-        )
+        rv = _path_join(_cache_dir_in_prefix(head), filename)
         _bootstrap._verbose_message('cache_from_source({}, {}, {}) -> {}', path, debug_override, optimization, rv)
         return rv;
 
@@ -443,6 +420,31 @@ def cache_from_source(path, debug_override=None, *, optimization=None):
     return rv
 
 
+def _cache_dir_in_prefix(head):
+    """Return the directory of sys.pycache_prefix which holds the cached
+    files of the directory head."""
+    # We need an absolute path to the py file to avoid the possibility of
+    # collisions within sys.pycache_prefix, if someone has two different
+    # `foo/bar.py` on their system and they import both of them using the
+    # same sys.pycache_prefix. Let's say sys.pycache_prefix is
+    # `C:\Bytecode`; the idea here is that if we get `Foo\Bar`, we first
+    # make it absolute (`C:\Somewhere\Foo\Bar`), then make it root-relative
+    # (`Somewhere\Foo\Bar`), so we end up placing the bytecode file in an
+    # unambiguous `C:\Bytecode\Somewhere\Foo\Bar\`.
+    if not _path_isabs(head):
+        head = _path_join(_os.getcwd(), head)
+
+    # Strip initial drive from a Windows path. We know we have an absolute
+    # path here, so the second part of the check rules out a POSIX path that
+    # happens to contain a colon at the second character.
+    if head[1] == ':' and head[0] not in path_separators:
+        head = head[2:]
+
+    # Strip initial path separator from `head` to complete the conversion
+    # back to a root-relative path before joining.
+    return _path_join(sys.pycache_prefix, head.lstrip(path_separators))
+
+
 def source_from_cache(path):
     """Given the path to a .pyc. file, return the path to its .py file.
 
@@ -1379,6 +1381,11 @@ class PathFinder:
                 del sys.path_importer_cache[name]
             elif hasattr(finder, 'invalidate_caches'):
                 finder.invalidate_caches()
+        # Also forget the distributions found by importlib.metadata, if it
+        # was imported.
+        metadata = sys.modules.get('importlib.metadata')
+        if metadata is not None:
+            metadata.MetadataPathFinder.invalidate_caches()
 
     @classmethod
     def _path_hooks(cls, path):
@@ -1515,6 +1522,170 @@ class PathFinder:
         return MetadataPathFinder.find_distributions(*args, **kwargs)
 
 
+# Frozen standard library modules ############################################
+
+# The directory of the standard library, once found on sys.path.
+_STDLIB_DIR = None
+
+
+def _stdlib_dir():
+    """Return the directory of the standard library, or None if it is not on
+    sys.path."""
+    global _STDLIB_DIR
+    if _STDLIB_DIR is None:
+        for entry in sys.path:
+            if entry and _path_isfile(_path_join(entry, 'os.py')):
+                _STDLIB_DIR = entry
+                break
+    return _STDLIB_DIR
+
+
+def _fix_up_frozen_module(module):
+    """Point __file__ of a frozen standard library module, and __path__ if it
+    is a package, at its source in the standard library directory."""
+    stdlib_dir = _stdlib_dir()
+    if stdlib_dir is None:
+        return
+    spec = module.__spec__
+    parts = spec.name.split('.')
+    if spec.submodule_search_locations is not None:
+        package_dir = _path_join(stdlib_dir, *parts)
+        # Also module.__path__, so that the submodules which are not frozen
+        # are found.
+        spec.submodule_search_locations.append(package_dir)
+        module.__file__ = _path_join(package_dir, '__init__.py')
+    else:
+        parts[-1] += '.py'
+        module.__file__ = _path_join(stdlib_dir, *parts)
+
+
+# Persistent directory indexes ##############################################
+
+# Bumped when the format of the index files changes.
+_INDEX_VERSION = 1
+
+
+def _use_import_index():
+    """True if FileFinder should use persistent directory indexes."""
+    if sys.platform == 'riscos':
+        # The index does not record RISC OS filetypes.
+        return False
+    if 'import_index' in sys._xoptions:
+        return True
+    if sys.flags.ignore_environment:
+        return False
+    if sys.platform.startswith('win'):
+        key = 'PYTHONIMPORTINDEX'
+    else:
+        key = b'PYTHONIMPORTINDEX'
+    return bool(_os.environ.get(key))
+
+
+def _index_path(path):
+    """Return the path of the index of the directory path.
+
+    Raises NotImplementedError if sys.implementation.cache_tag is None.
+    """
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        raise NotImplementedError('sys.implementation.cache_tag is None')
+    filename = '__index__.{}.idx'.format(tag)
+    if sys.pycache_prefix is not None:
+        return _path_join(_cache_dir_in_prefix(path), filename)
+    return _path_join(path, _PYCACHE, filename)
+
+
+def _read_index(index_path, mtime):
+    """Return the (names, files) listing saved to index_path, or None if
+    there is no valid index for a directory modified at mtime."""
+    try:
+        with _io.FileIO(index_path, 'r') as file:
+            data = file.read()
+        version, index_mtime, names, files = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != _INDEX_VERSION or index_mtime != mtime:
+        return None
+    return names, files
+
+
+def _list_directory(path):
+    """Return the names of the entries of the directory path, and the set of
+    the names of the regular files among them."""
+    names = []
+    files = set()
+    with _os.scandir(path) as it:
+        for entry in it:
+            names.append(entry.name)
+            # The target of a symbolic link can change without the directory
+            # being modified, so only regular files are recorded.
+            if entry.is_file(follow_symlinks=False):
+                files.add(entry.name)
+    return names, files
+
+
+def _build_index(path, index_path, mtime):
+    """List the directory path, which was last modified at mtime, and save
+    the listing to index_path.
+
+    The listing is only saved if the clock of the file system ticked since
+    the directory was modified: a later modification within the same tick
+    would not change the mtime of the directory.  Nothing is saved if
+    sys.dont_write_bytecode is true.
+    """
+    if sys.dont_write_bytecode:
+        return _list_directory(path)
+    index_tmp = '{}.{}'.format(index_path, id(index_path))
+    try:
+        parent = _path_split(index_path)[0]
+        missing = []
+        # Figure out what directories are missing.
+        while parent and not _path_isdir(parent):
+            parent, part = _path_split(parent)
+            missing.append(part)
+        for part in reversed(missing):
+            parent = _path_join(parent, part)
+            try:
+                _os.mkdir(parent)
+            except FileExistsError:
+                pass
+        if missing:
+            # Creating __pycache__ may have modified the directory.
+            mtime = _path_stat(path).st_mtime
+        fd = _os.open(index_tmp,
+                      _os.O_EXCL | _os.O_CREAT | _os.O_WRONLY, 0o666)
+    except OSError:
+        # Read-only file system, permission denied, concurrent writer...
+        return _list_directory(path)
+    saved = False
+    try:
+        with _io.FileIO(fd, 'wb') as file:
+            start = _os.fstat(fd).st_mtime
+            names, files = _list_directory(path)
+            if start > mtime:
+                data = marshal.dumps((_INDEX_VERSION, mtime, names,
+                                      frozenset(files)))
+                try:
+                    file.write(data)
+                    saved = True
+                except OSError:
+                    pass
+        if saved:
+            try:
+                _os.replace(index_tmp, index_path)
+            except OSError:
+                saved = False
+            else:
+                _bootstrap._verbose_message('wrote index {!r}', index_path)
+    finally:
+        if not saved:
+            try:
+                _os.unlink(index_tmp)
+            except OSError:
+                pass
+    return names, files
+
+
 class FileFinder:
 
     """File-based finder.
@@ -1542,6 +1713,8 @@ class FileFinder:
         self._path_mtime = -1
         self._path_cache = set()
         self._relaxed_path_cache = set()
+        # The names of the regular files of the directory, when known
+        self._path_files = None
 
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
@@ -1579,7 +1752,10 @@ class FileFinder:
             mtime = -1
             _bootstrap._verbose_message('_path_stat failed {}'.format(self.path))
         if mtime != self._path_mtime:
-            self._fill_cache()
+            if mtime != -1 and _use_import_index():
+                self._fill_cache_from_index(mtime)
+            else:
+                self._fill_cache()
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
@@ -1635,7 +1811,7 @@ class FileFinder:
                 return None
             _bootstrap._verbose_message('trying {}', full_path, verbosity=2)
             if cache_module + suffix in cache:
-                if _path_isfile(full_path):
+                if self._isfile(tail_module + suffix, full_path):
                     return self._get_spec(loader_class, fullname, full_path,
                                           None, target)
 
@@ -1651,10 +1827,17 @@ class FileFinder:
             return spec
         return None
 
+    def _isfile(self, name, path):
+        # The persistent index records which entries are regular files.
+        if self._path_files is not None and name in self._path_files:
+            return True
+        return _path_isfile(path)
+
     def _fill_cache(self):
         _bootstrap._verbose_message('_fill_cache {}', self)
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
+        self._path_files = None
         try:
             if sys.platform == 'riscos': # Also get stat info for filetype
                 contents = {}
@@ -1667,6 +1850,28 @@ class FileFinder:
             # Directory has either been removed, turned into a file, or made
             # unreadable.
             contents = []
+        self._set_path_cache(contents)
+
+    def _fill_cache_from_index(self, mtime):
+        """Fill the cache from the persistent index of this directory, which
+        was last modified at mtime, rebuilding the index if it is stale."""
+        path = self.path or _os.getcwd()
+        try:
+            index_path = _index_path(path)
+        except NotImplementedError:
+            self._fill_cache()
+            return
+        index = _read_index(index_path, mtime)
+        if index is None:
+            try:
+                index = _build_index(path, index_path, mtime)
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                self._fill_cache()
+                return
+        contents, self._path_files = index
+        self._set_path_cache(contents)
+
+    def _set_path_cache(self, contents):
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -17,6 +17,7 @@ from configparser import ConfigParser
 from contextlib import suppress
 from importlib import import_module
 from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder
 from itertools import starmap
 
 
@@ -238,7 +239,7 @@ class Distribution:
     @property
     def entry_points(self):
         return EntryPoint._from_text(
-            self.read_text(f'entry_point{os.extsep}txt'))
+            self.read_text(f'entry_points{os.extsep}txt'))
 
     @property
     def files(self):
@@ -287,7 +288,7 @@ class Distribution:
         return self.metadata.get_all('Requires-Dist')
 
     def _read_egg_info_reqs(self):
-        source = self.read_text(f'requires{ox.extsep}txt')
+        source = self.read_text(f'requires{os.extsep}txt')
         return source and self._deps_from_requires_text(source)
 
     @classmethod
@@ -388,8 +389,19 @@ class FastPath:
     """
     Micro-optimized class for searching a path for
     children.
+
+    Instances are shared by root, and the names found in the root are
+    indexed by distribution name the first time it is searched.  The index
+    is rebuilt when the modification time of the root changes.
     """
 
+    _mtime = None
+    _lookup = None
+
+    @functools.lru_cache()  # type: ignore
+    def __new__(cls, root):
+        return super().__new__(cls)
+
     def __init__(self, root):
         self.root = root
         self.base = os.path.basename(root).lower()
@@ -414,22 +426,55 @@ class FastPath:
             for child in names
             )
 
-    def is_egg(self, search):
-        base = self.base
-        return (
-            base == search.versionless_egg_name
-            or base.startswith(search.prefix)
-            and base.endswith('.egg'))
+    @property
+    def mtime(self):
+        """The modification time of the root, or None if it can't be read."""
+        with suppress(OSError):
+            return os.stat(self.root).st_mtime
+        return None
+
+    def lookup(self):
+        """Return the index of the root, rebuilding it if it is stale."""
+        mtime = self.mtime
+        if mtime is None or mtime != self._mtime or self._lookup is None:
+            self._lookup = Lookup(self)
+            self._mtime = mtime
+        return self._lookup
 
     def search(self, name):
-        for child in self.children():
-            n_low = child.lower()
-            if (n_low in name.exact_matches
-                    or n_low.startswith(name.prefix)
-                    and n_low.endswith(name.suffixes)
-                    # legacy case:
-                    or self.is_egg(name) and n_low == 'egg-info'):
-                yield self.joinpath(child)
+        return self.lookup().search(name)
+
+
+class Lookup:
+    """
+    The metadata directories found in a FastPath, by normalized name.
+    """
+
+    def __init__(self, path):
+        base = path.base
+        # An egg named like "name-version.egg" with an "EGG-INFO" directory.
+        egg_name = None
+        if base.endswith('.egg'):
+            egg_name = base.rpartition('.')[0].partition('-')[0]
+        self.all = []
+        self.by_name = collections.defaultdict(list)
+        for child in path.children():
+            low = child.lower()
+            if low.endswith(Prepared.suffixes):
+                # The name is what precedes the version, if any.
+                name = low.rpartition('.')[0].partition('-')[0]
+            elif egg_name is not None and low == 'egg-info':
+                name = egg_name
+            else:
+                continue
+            found = path.joinpath(child)
+            self.all.append(found)
+            self.by_name[name].append(found)
+
+    def search(self, prepared):
+        if prepared.name is None:
+            return iter(self.all)
+        return iter(self.by_name.get(prepared.normalized, ()))
 
 
 class Prepared:
@@ -475,6 +520,13 @@ class MetadataPathFinder(DistributionFinder):
             for path in map(FastPath, paths)
             )
 
+    @classmethod
+    def invalidate_caches(cls):
+        """Forget the directories indexed by previous searches."""
+        global _entry_point_index
+        FastPath.__new__.cache_clear()
+        _entry_point_index = None
+
 
 class PathDistribution(Distribution):
     def __init__(self, path):
@@ -531,20 +583,79 @@ def version(distribution_name):
     return distribution(distribution_name).version
 
 
-def entry_points():
+class _EntryPointIndex:
+    """
+    The entry points of the distributions found on sys.path.
+
+    The index is valid while sys.path and the modification times of its
+    entries are unchanged, and the only distribution finder on
+    sys.meta_path is the one for sys.path.
+    """
+
+    def __init__(self, key, dists):
+        self.key = key
+        eps = itertools.chain.from_iterable(
+            dist.entry_points for dist in dists)
+        by_group = operator.attrgetter('group')
+        ordered = sorted(eps, key=by_group)
+        grouped = itertools.groupby(ordered, by_group)
+        self.by_group = {
+            group: tuple(eps)
+            for group, eps in grouped
+            }
+        self.by_name = {}
+        for eps in self.by_group.values():
+            for ep in eps:
+                self.by_name.setdefault(ep.name, []).append(ep)
+
+    def select(self, group=None, name=None):
+        if group is None:
+            return tuple(self.by_name.get(name, ()))
+        eps = self.by_group.get(group, ())
+        if name is not None:
+            eps = tuple(ep for ep in eps if ep.name == name)
+        return eps
+
+
+_entry_point_index = None
+
+
+def _cache_key():
+    """Return the key validating the index of sys.path, or None."""
+    for finder in sys.meta_path:
+        if (hasattr(finder, 'find_distributions')
+                and finder not in (PathFinder, MetadataPathFinder)):
+            return None
+    paths = tuple(sys.path)
+    return paths, tuple(FastPath(path).mtime for path in paths)
+
+
+def _get_entry_point_index():
+    global _entry_point_index
+    key = _cache_key()
+    index = _entry_point_index
+    if key is None or index is None or index.key != key:
+        index = _EntryPointIndex(key, distributions())
+        if key is not None:
+            _entry_point_index = index
+    return index
+
+
+def entry_points(*, group=None, name=None):
     """Return EntryPoint objects for all installed packages.
 
-    :return: EntryPoint objects for all installed packages.
+    The entry points of the packages found on ``sys.path`` are cached until
+    ``sys.path`` or one of its directories changes.
+
+    :param group: If given, only return the entry points in this group.
+    :param name: If given, only return the entry points with this name.
+    :return: A dict of tuples of EntryPoint objects by group, or if group
+        or name is given, a tuple of the matching EntryPoint objects.
     """
-    eps = itertools.chain.from_iterable(
-        dist.entry_points for dist in distributions())
-    by_group = operator.attrgetter('group')
-    ordered = sorted(eps, key=by_group)
-    grouped = itertools.groupby(ordered, by_group)
-    return {
-        group: tuple(eps)
-        for group, eps in grouped
-        }
+    index = _get_entry_point_index()
+    if group is None and name is None:
+        return dict(index.by_group)
+    return index.select(group, name)
 
 
 def files(distribution_name):
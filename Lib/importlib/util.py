@@ -1,10 +1,13 @@
 """Utility code for constructing importers, etc."""
 from . import abc
+from . import _bootstrap
 from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import SourceFileLoader
+from ._bootstrap_external import SourcelessFileLoader
 from ._bootstrap_external import _RAW_MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
@@ -13,6 +16,7 @@ from ._bootstrap_external import spec_from_file_location
 
 from contextlib import contextmanager
 import _imp
+import _thread
 import functools
 import sys
 import types
@@ -222,37 +226,68 @@ class _LazyModule(types.ModuleType):
 
     def __getattribute__(self, attr):
         """Trigger the load of the module and return the attribute."""
-        # All module metadata must be garnered from __spec__ in order to avoid
-        # using mutated values.
-        # Stop triggering this method.
-        self.__class__ = types.ModuleType
-        # Get the original name to make sure no object substitution occurred
-        # in sys.modules.
-        original_name = self.__spec__.name
-        # Figure out exactly what attributes were mutated between the creation
-        # of the module and now.
-        attrs_then = self.__spec__.loader_state['__dict__']
-        original_type = self.__spec__.loader_state['__class__']
-        attrs_now = self.__dict__
-        attrs_updated = {}
-        for key, value in attrs_now.items():
-            # Code that set the attribute may have kept a reference to the
-            # assigned object, making identity more important than equality.
-            if key not in attrs_then:
-                attrs_updated[key] = value
-            elif id(attrs_now[key]) != id(attrs_then[key]):
-                attrs_updated[key] = value
-        self.__spec__.loader.exec_module(self)
-        # If exec_module() was used directly there is no guarantee the module
-        # object was put into sys.modules.
-        if original_name in sys.modules:
-            if id(self) != id(sys.modules[original_name]):
-                raise ValueError(f"module object for {original_name!r} "
-                                  "substituted in sys.modules during a lazy "
-                                  "load")
-        # Update after loading since that's what would happen in an eager
-        # loading situation.
-        self.__dict__.update(attrs_updated)
+        __spec__ = object.__getattribute__(self, '__spec__')
+        loader_state = __spec__.loader_state
+        with loader_state['lock']:
+            # Only the first thread to get the lock triggers the load and
+            # resets the class of the module; the others then use getattr().
+            if object.__getattribute__(self, '__class__') is _LazyModule:
+                # A failed load is reported again on every access.
+                if loader_state['exception'] is not None:
+                    exc, tb = loader_state['exception']
+                    raise exc.with_traceback(tb)
+                __class__ = loader_state['__class__']
+                # Reentrant calls from the loading thread, made by
+                # exec_module() or by circular imports, get the module as
+                # loaded so far.
+                if loader_state['is_loading']:
+                    return __class__.__getattribute__(self, attr)
+                loader_state['is_loading'] = True
+                __dict__ = __class__.__getattribute__(self, '__dict__')
+                # All module metadata must be garnered from __spec__ in order
+                # to avoid using mutated values.
+                # Get the original name and entry to make sure no object
+                # substitution occurred in sys.modules during the load.
+                original_name = __spec__.name
+                original_module = sys.modules.get(original_name)
+                # Figure out exactly what attributes were mutated between the
+                # creation of the module and now.
+                attrs_then = loader_state['__dict__']
+                attrs_now = __dict__
+                attrs_updated = {}
+                for key, value in attrs_now.items():
+                    # Code that set the attribute may have kept a reference to
+                    # the assigned object, making identity more important than
+                    # equality.
+                    if key not in attrs_then:
+                        attrs_updated[key] = value
+                    elif id(attrs_now[key]) != id(attrs_then[key]):
+                        attrs_updated[key] = value
+                try:
+                    __spec__.loader.exec_module(self)
+                except BaseException as exc:
+                    loader_state['exception'] = exc, exc.__traceback__
+                    # Like an eager import, drop the half-executed module.
+                    if sys.modules.get(original_name) is self:
+                        del sys.modules[original_name]
+                    raise
+                finally:
+                    loader_state['is_loading'] = False
+                # If exec_module() was used directly there is no guarantee the
+                # module object was put into sys.modules.  The entry may also
+                # have been replaced before the load, e.g. by
+                # test.support.import_fresh_module(), which is fine.
+                current_module = sys.modules.get(original_name, original_module)
+                if (current_module is not original_module
+                        and current_module is not self):
+                    raise ValueError(f"module object for {original_name!r} "
+                                      "substituted in sys.modules during a lazy "
+                                      "load")
+                # Update after loading since that's what would happen in an
+                # eager loading situation.
+                __dict__.update(attrs_updated)
+                # Stop triggering this method.
+                self.__class__ = __class__
         return getattr(self, attr)
 
     def __delattr__(self, attr):
@@ -296,5 +331,54 @@ class LazyLoader(abc.Loader):
         loader_state = {}
         loader_state['__dict__'] = module.__dict__.copy()
         loader_state['__class__'] = module.__class__
+        loader_state['lock'] = _thread.RLock()
+        loader_state['is_loading'] = False
+        loader_state['exception'] = None
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class _LazyImports:
+
+    """Make the loaders of the selected modules lazy.
+
+    Called by _bootstrap._find_and_load() with the spec of each module it is
+    about to load.
+    """
+
+    def __init__(self, allow, deny):
+        self.allow = None if allow is None else tuple(allow)
+        self.deny = tuple(deny)
+
+    @staticmethod
+    def _matches(name, names):
+        return any(name == other or name.startswith(other + '.')
+                   for other in names)
+
+    def __call__(self, spec):
+        name = spec.name
+        # Only the code of source and bytecode modules can be deferred:
+        # extension modules are initialized when they are created.
+        if (name != '__main__'
+                and isinstance(spec.loader, (SourceFileLoader,
+                                             SourcelessFileLoader))
+                and (self.allow is None or self._matches(name, self.allow))
+                and not self._matches(name, self.deny)):
+            spec.loader = LazyLoader(spec.loader)
+        return spec
+
+
+def enable_lazy_imports(allow=None, deny=()):
+    """Make the modules imported from now on load lazily.
+
+    Source and bytecode modules found by the import system are then only
+    executed on first attribute access.  If allow is not None, only the
+    modules it names are lazy; the modules named by deny never are.  A name
+    also selects the submodules of a package.
+    """
+    _bootstrap._lazy_imports = _LazyImports(allow, deny)
+
+
+def disable_lazy_imports():
+    """Make the modules imported from now on load eagerly again."""
+    _bootstrap._lazy_imports = None
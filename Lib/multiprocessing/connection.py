@@ -34,6 +34,12 @@ except ImportError:
         raise
     _winapi = None
 
+try:
+    import fcntl
+    from termios import FIONREAD
+except ImportError:
+    fcntl = None
+
 #
 #
 #
@@ -44,6 +50,17 @@ CONNECTION_TIMEOUT = 20.
 
 _mmap_counter = itertools.count()
 
+# Prefix of the message announcing an object sent with out-of-band buffers;
+# no pickle starts with a null byte.
+_OUT_OF_BAND = b'\x00oob'
+
+# Minimum size of the bytes, bytearray and PickleBuffer objects sent
+# out-of-band by send(obj, out_of_band=True)
+_OUT_OF_BAND_THRESHOLD = 16384
+
+# Maximum number of buffers passed to os.writev() at once
+_IOV_MAX = 1024
+
 default_family = 'AF_INET'
 families = ['AF_INET']
 
@@ -199,11 +216,44 @@ class _ConnectionBase:
             raise ValueError("buffer length < offset + size")
         self._send_bytes(m[offset:offset + size])
 
-    def send(self, obj):
-        """Send a (picklable) object"""
+    def send(self, obj, *, out_of_band=False):
+        """Send a (picklable) object
+
+        If out_of_band is true, obj is pickled with protocol 5 and its large
+        buffers are sent after the pickle instead of being copied into it.
+        """
+        self._check_closed()
+        self._check_writable()
+        if not out_of_band:
+            self._send_bytes(_ForkingPickler.dumps(obj))
+            return
+        buffers = []
+
+        def buffer_callback(buffer):
+            try:
+                raw = buffer.raw()
+            except BufferError:
+                return True  # Not contiguous
+            if raw.nbytes < _OUT_OF_BAND_THRESHOLD:
+                return True
+            buffers.append(raw)
+            return False
+
+        file = io.BytesIO()
+        reduction._BufferPickler(file, _OUT_OF_BAND_THRESHOLD,
+                                 buffer_callback).dump(obj)
+        if not buffers:
+            self._send_bytes(file.getbuffer())
+            return
+        header = _OUT_OF_BAND + struct.pack("!i", len(buffers))
+        self._send_bytes_many([header, file.getbuffer()] + buffers)
+
+    def _send_bytes_many(self, bufs):
+        """Send each bytes object of bufs as a message"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        for buf in bufs:
+            self._send_bytes(buf)
 
     def recv_bytes(self, maxlength=None):
         """
@@ -218,6 +268,15 @@ class _ConnectionBase:
             self._bad_message_length()
         return buf.getvalue()
 
+    def _recv_bytes_many(self, maxcount):
+        """Receive up to maxcount messages available without blocking"""
+        self._check_closed()
+        self._check_readable()
+        messages = []
+        while len(messages) < maxcount and self._poll(0.0):
+            messages.append(self._recv_bytes().getvalue())
+        return messages
+
     def recv_bytes_into(self, buf, offset=0):
         """
         Receive bytes data into a writeable bytes-like object.
@@ -243,12 +302,59 @@ class _ConnectionBase:
                               (offset + size) // itemsize])
             return size
 
-    def recv(self):
-        """Receive a (picklable) object"""
+    def recv(self, *, buffer_factory=None):
+        """Receive a (picklable) object
+
+        The out-of-band buffers of an object sent with out_of_band=True are
+        received into buffer_factory(size), which must return a writable
+        bytes-like object of at least size bytes, or into new bytearrays.
+        If it returns a shorter object, BufferTooShort is raised with the
+        object, received with a new bytearray instead, as argument.
+        """
         self._check_closed()
         self._check_readable()
         buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        data = buf.getbuffer()
+        if data[:len(_OUT_OF_BAND)] != _OUT_OF_BAND:
+            return _ForkingPickler.loads(data)
+        count, = struct.unpack_from("!i", data, len(_OUT_OF_BAND))
+        del data
+        file = self._recv_bytes()
+        file.seek(0)
+        buffers = []
+        too_short = False
+        for i in range(count):
+            try:
+                buffers.append(self._recv_buffer(buffer_factory))
+            except BufferTooShort as e:
+                # Receive the other buffers too, keeping the stream in sync
+                buffers.append(e.args[0])
+                too_short = True
+        obj = reduction._BufferUnpickler(file, buffers=buffers).load()
+        if too_short:
+            raise BufferTooShort(obj)
+        return obj
+
+    @staticmethod
+    def _factory_buffer(buffer_factory, size):
+        """Return buffer_factory(size) as a memoryview of size bytes, or
+        None if it is too short"""
+        buf = memoryview(buffer_factory(size)).cast('B')
+        if len(buf) < size:
+            return None
+        return buf[:size]
+
+    def _recv_buffer(self, buffer_factory):
+        """Receive a message into a new buffer"""
+        data = self._recv_bytes().getbuffer()
+        size = len(data)
+        if buffer_factory is None:
+            return bytearray(data)
+        buf = self._factory_buffer(buffer_factory, size)
+        if buf is None:
+            raise BufferTooShort(bytearray(data))
+        buf[:] = data
+        return buf
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -356,11 +462,14 @@ class Connection(_ConnectionBase):
             _close(self._handle)
         _write = _multiprocessing.send
         _read = _multiprocessing.recv
+        _writev = _readv = None
     else:
         def _close(self, _close=os.close):
             _close(self._handle)
         _write = os.write
         _read = os.read
+        _writev = getattr(os, 'writev', None)
+        _readv = getattr(os, 'readv', None)
 
     def _send(self, buf, write=_write):
         remaining = len(buf)
@@ -371,6 +480,24 @@ class Connection(_ConnectionBase):
                 break
             buf = buf[n:]
 
+    def _sendv(self, bufs, writev=_writev):
+        """Send the bytes-like objects of bufs with scatter-gather writes"""
+        if writev is None:
+            for buf in bufs:
+                self._send(buf)
+            return
+        bufs = [memoryview(buf).cast('B') for buf in bufs]
+        while bufs:
+            n = writev(self._handle, bufs[:_IOV_MAX])
+            for i, buf in enumerate(bufs):
+                if n < len(buf):
+                    bufs = bufs[i:]
+                    bufs[0] = buf[n:]
+                    break
+                n -= len(buf)
+            else:
+                break
+
     def _recv(self, size, read=_read):
         buf = io.BytesIO()
         handle = self._handle
@@ -387,22 +514,44 @@ class Connection(_ConnectionBase):
             remaining -= n
         return buf
 
+    def _recv_into(self, buf, read=_read, readv=_readv):
+        """Fill the writable memoryview buf with the data read"""
+        handle = self._handle
+        size = len(buf)
+        pos = 0
+        while pos < size:
+            if readv is not None:
+                n = readv(handle, [buf[pos:]])
+            else:
+                chunk = read(handle, size - pos)
+                n = len(chunk)
+                buf[pos:pos + n] = chunk
+            if n == 0:
+                if pos == 0:
+                    raise EOFError
+                else:
+                    raise OSError("got end of file during message")
+            pos += n
+
+    @staticmethod
+    def _header(n):
+        if n > 0x7fffffff:
+            return struct.pack("!iQ", -1, n)
+        # For wire compatibility with 3.7 and lower
+        return struct.pack("!i", n)
+
     def _send_bytes(self, buf):
         n = len(buf)
         if n > 0x7fffffff:
-            pre_header = struct.pack("!i", -1)
-            header = struct.pack("!Q", n)
-            self._send(pre_header)
-            self._send(header)
-            self._send(buf)
+            self._sendv([self._header(n), buf])
         else:
             # For wire compatibility with 3.7 and lower
             header = struct.pack("!i", n)
             if n > 16384:
                 # The payload is large so Nagle's algorithm won't be triggered
-                # and we'd better avoid the cost of concatenation.
-                self._send(header)
-                self._send(buf)
+                # and we'd better avoid the cost of concatenation: the header
+                # and the payload go in a single scatter-gather write.
+                self._sendv([header, buf])
             else:
                 # Issue #20540: concatenate before sending, to avoid delays due
                 # to Nagle's algorithm on a TCP socket.
@@ -410,16 +559,104 @@ class Connection(_ConnectionBase):
                 # to avoid "broken pipe" errors if the other end closed the pipe.
                 self._send(header + buf)
 
-    def _recv_bytes(self, maxsize=None):
+    def _send_bytes_many(self, bufs):
+        """Send each bytes object of bufs as a message"""
+        self._check_closed()
+        self._check_writable()
+        # Send all the messages with a single write: the reader sees the
+        # same messages as if they were sent one by one.
+        if self._writev is not None:
+            frames = []
+            for buf in bufs:
+                frames.append(self._header(len(buf)))
+                frames.append(buf)
+            self._sendv(frames)
+            return
+        # Without scatter-gather writes, concatenate the small messages.
+        frames = []
+        for buf in bufs:
+            n = len(buf)
+            if n > 16384:
+                if frames:
+                    self._send(b''.join(frames))
+                    frames.clear()
+                self._send_bytes(buf)
+            else:
+                frames.append(struct.pack("!i", n))
+                frames.append(buf)
+        if frames:
+            self._send(b''.join(frames))
+
+    def _recv_size(self):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
         if size == -1:
             buf = self._recv(8)
             size, = struct.unpack("!Q", buf.getvalue())
+        return size
+
+    def _recv_bytes(self, maxsize=None):
+        size = self._recv_size()
         if maxsize is not None and size > maxsize:
             return None
         return self._recv(size)
 
+    if fcntl is not None:
+        def _recv_bytes_many(self, maxcount):
+            """Receive up to maxcount messages available without blocking"""
+            self._check_closed()
+            self._check_readable()
+            messages = []
+            # Ask for the number of bytes available once per burst of
+            # messages rather than polling before each of them
+            available = 0
+            while len(messages) < maxcount:
+                if available <= 0:
+                    available, = struct.unpack(
+                        "i", fcntl.ioctl(self._handle, FIONREAD, b"\0" * 4))
+                    if not available:
+                        break
+                buf = self._recv_bytes().getvalue()
+                messages.append(buf)
+                available -= len(self._header(len(buf))) + len(buf)
+            return messages
+
+    def recv_bytes_into(self, buf, offset=0):
+        """
+        Receive bytes data into a writeable bytes-like object.
+        Return the number of bytes read.
+        """
+        self._check_closed()
+        self._check_readable()
+        with memoryview(buf) as m:
+            bytesize = m.nbytes
+            if offset < 0:
+                raise ValueError("negative offset")
+            elif offset > bytesize:
+                raise ValueError("offset too large")
+            size = self._recv_size()
+            if bytesize < offset + size:
+                raise BufferTooShort(self._recv(size).getvalue())
+            # Message can fit in dest: read it there directly
+            with m.cast('B') as b:
+                self._recv_into(b[offset:offset + size])
+            return size
+
+    def _recv_buffer(self, buffer_factory):
+        """Receive a message into a new buffer, without copying it"""
+        size = self._recv_size()
+        if buffer_factory is not None:
+            buf = self._factory_buffer(buffer_factory, size)
+            if buf is not None:
+                self._recv_into(buf)
+                return buf
+        result = bytearray(size)
+        self._recv_into(memoryview(result))
+        if buffer_factory is not None:
+            # Received anyway, keeping the stream in sync
+            raise BufferTooShort(result)
+        return result
+
     def _poll(self, timeout):
         r = wait([self], timeout)
         return bool(r)
@@ -113,11 +113,15 @@ class BaseContext(object):
         return SimpleQueue(ctx=self.get_context())
 
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, *, shared_memory_threshold=None,
+             max_memory_per_child=None, forkserver_preload=None):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(),
+                    shared_memory_threshold=shared_memory_threshold,
+                    max_memory_per_child=max_memory_per_child,
+                    forkserver_preload=forkserver_preload)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
@@ -213,6 +217,11 @@ class BaseContext(object):
     def _check_available(self):
         pass
 
+    def _preload(self, module_names):
+        '''Import modules in advance for the processes started by the
+        context, where the start method allows it.'''
+        pass
+
 #
 # Type of default context -- underlying context can be set at most once
 #
@@ -304,6 +313,9 @@ if sys.platform != 'win32':
         def _check_available(self):
             if not reduction.HAVE_SEND_HANDLE:
                 raise ValueError('forkserver start method not available')
+        def _preload(self, module_names):
+            from .forkserver import _forkserver
+            _forkserver._add_preload(module_names)
 
     _concrete_contexts = {
         'fork': ForkContext(),
@@ -61,10 +61,25 @@ class ForkServer(object):
 
     def set_forkserver_preload(self, modules_names):
         '''Set list of module names to try to load in forkserver process.'''
-        if not all(type(mod) is str for mod in self._preload_modules):
+        if not all(type(mod) is str for mod in modules_names):
             raise TypeError('module_names must be a list of strings')
         self._preload_modules = modules_names
 
+    def _add_preload(self, modules_names):
+        '''Add module names to the list to load in forkserver process.
+
+        Unlike set_forkserver_preload(), the list is left unchanged if the
+        forkserver process is running already, since it would have no effect.
+        '''
+        if not all(type(mod) is str for mod in modules_names):
+            raise TypeError('module_names must be a list of strings')
+        with self._lock:
+            if self._forkserver_pid is not None:
+                return
+            modules = list(self._preload_modules)
+            modules.extend(mod for mod in modules_names if mod not in modules)
+            self._preload_modules = modules
+
     def get_inherited_fds(self):
         '''Return list of fds inherited from parent process.
 
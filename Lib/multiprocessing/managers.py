@@ -17,6 +17,8 @@ __all__ = [ 'BaseManager', 'SyncManager', 'BaseProxy', 'Token',
 
 import sys
 import threading
+import contextlib
+import functools
 import signal
 import array
 import queue
@@ -25,6 +27,7 @@ import os
 from os import getpid
 
 from traceback import format_exc
+from concurrent.futures import Future
 
 from . import connection
 from .context import reduction, get_spawning_popen, ProcessError
@@ -234,64 +237,24 @@ class Server(object):
 
         recv = conn.recv
         send = conn.send
-        id_to_obj = self.id_to_obj
 
         while not self.stop_event.is_set():
 
             try:
-                methodname = obj = None
                 request = recv()
                 ident, methodname, args, kwds = request
-                try:
-                    obj, exposed, gettypeid = id_to_obj[ident]
-                except KeyError as ke:
-                    try:
-                        obj, exposed, gettypeid = \
-                            self.id_to_local_proxy_obj[ident]
-                    except KeyError as second_ke:
-                        raise ke
-
-                if methodname not in exposed:
-                    raise AttributeError(
-                        'method %r of %r object is not in exposed=%r' %
-                        (methodname, type(obj), exposed)
-                        )
-
-                function = getattr(obj, methodname)
-
-                try:
-                    res = function(*args, **kwds)
-                except Exception as e:
-                    msg = ('#ERROR', e)
-                else:
-                    typeid = gettypeid and gettypeid.get(methodname, None)
-                    if typeid:
-                        rident, rexposed = self.create(conn, typeid, res)
-                        token = Token(typeid, self.address, rident)
-                        msg = ('#PROXY', (rexposed, token))
-                    else:
-                        msg = ('#RETURN', res)
-
-            except AttributeError:
-                if methodname is None:
-                    msg = ('#TRACEBACK', format_exc())
-                else:
-                    try:
-                        fallback_func = self.fallback_mapping[methodname]
-                        result = fallback_func(
-                            self, conn, ident, obj, *args, **kwds
-                            )
-                        msg = ('#RETURN', result)
-                    except Exception:
-                        msg = ('#TRACEBACK', format_exc())
-
             except EOFError:
                 util.debug('got EOF -- exiting thread serving %r',
                            threading.current_thread().name)
                 sys.exit(0)
-
             except Exception:
                 msg = ('#TRACEBACK', format_exc())
+            else:
+                if ident is None and methodname == '#BATCH':
+                    msg = ('#BATCH', [self.serve_call(conn, *call)
+                                      for call in args])
+                else:
+                    msg = self.serve_call(conn, ident, methodname, args, kwds)
 
             try:
                 try:
@@ -306,6 +269,66 @@ class Server(object):
                 conn.close()
                 sys.exit(1)
 
+    def serve_call(self, conn, ident, methodname, args, kwds):
+        '''
+        Call a method of a shared object and return the message to send back
+        '''
+        obj = None
+        try:
+            try:
+                obj, exposed, gettypeid = self.id_to_obj[ident]
+            except KeyError as ke:
+                try:
+                    obj, exposed, gettypeid = \
+                        self.id_to_local_proxy_obj[ident]
+                except KeyError as second_ke:
+                    raise ke
+
+            if methodname in self.item_methods:
+                function, required = self.item_methods[methodname]
+                if required not in exposed:
+                    raise AttributeError(
+                        'method %r of %r object is not in exposed=%r' %
+                        (required, type(obj), exposed)
+                        )
+                function = functools.partial(function, obj)
+            else:
+                if methodname not in exposed:
+                    raise AttributeError(
+                        'method %r of %r object is not in exposed=%r' %
+                        (methodname, type(obj), exposed)
+                        )
+
+                function = getattr(obj, methodname)
+
+            try:
+                res = function(*args, **kwds)
+            except Exception as e:
+                msg = ('#ERROR', e)
+            else:
+                typeid = gettypeid and gettypeid.get(methodname, None)
+                if typeid:
+                    rident, rexposed = self.create(conn, typeid, res)
+                    token = Token(typeid, self.address, rident)
+                    msg = ('#PROXY', (rexposed, token))
+                else:
+                    msg = ('#RETURN', res)
+
+        except AttributeError:
+            try:
+                fallback_func = self.fallback_mapping[methodname]
+                result = fallback_func(
+                    self, conn, ident, obj, *args, **kwds
+                    )
+                msg = ('#RETURN', result)
+            except Exception:
+                msg = ('#TRACEBACK', format_exc())
+
+        except Exception:
+            msg = ('#TRACEBACK', format_exc())
+
+        return msg
+
     def fallback_getvalue(self, conn, ident, obj):
         return obj
 
@@ -321,6 +344,21 @@ class Server(object):
         '#GETVALUE':fallback_getvalue
         }
 
+    def getitems(obj, keys):
+        return [obj[key] for key in keys]
+
+    def setitems(obj, items):
+        for key, value in items:
+            obj[key] = value
+
+    # Methods run on behalf of any shared object exposing the second item
+    item_methods = {
+        '#GETITEMS': (getitems, '__getitem__'),
+        '#SETITEMS': (setitems, '__setitem__'),
+        }
+
+    del getitems, setitems
+
     def dummy(self, c):
         pass
 
@@ -748,6 +786,45 @@ class BaseManager(object):
             temp.__name__ = typeid
             setattr(cls, typeid, temp)
 
+#
+# Future of a queued call of a method of a proxy's referent
+#
+
+class _CallFuture(Future):
+    '''
+    Future whose result()/exception() send the calls queued by the thread
+    '''
+    def __init__(self, proxy):
+        super().__init__()
+        self._proxy = proxy
+        self._thread = threading.get_ident()
+
+    def _flush(self):
+        proxy = self._proxy
+        if proxy is not None and not self.done():
+            # Only the thread which queued the call can send it: another
+            # thread would wait forever.
+            if threading.get_ident() != self._thread:
+                raise RuntimeError('the call was queued by another thread '
+                                   'and is not sent yet')
+            proxy._flush()
+
+    def result(self, timeout=None):
+        self._flush()
+        return super().result(timeout)
+
+    def exception(self, timeout=None):
+        self._flush()
+        return super().exception(timeout)
+
+    def set_result(self, result):
+        self._proxy = None
+        super().set_result(result)
+
+    def set_exception(self, exception):
+        self._proxy = None
+        super().set_exception(exception)
+
 #
 # Subclass of set which get cleared after a fork
 #
@@ -769,6 +846,16 @@ class BaseProxy(object):
     _address_to_local = {}
     _mutex = util.ForkAwareThreadLock()
 
+    # Number of queued calls sent together without waiting for a result
+    _max_pending = 256
+
+    # Special methods queued by _pipeline(), which return any value; the
+    # others must return a value of a given type, or are used as a
+    # condition, so they are called synchronously.
+    _pipelined_special_methods = frozenset({
+        '__getitem__', '__setitem__', '__delitem__',
+        '__getattribute__', '__setattr__', '__delattr__'})
+
     def __init__(self, token, serializer, manager=None,
                  authkey=None, exposed=None, incref=True, manager_owned=False):
         with BaseProxy._mutex:
@@ -823,6 +910,16 @@ class BaseProxy(object):
         '''
         Try to call a method of the referent and return a copy of the result
         '''
+        if getattr(self._tls, 'pending', None) is not None:
+            # Queued calls must be sent first: send this one with them.
+            future = self._callmethod_async(methodname, args, kwds)
+            if self._tls.pipelined and (
+                    not (methodname.startswith('__') and
+                         methodname.endswith('__')) or
+                    methodname in self._pipelined_special_methods):
+                return future
+            return future.result()
+
         try:
             conn = self._tls.connection
         except AttributeError:
@@ -833,7 +930,9 @@ class BaseProxy(object):
 
         conn.send((self._id, methodname, args, kwds))
         kind, result = conn.recv()
+        return self._convert_result(kind, result)
 
+    def _convert_result(self, kind, result):
         if kind == '#RETURN':
             return result
         elif kind == '#PROXY':
@@ -849,6 +948,74 @@ class BaseProxy(object):
             return proxy
         raise convert_to_error(kind, result)
 
+    def _callmethod_async(self, methodname, args=(), kwds={}):
+        '''
+        Queue a call of a method of the referent and return a future
+        '''
+        tls = self._tls
+        if getattr(tls, 'pending', None) is None:
+            tls.pending = []
+            tls.pipelined = 0
+        future = _CallFuture(self)
+        future.set_running_or_notify_cancel()
+        tls.pending.append(((self._id, methodname, args, kwds), self, future))
+        if len(tls.pending) >= self._max_pending:
+            self._flush()
+        return future
+
+    def _flush(self):
+        '''
+        Send the calls queued by this thread in one message and set their
+        futures
+        '''
+        tls = self._tls
+        pending = getattr(tls, 'pending', None)
+        if not pending:
+            return
+        tls.pending = [] if tls.pipelined else None
+        try:
+            try:
+                conn = tls.connection
+            except AttributeError:
+                self._connect()
+                conn = tls.connection
+            conn.send((None, '#BATCH', [call for call, _, _ in pending], {}))
+            kind, results = conn.recv()
+        except BaseException as e:
+            for _, _, future in pending:
+                future.set_exception(e)
+            if isinstance(e, Exception):
+                return
+            raise
+        if kind != '#BATCH':
+            results = [(kind, results)] * len(pending)
+        for (_, proxy, future), (kind, result) in zip(pending, results):
+            try:
+                result = proxy._convert_result(kind, result)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    @contextlib.contextmanager
+    def _pipeline(self):
+        '''
+        Context manager queueing the method calls made by this thread
+        through the proxies of the manager; the calls return futures
+        '''
+        tls = self._tls
+        if getattr(tls, 'pending', None) is None:
+            tls.pending = []
+            tls.pipelined = 0
+        tls.pipelined += 1
+        try:
+            yield self
+        finally:
+            tls.pipelined -= 1
+            if not tls.pipelined:
+                self._flush()
+                tls.pending = None
+
     def _getvalue(self):
         '''
         Get a copy of the value of the referent
@@ -1170,13 +1337,24 @@ class ListProxy(BaseListProxy):
     def __imul__(self, value):
         self._callmethod('__imul__', (value,))
         return self
+    def get_many(self, indices):
+        return self._callmethod('#GETITEMS', (list(indices),))
+    def set_many(self, items):
+        return self._callmethod('#SETITEMS', (list(items),))
 
 
-DictProxy = MakeProxyType('DictProxy', (
+BaseDictProxy = MakeProxyType('BaseDictProxy', (
     '__contains__', '__delitem__', '__getitem__', '__iter__', '__len__',
     '__setitem__', 'clear', 'copy', 'get', 'items',
     'keys', 'pop', 'popitem', 'setdefault', 'update', 'values'
     ))
+class DictProxy(BaseDictProxy):
+    def get_many(self, keys):
+        return self._callmethod('#GETITEMS', (list(keys),))
+    def set_many(self, items):
+        if hasattr(items, 'keys'):
+            items = items.items()
+        return self._callmethod('#SETITEMS', (list(items),))
 DictProxy._method_to_typeid_ = {
     '__iter__': 'Iterator',
     }
@@ -1402,3 +1580,28 @@ if HAS_SHMEM:
                     sl.shm.unlink()
                     raise e
             return sl
+
+        def ShareableArray(self, typecode, size_or_initializer):
+            """Returns a new ShareableArray instance of the specified typecode
+            and size or initial values, to be tracked by the manager."""
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sa = shared_memory.ShareableArray(typecode,
+                                                  size_or_initializer)
+                try:
+                    dispatch(conn, None, 'track_segment', (sa.shm.name,))
+                except BaseException as e:
+                    sa.shm.unlink()
+                    raise e
+            return sa
+
+        def ShareableDict(self, mapping=None, **kwargs):
+            """Returns a new ShareableDict instance populated with the items
+            of the input mapping, to be tracked by the manager."""
+            with self._Client(self._address, authkey=self._authkey) as conn:
+                sd = shared_memory.ShareableDict(mapping, **kwargs)
+                try:
+                    dispatch(conn, None, 'track_segment', (sd.shm.name,))
+                except BaseException as e:
+                    sd.shm.unlink()
+                    raise e
+            return sd
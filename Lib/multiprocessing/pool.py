@@ -95,10 +95,12 @@ class MaybeEncodingError(Exception):
 
 
 def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
-           wrap_exception=False):
+           wrap_exception=False, shm_threshold=None, max_memory=None):
     if (maxtasks is not None) and not (isinstance(maxtasks, int)
                                        and maxtasks >= 1):
         raise AssertionError("Maxtasks {!r} is not valid".format(maxtasks))
+    if shm_threshold is not None:
+        from .shared_memory import _SharedMemoryPickle
     put = outqueue.put
     get = inqueue.get
     if hasattr(inqueue, '_writer'):
@@ -123,6 +125,8 @@ def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
         job, i, func, args, kwds = task
         try:
             result = (True, func(*args, **kwds))
+            if shm_threshold is not None:
+                result = (True, _SharedMemoryPickle(result[1], shm_threshold))
         except Exception as e:
             if wrap_exception and func is not _helper_reraises_exception:
                 e = ExceptionWithTraceback(e, e.__traceback__)
@@ -137,6 +141,11 @@ def worker(inqueue, outqueue, initializer=None, initargs=(), maxtasks=None,
 
         task = job = result = func = args = kwds = None
         completed += 1
+        if max_memory is not None:
+            rss = util._resident_memory()
+            if rss is not None and rss > max_memory:
+                util.debug('worker uses %d bytes -- exiting' % rss)
+                break
     util.debug('worker exiting after %d tasks' % completed)
 
 def _helper_reraises_exception(ex):
@@ -181,7 +190,9 @@ class Pool(object):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *,
+                 shared_memory_threshold=None, max_memory_per_child=None,
+                 forkserver_preload=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
@@ -207,6 +218,25 @@ class Pool(object):
         if initializer is not None and not callable(initializer):
             raise TypeError('initializer must be a callable')
 
+        if shared_memory_threshold is not None:
+            if shared_memory_threshold < 0:
+                raise ValueError("shared_memory_threshold must be >= 0")
+            if os.name != 'nt':
+                # The workers must share the resource tracker of the pool,
+                # which unlinks the blocks they create.
+                from . import resource_tracker
+                resource_tracker.ensure_running()
+        self._shm_threshold = shared_memory_threshold
+
+        if max_memory_per_child is not None and max_memory_per_child < 1:
+            raise ValueError("max_memory_per_child must be >= 1")
+        self._max_memory_per_child = max_memory_per_child
+
+        # Workers started by a forkserver have these modules imported
+        # already, if asked for and the forkserver is not running yet.
+        if forkserver_preload:
+            self._ctx._preload(['multiprocessing.pool', *forkserver_preload])
+
         self._processes = processes
         try:
             self._repopulate_pool()
@@ -225,7 +255,8 @@ class Pool(object):
             args=(self._cache, self._taskqueue, self._ctx, self.Process,
                   self._processes, self._pool, self._inqueue, self._outqueue,
                   self._initializer, self._initargs, self._maxtasksperchild,
-                  self._wrap_exception, sentinels, self._change_notifier)
+                  self._wrap_exception, sentinels, self._change_notifier,
+                  self._shm_threshold, self._max_memory_per_child)
             )
         self._worker_handler.daemon = True
         self._worker_handler._state = RUN
@@ -306,12 +337,15 @@ class Pool(object):
                                             self._outqueue, self._initializer,
                                             self._initargs,
                                             self._maxtasksperchild,
-                                            self._wrap_exception)
+                                            self._wrap_exception,
+                                            self._shm_threshold,
+                                            self._max_memory_per_child)
 
     @staticmethod
     def _repopulate_pool_static(ctx, Process, processes, pool, inqueue,
                                 outqueue, initializer, initargs,
-                                maxtasksperchild, wrap_exception):
+                                maxtasksperchild, wrap_exception,
+                                shm_threshold=None, max_memory=None):
         """Bring the number of pool processes up to the specified number,
         for use after reaping workers which have exited.
         """
@@ -320,7 +354,7 @@ class Pool(object):
                         args=(inqueue, outqueue,
                               initializer,
                               initargs, maxtasksperchild,
-                              wrap_exception))
+                              wrap_exception, shm_threshold, max_memory))
             w.name = w.name.replace('Process', 'PoolWorker')
             w.daemon = True
             w.start()
@@ -330,14 +364,15 @@ class Pool(object):
     @staticmethod
     def _maintain_pool(ctx, Process, processes, pool, inqueue, outqueue,
                        initializer, initargs, maxtasksperchild,
-                       wrap_exception):
+                       wrap_exception, shm_threshold=None, max_memory=None):
         """Clean up any exited workers and start replacements for them.
         """
         if Pool._join_exited_workers(pool):
             Pool._repopulate_pool_static(ctx, Process, processes, pool,
                                          inqueue, outqueue, initializer,
                                          initargs, maxtasksperchild,
-                                         wrap_exception)
+                                         wrap_exception, shm_threshold,
+                                         max_memory)
 
     def _setup_queues(self):
         self._inqueue = self._ctx.SimpleQueue()
@@ -504,7 +539,8 @@ class Pool(object):
     def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
                         pool, inqueue, outqueue, initializer, initargs,
                         maxtasksperchild, wrap_exception, sentinels,
-                        change_notifier):
+                        change_notifier, shm_threshold=None,
+                        max_memory=None):
         thread = threading.current_thread()
 
         # Keep maintaining workers until the cache gets drained, unless the pool
@@ -512,7 +548,8 @@ class Pool(object):
         while thread._state == RUN or (cache and thread._state != TERMINATE):
             cls._maintain_pool(ctx, Process, processes, pool, inqueue,
                                outqueue, initializer, initargs,
-                               maxtasksperchild, wrap_exception)
+                               maxtasksperchild, wrap_exception,
+                               shm_threshold, max_memory)
 
             current_sentinels = [*cls._get_worker_sentinels(pool), *sentinels]
 
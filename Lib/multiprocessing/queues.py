@@ -27,6 +27,9 @@ _ForkingPickler = context.reduction.ForkingPickler
 
 from .util import debug, info, Finalize, register_after_fork, is_exiting
 
+# Maximum size of the messages the feeder thread sends with a single write
+_FEED_BATCH_SIZE = 2**16
+
 #
 # Queue type using a pipe, buffer and thread
 #
@@ -46,6 +49,8 @@ class Queue(object):
         else:
             self._wlock = ctx.Lock()
         self._sem = ctx.BoundedSemaphore(maxsize)
+        # Serializes the permit acquisition of put_many()
+        self._putlock = ctx.Lock()
         # For use by concurrent.futures
         self._ignore_epipe = False
 
@@ -57,11 +62,13 @@ class Queue(object):
     def __getstate__(self):
         context.assert_spawning(self)
         return (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-                self._rlock, self._wlock, self._sem, self._opid)
+                self._rlock, self._wlock, self._sem, self._putlock,
+                self._opid)
 
     def __setstate__(self, state):
         (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-         self._rlock, self._wlock, self._sem, self._opid) = state
+         self._rlock, self._wlock, self._sem, self._putlock,
+         self._opid) = state
         self._after_fork()
 
     def _after_fork(self):
@@ -73,8 +80,9 @@ class Queue(object):
         self._joincancelled = False
         self._closed = False
         self._close = None
-        self._send_bytes = self._writer.send_bytes
+        self._send_bytes_many = self._writer._send_bytes_many
         self._recv_bytes = self._reader.recv_bytes
+        self._recv_bytes_many = self._reader._recv_bytes_many
         self._poll = self._reader.poll
 
     def put(self, obj, block=True, timeout=None):
@@ -89,6 +97,41 @@ class Queue(object):
             self._buffer.append(obj)
             self._notempty.notify()
 
+    def put_many(self, objs, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        objs = _Batch(objs)
+        if not objs:
+            return
+        self._acquire_many(len(objs), block, timeout)
+
+        with self._notempty:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.append(objs)
+            self._notempty.notify()
+
+    def _acquire_many(self, n, block, timeout):
+        if n > self._maxsize:
+            raise ValueError("cannot put more objects than the queue maxsize")
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        # The permits are taken one at a time: without the lock, concurrent
+        # calls could each hold part of the free room and wait forever for
+        # the rest.
+        if not self._putlock.acquire(block, timeout):
+            raise Full
+        try:
+            for i in range(n):
+                if block and timeout is not None:
+                    timeout = max(deadline - time.monotonic(), 0)
+                if not self._sem.acquire(block, timeout):
+                    for _ in range(i):
+                        self._sem.release()
+                    raise Full
+        finally:
+            self._putlock.release()
+
     def get(self, block=True, timeout=None):
         if self._closed:
             raise ValueError(f"Queue {self!r} is closed")
@@ -115,6 +158,23 @@ class Queue(object):
         # unserialize the data after having released the lock
         return _ForkingPickler.loads(res)
 
+    def get_many(self, maxitems, block=True, timeout=None):
+        if maxitems < 1:
+            raise ValueError("maxitems must be at least 1")
+        items = [self.get(block, timeout)]
+        if maxitems == 1 or not self._rlock.acquire(False):
+            return items
+        # receive the messages available already, up to maxitems
+        try:
+            messages = self._recv_bytes_many(maxitems - 1)
+        finally:
+            self._rlock.release()
+        for _ in messages:
+            self._sem.release()
+        # unserialize the data after having released the lock
+        items.extend(map(_ForkingPickler.loads, messages))
+        return items
+
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
         return self._maxsize - self._sem._semlock._get_value()
@@ -162,7 +222,7 @@ class Queue(object):
         self._buffer.clear()
         self._thread = threading.Thread(
             target=Queue._feed,
-            args=(self._buffer, self._notempty, self._send_bytes,
+            args=(self._buffer, self._notempty, self._send_bytes_many,
                   self._wlock, self._writer.close, self._ignore_epipe,
                   self._on_queue_feeder_error, self._sem),
             name='QueueFeederThread'
@@ -205,14 +265,15 @@ class Queue(object):
             notempty.notify()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, close, ignore_epipe,
-              onerror, queue_sem):
+    def _feed(buffer, notempty, send_bytes_many, writelock, close,
+              ignore_epipe, onerror, queue_sem):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
         nrelease = notempty.release
         nwait = notempty.wait
         bpopleft = buffer.popleft
         sentinel = _sentinel
+        dumps = _ForkingPickler.dumps
         if sys.platform != 'win32':
             wacquire = writelock.acquire
             wrelease = writelock.release
@@ -220,6 +281,7 @@ class Queue(object):
             wacquire = None
 
         while 1:
+            objs = []
             try:
                 nacquire()
                 try:
@@ -227,26 +289,49 @@ class Queue(object):
                         nwait()
                 finally:
                     nrelease()
-                try:
-                    while 1:
+                while buffer:
+                    # serialize the pending objects before acquiring the
+                    # lock, and send them at once
+                    objs = []
+                    messages = []
+                    size = 0
+                    got_sentinel = False
+                    while buffer and size < _FEED_BATCH_SIZE:
                         obj = bpopleft()
                         if obj is sentinel:
-                            debug('feeder thread got sentinel -- exiting')
-                            close()
-                            return
-
-                        # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
+                            got_sentinel = True
+                            break
+                        # the objects of put_many() are sent as separate
+                        # messages, which any consumer can receive
+                        batch = obj if type(obj) is _Batch else (obj,)
+                        for obj in batch:
+                            try:
+                                data = dumps(obj)
+                            except Exception as e:
+                                if is_exiting():
+                                    info('error in queue thread: %s', e)
+                                    return
+                                Queue._feed_error(e, obj, onerror,
+                                                  queue_sem)
+                                continue
+                            objs.append(obj)
+                            messages.append(data)
+                            size += len(data)
+                    obj = batch = None
+                    if messages:
                         if wacquire is None:
-                            send_bytes(obj)
+                            send_bytes_many(messages)
                         else:
                             wacquire()
                             try:
-                                send_bytes(obj)
+                                send_bytes_many(messages)
                             finally:
                                 wrelease()
-                except IndexError:
-                    pass
+                        objs = messages = ()
+                    if got_sentinel:
+                        debug('feeder thread got sentinel -- exiting')
+                        close()
+                        return
             except Exception as e:
                 if ignore_epipe and getattr(e, 'errno', 0) == errno.EPIPE:
                     return
@@ -258,13 +343,17 @@ class Queue(object):
                     info('error in queue thread: %s', e)
                     return
                 else:
-                    # Since the object has not been sent in the queue, we need
-                    # to decrease the size of the queue. The error acts as
-                    # if the object had been silently removed from the queue
-                    # and this step is necessary to have a properly working
-                    # queue.
-                    queue_sem.release()
-                    onerror(e, obj)
+                    for obj in objs:
+                        Queue._feed_error(e, obj, onerror, queue_sem)
+
+    @staticmethod
+    def _feed_error(e, obj, onerror, queue_sem):
+        # Since the object has not been sent in the queue, we need to
+        # decrease the size of the queue. The error acts as if the object
+        # had been silently removed from the queue and this step is necessary
+        # to have a properly working queue.
+        queue_sem.release()
+        onerror(e, obj)
 
     @staticmethod
     def _on_queue_feeder_error(e, obj):
@@ -278,6 +367,11 @@ class Queue(object):
 
 _sentinel = object()
 
+
+class _Batch(list):
+    """Objects put at once, sent with a single write"""
+    __slots__ = ()
+
 #
 # A queue type which also supports join() and task_done() methods
 #
@@ -313,6 +407,22 @@ class JoinableQueue(Queue):
             self._unfinished_tasks.release()
             self._notempty.notify()
 
+    def put_many(self, objs, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        objs = _Batch(objs)
+        if not objs:
+            return
+        self._acquire_many(len(objs), block, timeout)
+
+        with self._notempty, self._cond:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.append(objs)
+            for _ in range(len(objs)):
+                self._unfinished_tasks.release()
+            self._notempty.notify()
+
     def task_done(self):
         with self._cond:
             if not self._unfinished_tasks.acquire(False):
@@ -35,8 +35,8 @@ class ForkingPickler(pickle.Pickler):
     _extra_reducers = {}
     _copyreg_dispatch_table = copyreg.dispatch_table
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def __init__(self, *args, **kwds):
+        super().__init__(*args, **kwds)
         self.dispatch_table = self._copyreg_dispatch_table.copy()
         self.dispatch_table.update(self._extra_reducers)
 
@@ -59,6 +59,34 @@ def dump(obj, file, protocol=None):
     '''Replacement for pickle.dump() using ForkingPickler.'''
     ForkingPickler(file, protocol).dump(obj)
 
+
+class _BufferPickler(ForkingPickler):
+    '''Pickles large bytes and bytearray objects as out-of-band buffers.
+
+    The pickler saves these types before looking at reducer_override(),
+    but persistent_id() comes first: the buffer is saved as a persistent
+    id and rebuilt by _BufferUnpickler.
+    '''
+
+    def __init__(self, file, threshold, buffer_callback):
+        super().__init__(file, 5, buffer_callback=buffer_callback)
+        self._threshold = threshold
+
+    def persistent_id(self, obj):
+        if type(obj) in (bytes, bytearray) and len(obj) >= self._threshold:
+            return type(obj), pickle.PickleBuffer(obj)
+        return None
+
+
+class _BufferUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        type_, buffer = pid
+        if type(buffer) is type_:
+            # A bytearray received out-of-band is used as is
+            return buffer
+        return type_(buffer)
+
 #
 # Platform specific definitions
 #
@@ -5,15 +5,20 @@ documentation for details.
 """
 
 
-__all__ = [ 'SharedMemory', 'ShareableList' ]
+__all__ = [ 'SharedMemory', 'ShareableList', 'ShareableArray', 'ShareableDict' ]
 
 
+from collections.abc import MutableMapping
 from functools import partial
+import io
 import mmap
 import os
 import errno
 import struct
 import secrets
+import time
+
+from . import reduction
 
 if os.name == "nt":
     import _winapi
@@ -241,6 +246,78 @@ class SharedMemory:
             unregister(self._name, "shared_memory")
 
 
+# Alignment of the buffers stored in the blocks of _SharedMemoryPickle
+_BUFFER_ALIGNMENT = 64
+
+
+class _SharedMemoryPickle:
+    """Wrapper pickling an object with its large buffers in shared memory.
+
+    Pickling the wrapper pickles obj with protocol 5: the buffers of at
+    least threshold bytes are copied out-of-band into a new shared memory
+    block and only the rest of the pickle goes through the pipe.
+    Unpickling the wrapper returns obj rebuilt from the block, which is
+    unlinked at once and unmapped when the last object using its buffers
+    is gone; bytes and bytearray objects are copied out of it.
+
+    Windows frees a block when its creator closes it, before it can be
+    attached to, so the buffers are pickled in-band there.
+    """
+
+    def __init__(self, obj, threshold):
+        self.obj = obj
+        self.threshold = threshold
+
+    def __reduce__(self):
+        buffers = []
+
+        def buffer_callback(buffer):
+            raw = buffer.raw()
+            if raw.nbytes < self.threshold:
+                return True
+            buffers.append(raw)
+            return False
+
+        file = io.BytesIO()
+        reduction._BufferPickler(file, self.threshold,
+                       buffer_callback if _USE_POSIX else None).dump(self.obj)
+        data = file.getvalue()
+        if not buffers:
+            return _load_shared_memory, (data, None, ())
+
+        layout = []
+        size = 0
+        for raw in buffers:
+            layout.append((size, raw.nbytes))
+            size += -(-raw.nbytes // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+        shm = SharedMemory(create=True, size=size)
+        try:
+            for (offset, nbytes), raw in zip(layout, buffers):
+                shm.buf[offset:offset + nbytes] = raw
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        return _load_shared_memory, (data, shm.name, layout)
+
+
+def _load_shared_memory(data, name, layout):
+    if name is None:
+        return reduction._BufferUnpickler(io.BytesIO(data)).load()
+    shm = SharedMemory(name)
+    shm.unlink()
+    # Detach the mapping from shm: the buffers keep it alive as long as
+    # they are used.
+    view = shm._buf
+    shm._buf = shm._mmap = None
+    shm.close()
+    buffers = [view[offset:offset + nbytes] for offset, nbytes in layout]
+    view.release()
+    return reduction._BufferUnpickler(io.BytesIO(data),
+                                      buffers=buffers).load()
+
+
 _encoding = "utf8"
 
 class ShareableList:
@@ -512,3 +589,452 @@ class ShareableList:
                 return position
         else:
             raise ValueError(f"{value!r} not in this container")
+
+
+class ShareableArray:
+    """Pattern for a fixed-length array of numbers of a single C type,
+    stored in a shared memory block.
+
+    The items are accessed through a memoryview of the block cast to the
+    typecode of the array, so there is no per-item format lookup and the
+    whole array can be handed to any consumer of the buffer protocol
+    through the buf attribute."""
+
+    _typecodes = "bBhHiIlLqQnNfd?"
+    _header = struct.Struct("8sq")  # typecode, length
+    _offset_data_start = 16
+
+    def __init__(self, typecode=None, size_or_initializer=None, *, name=None):
+        if typecode is None:
+            if name is None:
+                raise TypeError("a typecode is required to create a "
+                                "ShareableArray")
+            self.shm = SharedMemory(name)
+            typecode, length = self._header.unpack_from(self.shm.buf, 0)
+            typecode = typecode.rstrip(b'\x00').decode(_encoding)
+            initializer = None
+        else:
+            if not isinstance(typecode, str) or len(typecode) != 1 or \
+                    typecode not in self._typecodes:
+                raise ValueError(f"bad typecode (must be one of "
+                                 f"{', '.join(self._typecodes)})")
+            if isinstance(size_or_initializer, int):
+                if size_or_initializer < 0:
+                    raise ValueError("negative array size")
+                length = size_or_initializer
+                initializer = None
+            else:
+                initializer = list(size_or_initializer or ())
+                length = len(initializer)
+            self.shm = SharedMemory(
+                name, create=True,
+                size=self._offset_data_start
+                     + length * struct.calcsize(typecode))
+            self._header.pack_into(self.shm.buf, 0,
+                                   typecode.encode(_encoding), length)
+            if initializer:
+                struct.pack_into(f"{length}{typecode}", self.shm.buf,
+                                 self._offset_data_start, *initializer)
+
+        self._typecode = typecode
+        start = self._offset_data_start
+        self._view = self.shm.buf[
+            start:start + length * struct.calcsize(typecode)].cast(typecode)
+
+    def __del__(self):
+        # The view must be released before the block can be unmapped.
+        view = getattr(self, '_view', None)
+        if view is not None:
+            view.release()
+
+    def close(self):
+        """Closes access to the shared memory from this instance but does
+        not destroy the shared memory block."""
+        self._view.release()
+        self.shm.close()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view[index].tolist()
+        return self._view[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            if len(value) != len(range(*index.indices(len(self._view)))):
+                raise ValueError("can only assign a sequence of the same "
+                                 "size to a ShareableArray slice")
+            value = memoryview(
+                struct.pack(f"{len(value)}{self._typecode}", *value)
+            ).cast(self._typecode)
+        self._view[index] = value
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __len__(self):
+        return len(self._view)
+
+    def __iter__(self):
+        return iter(self._view)
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self._typecode!r}, '
+                f'{self.tolist()}, name={self.shm.name!r})')
+
+    @property
+    def typecode(self):
+        "The typecode of the items, as used by the struct module."
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        "The size in bytes of one item."
+        return self._view.itemsize
+
+    @property
+    def buf(self):
+        "A memoryview of the items, cast to the typecode of the array."
+        return self._view
+
+    def tolist(self):
+        "Return the items of the array as a list."
+        return self._view.tolist()
+
+    def count(self, value):
+        "A.count(value) -> integer -- return number of occurrences of value."
+
+        return self._view.tolist().count(value)
+
+    def index(self, value):
+        """A.index(value) -> integer -- return first index of value.
+        Raises ValueError if the value is not present."""
+
+        try:
+            return self._view.tolist().index(value)
+        except ValueError:
+            raise ValueError(f"{value!r} not in this container") from None
+
+
+# States of the slots of a ShareableDict
+_EMPTY = 0
+_FULL = 1
+_DELETED = 2
+
+
+class ShareableDict(MutableMapping):
+    """Pattern for a mapping of fixed-width keys to fixed-width values,
+    stored in a shared memory block.
+
+    Keys and values are each described by a struct format of a single
+    item (e.g. 'q', 'd' or '16s').  The block holds an open addressing
+    hash table with linear probing which can not grow beyond the capacity
+    given at creation time.
+
+    Every slot carries a sequence number which is odd while the slot is
+    written: readers copy a slot and retry if the sequence number was odd
+    or changed meanwhile, so lookups never take a lock and never see a
+    half-written entry.  The table has a generation number likewise odd
+    while an insertion rehashes the items to reclaim the slots of deleted
+    ones.  Writes must be serialized by the caller, for example with a
+    multiprocessing.Lock, when several processes modify the same
+    ShareableDict.
+
+    The sequence numbers are plain memory accesses without barriers: the
+    lock-free reads rely on the processor keeping the order of the stores
+    and of the loads, as x86 does.  On weakly ordered processors, such as
+    ARM, a reader can see a torn entry, so readers must take the writers'
+    lock too."""
+
+    # formats, capacity, slots, count, deleted slots, generation
+    _header = struct.Struct("16s16sqqqqQ")
+    _offset_count = 48
+    _offset_generation = 64
+    _offset_data_start = 72
+    _seq = struct.Struct("Q")
+    _counts = struct.Struct("qq")  # count, deleted slots
+    _max_format_length = 16
+    # Seconds a reader waits for a slot or the table to be written before
+    # assuming that the writer died in the middle of it, plus an allowance
+    # per slot for a rehash, which rewrites the whole table.
+    _read_timeout = 1.0
+    _rehash_slot_timeout = 1e-4
+
+    def __init__(self, mapping=None, *, capacity=None, key_format='q',
+                 value_format='q', name=None):
+        if name is not None and mapping is None and capacity is None:
+            self.shm = SharedMemory(name)
+            key_format, value_format, capacity, nslots, _, _, _ = \
+                self._header.unpack_from(self.shm.buf, 0)
+            key_format = key_format.rstrip(b'\x00').decode(_encoding)
+            value_format = value_format.rstrip(b'\x00').decode(_encoding)
+            self._setup(key_format, value_format, capacity, nslots)
+            return
+
+        if mapping is not None:
+            mapping = dict(mapping)
+        if capacity is None:
+            capacity = len(mapping) if mapping else 0
+        elif capacity < 0:
+            raise ValueError("capacity must be >= 0")
+        if mapping and len(mapping) > capacity:
+            raise ValueError("mapping exceeds the capacity")
+        for fmt in (key_format, value_format):
+            s = struct.Struct(fmt)
+            if len(fmt) > self._max_format_length or \
+                    len(s.unpack(bytes(s.size))) != 1:
+                raise ValueError(f"bad format {fmt!r} (must describe a "
+                                 f"single item)")
+        # Keep the load factor below 3/4.
+        nslots = 8
+        while nslots * 3 < capacity * 4:
+            nslots *= 2
+        self._setup(key_format, value_format, capacity, nslots)
+        self.shm = SharedMemory(
+            name, create=True,
+            size=self._offset_data_start + nslots * self._slot_size)
+        self._header.pack_into(self.shm.buf, 0,
+                               key_format.encode(_encoding),
+                               value_format.encode(_encoding),
+                               capacity, nslots, 0, 0, 0)
+        if mapping:
+            self.update(mapping)
+
+    def _setup(self, key_format, value_format, capacity, nslots):
+        self._key = struct.Struct("=" + key_format)
+        self._value = struct.Struct("=" + value_format)
+        self._strip_key = key_format.endswith("s")
+        self._strip_value = value_format.endswith("s")
+        # seq, state, key, value; slots are 8-byte aligned.
+        self._slot = struct.Struct(
+            f"=QQ{self._key.size}s{self._value.size}s")
+        self._slot_size = -(-self._slot.size // 8) * 8
+        self._capacity = capacity
+        self._nslots = nslots
+        self._shift = 64 - (nslots.bit_length() - 1)
+
+    def _pack_key(self, key):
+        packed = self._key.pack(key)
+        if self._strip_key and len(key) > self._key.size:
+            raise ValueError("key exceeds available storage")
+        return packed
+
+    def _first_slot(self, packed_key):
+        # hash() of an int does not depend on PYTHONHASHSEED, so all the
+        # processes agree on it; Fibonacci hashing spreads its bits.
+        h = hash(int.from_bytes(packed_key, 'little'))
+        return ((h * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def _check_deadline(self, deadline):
+        now = time.monotonic()
+        if deadline is None:
+            return (now + self._read_timeout
+                    + self._nslots * self._rehash_slot_timeout)
+        if now > deadline:
+            raise RuntimeError("ShareableDict is being written for too "
+                               "long, a writer may have died")
+        return deadline
+
+    def _read(self, buf, offset):
+        "Returns a consistent snapshot (state, key, value) of a slot."
+        deadline = None
+        while True:
+            seq, state, key, value = self._slot.unpack_from(buf, offset)
+            if not seq & 1 and self._seq.unpack_from(buf, offset)[0] == seq:
+                return state, key, value
+            deadline = self._check_deadline(deadline)
+
+    def _write(self, buf, offset, state, key, value):
+        # The sequence number is odd during the write, even if a previous
+        # writer died leaving it odd.
+        seq = (self._seq.unpack_from(buf, offset)[0] + 1) | 1
+        self._seq.pack_into(buf, offset, seq)
+        self._slot.pack_into(buf, offset, seq, state, key, value)
+        self._seq.pack_into(buf, offset, seq + 1)
+
+    def _generation(self, buf):
+        "Returns the generation of the table, once no rehash is running."
+        deadline = None
+        while True:
+            generation = self._seq.unpack_from(buf, self._offset_generation)[0]
+            if not generation & 1:
+                return generation
+            deadline = self._check_deadline(deadline)
+
+    def _lookup(self, packed_key):
+        """Returns the offset and the packed value of the slot holding
+        packed_key, or (None, None)."""
+        buf = self.shm.buf
+        mask = self._nslots - 1
+        while True:
+            generation = self._generation(buf)
+            index = self._first_slot(packed_key)
+            for _ in range(self._nslots):
+                offset = self._offset_data_start + index * self._slot_size
+                state, key, value = self._read(buf, offset)
+                if state == _EMPTY:
+                    break
+                if state == _FULL and key == packed_key:
+                    return offset, value
+                index = (index + 1) & mask
+            # A rehash may have moved the key away meanwhile.
+            if self._seq.unpack_from(buf, self._offset_generation)[0] == \
+                    generation:
+                return None, None
+
+    def _find_slot(self, buf, packed_key):
+        """Returns the offset and the state of the slot holding packed_key,
+        or else of the first free slot of its probe sequence.  Only used by
+        writers."""
+        mask = self._nslots - 1
+        index = self._first_slot(packed_key)
+        free = None
+        for _ in range(self._nslots):
+            offset = self._offset_data_start + index * self._slot_size
+            _, state, key_in_slot, _ = self._slot.unpack_from(buf, offset)
+            if state == _FULL:
+                if key_in_slot == packed_key:
+                    return offset, state
+            elif free is None:
+                free = offset, state
+                if state == _EMPTY:
+                    break
+            elif state == _EMPTY:
+                break
+            index = (index + 1) & mask
+        return free
+
+    def _rehash(self, buf):
+        "Moves the items back to their probe sequences, without tombstones."
+        items = []
+        for index in range(self._nslots):
+            offset = self._offset_data_start + index * self._slot_size
+            _, state, key, value = self._slot.unpack_from(buf, offset)
+            if state == _FULL:
+                items.append((key, value))
+        generation = (self._seq.unpack_from(buf, self._offset_generation)[0]
+                      + 1) | 1
+        self._seq.pack_into(buf, self._offset_generation, generation)
+        for index in range(self._nslots):
+            offset = self._offset_data_start + index * self._slot_size
+            if self._slot.unpack_from(buf, offset)[1] != _EMPTY:
+                self._write(buf, offset, _EMPTY, b'', b'')
+        for key, value in items:
+            offset, _ = self._find_slot(buf, key)
+            self._write(buf, offset, _FULL, key, value)
+        self._seq.pack_into(buf, self._offset_generation, generation + 1)
+
+    def _unpack_value(self, packed_value):
+        (value,) = self._value.unpack(packed_value)
+        if self._strip_value:
+            value = value.rstrip(b'\x00')
+        return value
+
+    def _unpack_key(self, packed_key):
+        (key,) = self._key.unpack(packed_key)
+        if self._strip_key:
+            key = key.rstrip(b'\x00')
+        return key
+
+    def __getitem__(self, key):
+        try:
+            packed_key = self._pack_key(key)
+        except (struct.error, ValueError):
+            raise KeyError(key) from None
+        offset, value = self._lookup(packed_key)
+        if offset is None:
+            raise KeyError(key)
+        return self._unpack_value(value)
+
+    def __setitem__(self, key, value):
+        packed_key = self._pack_key(key)
+        packed_value = self._value.pack(value)
+        if self._strip_value and len(value) > self._value.size:
+            raise ValueError("value exceeds available storage")
+
+        buf = self.shm.buf
+        offset, state = self._find_slot(buf, packed_key)
+        if state == _FULL:
+            self._write(buf, offset, _FULL, packed_key, packed_value)
+            return
+
+        count, deleted = self._counts.unpack_from(buf, self._offset_count)
+        if count >= self._capacity:
+            raise ValueError("ShareableDict is full")
+        if state == _DELETED:
+            deleted -= 1
+        elif deleted and (count + deleted + 1) * 4 > self._nslots * 3:
+            # Tombstones would leave too few empty slots to end the probe
+            # sequences: reclaim them.
+            self._rehash(buf)
+            deleted = 0
+            offset, state = self._find_slot(buf, packed_key)
+        self._write(buf, offset, _FULL, packed_key, packed_value)
+        self._counts.pack_into(buf, self._offset_count, count + 1, deleted)
+
+    def __delitem__(self, key):
+        try:
+            packed_key = self._pack_key(key)
+        except (struct.error, ValueError):
+            raise KeyError(key) from None
+        offset, value = self._lookup(packed_key)
+        if offset is None:
+            raise KeyError(key)
+        buf = self.shm.buf
+        # A slot followed by an empty one ends no probe sequence and can
+        # be emptied; otherwise it is left as a tombstone.
+        index = (offset - self._offset_data_start) // self._slot_size
+        next_offset = (self._offset_data_start
+                       + ((index + 1) & (self._nslots - 1)) * self._slot_size)
+        count, deleted = self._counts.unpack_from(buf, self._offset_count)
+        state = _DELETED
+        if self._slot.unpack_from(buf, next_offset)[1] == _EMPTY:
+            state = _EMPTY
+        else:
+            deleted += 1
+        self._write(buf, offset, state, packed_key, value)
+        self._counts.pack_into(buf, self._offset_count, count - 1, deleted)
+
+    def _items(self):
+        buf = self.shm.buf
+        while True:
+            generation = self._generation(buf)
+            items = []
+            for index in range(self._nslots):
+                offset = self._offset_data_start + index * self._slot_size
+                state, key, value = self._read(buf, offset)
+                if state == _FULL:
+                    items.append((key, value))
+            if self._seq.unpack_from(buf, self._offset_generation)[0] == \
+                    generation:
+                return items
+
+    def __iter__(self):
+        for key, _ in self._items():
+            yield self._unpack_key(key)
+
+    def __len__(self):
+        return self._counts.unpack_from(self.shm.buf, self._offset_count)[0]
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __repr__(self):
+        items = {self._unpack_key(key): self._unpack_value(value)
+                 for key, value in self._items()}
+        return f'{self.__class__.__name__}({items}, name={self.shm.name!r})'
+
+    @property
+    def capacity(self):
+        "The maximum number of items that can be stored."
+        return self._capacity
+
+    @property
+    def key_format(self):
+        "The struct format of the keys."
+        return self._key.format[1:]
+
+    @property
+    def value_format(self):
+        "The struct format of the values."
+        return self._value.format[1:]
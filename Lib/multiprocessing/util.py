@@ -440,6 +440,29 @@ def _flush_std_streams():
     except (AttributeError, ValueError):
         pass
 
+#
+# Memory used by the current process, to recycle pool workers
+#
+
+def _resident_memory():
+    '''Return the resident set size of the current process in bytes.
+
+    Where the current size is not available, this returns the peak size, or
+    None if neither can be determined.
+    '''
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return rss if sys.platform == 'darwin' else rss * 1024
+
 #
 # Start a program with only specified fds kept open
 #
@@ -87,7 +87,7 @@ elif 'nt' in _names:
     except ImportError:
         pass
 
-if 'riscos' in _names:
+elif 'riscos' in _names:
     name = 'riscos'
     linesep = '\n'
     from riscos import *
@@ -572,6 +572,32 @@ def execusercustomize():
                 (err.__class__.__name__, err))
 
 
+def enablelazyimports():
+    """Enable lazy imports if requested with -X lazy_imports or
+    PYTHONLAZYIMPORTS.
+
+    The value is a comma-separated list of the modules to import lazily,
+    where names prefixed with "-" are never imported lazily.  All modules
+    are imported lazily if no module is listed, or for "*".
+    """
+    value = sys._xoptions.get('lazy_imports')
+    if value is None and not sys.flags.ignore_environment:
+        value = os.environ.get('PYTHONLAZYIMPORTS')
+    if not value:
+        return
+    allow = []
+    deny = []
+    if value is not True:
+        for name in value.split(','):
+            name = name.strip()
+            if name.startswith('-'):
+                deny.append(name[1:])
+            elif name and name != '*':
+                allow.append(name)
+    from importlib.util import enable_lazy_imports
+    enable_lazy_imports(allow or None, deny)
+
+
 def main():
     """Add standard site-specific directories to the module search path.
 
@@ -600,6 +626,9 @@ def main():
     execsitecustomize()
     if ENABLE_USER_SITE:
         execusercustomize()
+    # Last, as .pth files and the customize modules are imported for their
+    # side effects.
+    enablelazyimports()
 
 # Prevent extending of sys.path when python was started with -S and
 # site is imported later.
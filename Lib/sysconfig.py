@@ -434,6 +434,8 @@ def _generate_posix_vars():
     if sys.platform == 'riscos':
         # Add /py on so it will import without type
         destfile = os.path.join(pybuilddir, name+'/py')
+    else:
+        destfile = os.path.join(pybuilddir, name + '.py')
 
     with open(destfile, 'w', encoding='utf8') as f:
         f.write('# system configuration generated and used by'
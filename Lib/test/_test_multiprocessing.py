@@ -1216,6 +1216,168 @@ class _TestQueue(BaseTestCase):
                 q.put('foo')
             with self.assertRaisesRegex(ValueError, 'is closed'):
                 q.get()
+            with self.assertRaisesRegex(ValueError, 'is closed'):
+                q.put_many(['foo'])
+
+    @classmethod
+    def _test_put_many(cls, queue):
+        queue.put_many(range(10))
+        queue.put(10)
+        for i in range(11, 1000):
+            queue.put(i)
+        queue.put_many([])
+        queue.put_many(iter(range(1000, 1100)))
+
+    def test_put_many_get_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue()
+        p = self.Process(target=self._test_put_many, args=(queue,))
+        p.daemon = True
+        p.start()
+
+        # get() and get_many() return the objects put together separately
+        self.assertEqual(queue.get(), 0)
+        self.assertEqual(queue.get_many(2), [1, 2])
+        items = [queue.get() for i in range(3, 11)]
+        while len(items) < 1100 - 3:
+            batch = queue.get_many(64, timeout=TIMEOUT)
+            self.assertGreaterEqual(len(batch), 1)
+            self.assertLessEqual(len(batch), 64)
+            items.extend(batch)
+        self.assertEqual(items, list(range(3, 1100)))
+        self.assertRaises(pyqueue.Empty, queue.get_many, 10, False)
+        self.assertRaises(ValueError, queue.get_many, 0)
+        self.assertTrue(queue.empty())
+
+        p.join()
+        close_queue(queue)
+
+    @classmethod
+    def _test_get_one(cls, queue, results):
+        results.put(queue.get(timeout=TIMEOUT))
+
+    def test_put_many_several_consumers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue()
+        results = self.Queue()
+        queue.put_many(range(5))
+        p = self.Process(target=self._test_get_one, args=(queue, results))
+        p.daemon = True
+        p.start()
+        p.join()
+        # the objects put together are not lost with the consumer process
+        self.assertEqual(results.get(timeout=TIMEOUT), 0)
+        try:
+            self.assertEqual(queue.qsize(), 4)
+        except NotImplementedError:
+            pass
+        self.assertFalse(queue.empty())
+        self.assertEqual(queue.get_many(10, timeout=TIMEOUT), [1, 2, 3, 4])
+        self.assertTrue(queue.empty())
+        close_queue(queue)
+        close_queue(results)
+
+    def test_put_many_maxsize(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue(maxsize=5)
+        self.assertRaises(ValueError, queue.put_many, range(6))
+        queue.put(0)
+        put_many = TimingWrapper(queue.put_many)
+        self.assertRaises(pyqueue.Full, put_many, range(5), False)
+        self.assertTimingAlmostEqual(put_many.elapsed, 0)
+        self.assertRaises(pyqueue.Full, put_many, range(5), True, TIMEOUT1)
+        self.assertTimingAlmostEqual(put_many.elapsed, TIMEOUT1)
+        # the permits taken by the failed calls were released
+        queue.put_many(range(1, 5), timeout=TIMEOUT)
+        self.assertTrue(queue.full())
+        try:
+            self.assertEqual(queue.qsize(), 5)
+        except NotImplementedError:
+            pass
+        self.assertEqual(queue.get(timeout=TIMEOUT), 0)
+        self.assertEqual(queue.get(timeout=TIMEOUT), 1)
+        # the objects not returned yet still count in the queue size
+        try:
+            self.assertEqual(queue.qsize(), 3)
+        except NotImplementedError:
+            pass
+        self.assertFalse(queue.empty())
+        self.assertEqual(queue.get_many(10), [2, 3, 4])
+        self.assertTrue(queue.empty())
+        close_queue(queue)
+
+    def test_put_many_concurrent(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue(maxsize=4)
+        queue.put_many(range(4))
+        # Each call waits for all its room: they must not share the room
+        # freed by the consumer and wait forever for the rest
+        threads = [threading.Thread(target=queue.put_many,
+                                    args=(range(i, i + 3),))
+                   for i in (10, 20, 30)]
+        for t in threads:
+            t.daemon = True
+            t.start()
+        # Let both calls wait for room before draining the queue
+        time.sleep(DELTA)
+        items = [queue.get(timeout=TIMEOUT) for i in range(13)]
+        for t in threads:
+            t.join(TIMEOUT)
+            self.assertFalse(t.is_alive())
+        self.assertEqual(items[:4], [0, 1, 2, 3])
+        self.assertEqual(sorted(items[4:]),
+                         [10, 11, 12, 20, 21, 22, 30, 31, 32])
+        self.assertTrue(queue.empty())
+        close_queue(queue)
+
+    def test_put_many_task_done(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.JoinableQueue()
+        workers = [self.Process(target=self._test_task_done, args=(queue,))
+                   for i in range(2)]
+        for p in workers:
+            p.daemon = True
+            p.start()
+
+        queue.put_many(range(10))
+        queue.join()
+
+        for p in workers:
+            queue.put(None)
+        for p in workers:
+            p.join()
+        close_queue(queue)
+
+    def test_queue_feeder_put_many_error(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        class NotSerializable(object):
+            def __reduce__(self):
+                raise AttributeError
+
+        errors = []
+        class SafeQueue(multiprocessing.queues.Queue):
+            @staticmethod
+            def _on_queue_feeder_error(e, obj):
+                errors.append(obj)
+
+        q = SafeQueue(maxsize=3, ctx=multiprocessing.get_context())
+        bad = NotSerializable()
+        q.put_many([1, bad])
+        q.put(2)
+        # the object which failed was removed from the queue
+        self.assertEqual(q.get(timeout=TIMEOUT), 1)
+        self.assertEqual(q.get(timeout=TIMEOUT), 2)
+        self.assertEqual(errors, [bad])
+        self.assertTrue(q.empty())
+        self.assertFalse(q.full())
+        close_queue(q)
 #
 #
 #
@@ -2289,6 +2451,88 @@ class _TestContainers(BaseTestCase):
         self.assertTrue(hasattr(n, 'name'))
         self.assertTrue(not hasattr(n, 'job'))
 
+    def test_get_many_set_many(self):
+        d = self.dict()
+        d.set_many({i: chr(i) for i in range(65, 70)})
+        d.set_many([(70, 'F')])
+        self.assertEqual(d.get_many([65, 70]), ['A', 'F'])
+        self.assertEqual(len(d), 6)
+        with self.assertRaises(KeyError):
+            d.get_many([65, 71])
+
+        l = self.list(range(5))
+        l.set_many([(0, 'a'), (-1, 'e')])
+        self.assertEqual(l[:], ['a', 1, 2, 3, 'e'])
+        self.assertEqual(l.get_many(range(1, 3)), [1, 2])
+        with self.assertRaises(IndexError):
+            l.get_many([5])
+
+    def test_callmethod_async(self):
+        d = self.dict(a=1)
+        futures = [d._callmethod_async('get', (key,)) for key in 'ab']
+        error = d._callmethod_async('__getitem__', ('b',))
+        self.assertFalse(any(f.done() for f in futures))
+        self.assertEqual(futures[0].result(), 1)
+        # All the queued calls were sent together.
+        self.assertTrue(error.done())
+        self.assertIsNone(futures[1].result())
+        self.assertIsInstance(error.exception(), KeyError)
+
+        # A synchronous call sends the queued calls first.
+        future = d._callmethod_async('__setitem__', ('b', 2))
+        self.assertEqual(d['b'], 2)
+        self.assertTrue(future.done())
+
+        # Calls returning proxies
+        future = d._callmethod_async('__iter__')
+        self.assertEqual(sorted(future.result()), ['a', 'b'])
+
+    def test_pipeline(self):
+        d = self.dict()
+        n = self.Namespace()
+        with d._pipeline():
+            for i in range(1000):
+                d[i] = i
+            n.x = 5
+            x = n.x
+            value = d.get(999)
+            self.assertFalse(value.done())
+            # Special methods other than item and attribute access are
+            # called synchronously.
+            self.assertEqual(len(d), 1000)
+            self.assertIn(999, d)
+            self.assertTrue(value.done())
+            self.assertIn('DictProxy', repr(d))
+            del d[0]
+            item = d[1]
+            missing = d.get(0)
+        self.assertEqual(value.result(), 999)
+        self.assertEqual(item.result(), 1)
+        self.assertIsNone(missing.result())
+        self.assertEqual(x.result(), 5)
+        self.assertEqual(d.get(500), 500)
+
+        with self.assertRaises(ZeroDivisionError):
+            with d._pipeline():
+                future = d.get(1)
+                1/0
+        self.assertEqual(future.result(), 1)
+
+        # A call queued by a thread can not be sent by another one.
+        future = d._callmethod_async('get', (1,))
+        errors = []
+        def result():
+            try:
+                future.result()
+            except RuntimeError as e:
+                errors.append(e)
+        t = threading.Thread(target=result)
+        t.start()
+        t.join()
+        self.assertEqual(len(errors), 1)
+        self.assertFalse(future.done())
+        self.assertEqual(future.result(), 1)
+
 #
 #
 #
@@ -2307,6 +2551,9 @@ def raise_large_valuerror(wait):
 def identity(x):
     return x
 
+def getpid(x):
+    return os.getpid()
+
 class CountedObject(object):
     n_instances = 0
 
@@ -2778,6 +3025,18 @@ class _TestPoolWorkerLifetime(BaseTestCase):
         for (j, res) in enumerate(results):
             self.assertEqual(res.get(), sqr(j))
 
+    def test_pool_worker_max_memory(self):
+        if util._resident_memory() is None:
+            self.skipTest("memory usage not available")
+        self.assertRaises(ValueError, multiprocessing.Pool, 1,
+                          max_memory_per_child=0)
+        # Every worker uses more than a byte: each one runs a single task
+        p = multiprocessing.Pool(2, max_memory_per_child=1)
+        pids = p.map(getpid, range(6), chunksize=1)
+        p.close()
+        p.join()
+        self.assertEqual(len(set(pids)), 6)
+
     def test_worker_finalization_via_atexit_handler_of_multiprocessing(self):
         # tests cases against bpo-38744 and bpo-39360
         cmd = '''if 1:
@@ -3159,6 +3418,99 @@ class _TestConnection(BaseTestCase):
 
         self.assertRaises(ValueError, a.send_bytes, msg, 4, -1)
 
+    @classmethod
+    def _echo_out_of_band(cls, conn):
+        for obj in iter(conn.recv, None):
+            conn.send(obj, out_of_band=True)
+        conn.close()
+
+    def test_send_out_of_band(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_out_of_band, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+
+        big = b'x' * 100000
+        arr = array.array('d', range(10000))
+        obj = [big, bytearray(big), pickle.PickleBuffer(arr), b'small', 42]
+        conn.send(obj, out_of_band=True)
+        result = conn.recv()
+        self.assertEqual(result[:2], [big, bytearray(big)])
+        self.assertIs(type(result[0]), bytes)
+        self.assertIs(type(result[1]), bytearray)
+        self.assertEqual(result[2], arr.tobytes())
+        self.assertEqual(result[3:], [b'small', 42])
+
+        # Objects without large buffers are sent as usual.
+        conn.send([1, b'small'], out_of_band=True)
+        self.assertEqual(conn.recv(), [1, b'small'])
+
+        # Buffers are received into the memory given by buffer_factory.
+        sizes = []
+        def buffer_factory(size):
+            sizes.append(size)
+            return bytearray(size + 10)
+        conn.send([bytearray(big)])
+        result = conn.recv(buffer_factory=buffer_factory)
+        self.assertEqual(sizes, [len(big)])
+        self.assertIsInstance(result[0], bytearray)
+        self.assertEqual(result[0], big)
+
+        conn.send(None)
+        p.join()
+        conn.close()
+
+    def test_send_out_of_band_same_process(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        reader, writer = self.Pipe(duplex=False)
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+        buf = bytearray(b'y' * 50000)
+        writer.send({'data': pickle.PickleBuffer(buf)}, out_of_band=True)
+        result = reader.recv(buffer_factory=bytearray)
+        self.assertEqual(result['data'], buf)
+
+        # Messages following the buffers are not affected.
+        writer.send_bytes(b'after')
+        self.assertEqual(reader.recv_bytes(), b'after')
+
+        # A buffer too short for the data is not used, and the whole object
+        # is still received.
+        buf = bytearray(b'z' * 20000)
+        bufs = [pickle.PickleBuffer(buf), pickle.PickleBuffer(buf)]
+        writer.send(bufs, out_of_band=True)
+        with self.assertRaises(multiprocessing.BufferTooShort) as cm:
+            reader.recv(buffer_factory=lambda size: bytearray(size - 1))
+        self.assertEqual(cm.exception.args[0], [buf, buf])
+        writer.send_bytes(b'after')
+        self.assertEqual(reader.recv_bytes(), b'after')
+
+    def test_recv_bytes_into_large(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        reader, writer = self.Pipe(duplex=False)
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+        msg = bytes(range(256)) * 200
+        t = threading.Thread(target=writer.send_bytes, args=(msg,))
+        t.start()
+        buffer = bytearray(len(msg) + 10)
+        self.assertEqual(reader.recv_bytes_into(buffer, 10), len(msg))
+        t.join()
+        self.assertEqual(buffer[10:], msg)
+
+        writer._send_bytes_many([b'a', b'', b'b' * 20000])
+        self.assertEqual(reader.recv_bytes(), b'a')
+        self.assertEqual(reader.recv_bytes(), b'')
+        self.assertEqual(reader.recv_bytes(), b'b' * 20000)
+
     @classmethod
     def _is_fd_assigned(cls, fd):
         try:
@@ -4062,6 +4414,246 @@ class _TestSharedMemory(BaseTestCase):
         deserialized_sl.shm.close()
         sl.shm.close()
 
+    def test_shared_memory_ShareableArray_basics(self):
+        sa = shared_memory.ShareableArray('d', [1.5, 2, -3])
+        self.addCleanup(sa.shm.unlink)
+        self.assertEqual(sa.typecode, 'd')
+        self.assertEqual(sa.itemsize, 8)
+        self.assertEqual(len(sa), 3)
+        self.assertEqual(list(sa), [1.5, 2.0, -3.0])
+        self.assertEqual(sa[-1], -3.0)
+        self.assertEqual(sa[1:], [2.0, -3.0])
+        self.assertIn('ShareableArray', repr(sa))
+        self.assertEqual(sa.count(2.0), 1)
+        self.assertEqual(sa.index(-3.0), 2)
+        with self.assertRaises(ValueError):
+            sa.index(42)
+
+        sa[0] = 4
+        sa[::2] = [5, 6]
+        self.assertEqual(sa.tolist(), [5.0, 2.0, 6.0])
+        with self.assertRaises(ValueError):
+            sa[0:2] = [1]
+        with self.assertRaises(IndexError):
+            sa[3]
+        with self.assertRaises(TypeError):
+            sa[0] = 'a'
+
+        # The items are exposed through the buffer protocol.
+        self.assertEqual(sa.buf.format, 'd')
+        self.assertEqual(sa.buf.tolist(), sa.tolist())
+
+        # Attach to the same block by name.
+        sa_tethered = shared_memory.ShareableArray(name=sa.shm.name)
+        self.assertEqual(sa_tethered.typecode, 'd')
+        sa_tethered[1] = 7
+        self.assertEqual(sa[1], 7.0)
+        sa_tethered.close()
+
+        with self.assertRaises(ValueError):
+            shared_memory.ShareableArray('x', 3)
+        with self.assertRaises(TypeError):
+            shared_memory.ShareableArray()
+
+        zeros = shared_memory.ShareableArray('q', 10)
+        self.addCleanup(zeros.shm.unlink)
+        self.assertEqual(zeros.tolist(), [0] * 10)
+        zeros.close()
+        sa.close()
+
+    def test_shared_memory_ShareableArray_pickling(self):
+        sa = shared_memory.ShareableArray('q', range(400))
+        self.addCleanup(sa.shm.unlink)
+        serialized_sa = pickle.dumps(sa)
+        self.assertLess(len(serialized_sa), 400)
+        deserialized_sa = pickle.loads(serialized_sa)
+        self.assertIsInstance(deserialized_sa, shared_memory.ShareableArray)
+        deserialized_sa[4] = -1
+        self.assertEqual(sa[4], -1)
+        deserialized_sa.close()
+        sa.close()
+
+    def test_shared_memory_ShareableDict_basics(self):
+        sd = shared_memory.ShareableDict({1: 10, -2: 20}, capacity=100)
+        self.addCleanup(sd.shm.unlink)
+        self.assertEqual(sd.capacity, 100)
+        self.assertEqual((sd.key_format, sd.value_format), ('q', 'q'))
+        self.assertEqual(len(sd), 2)
+        self.assertEqual(sd[1], 10)
+        self.assertEqual(sd[-2], 20)
+        self.assertNotIn(3, sd)
+        self.assertNotIn('spam', sd)
+        self.assertIsNone(sd.get(3))
+        with self.assertRaises(KeyError):
+            sd[3]
+        self.assertIn('ShareableDict', repr(sd))
+
+        sd[1] = 11
+        self.assertEqual(sd[1], 11)
+        self.assertEqual(len(sd), 2)
+        del sd[-2]
+        self.assertEqual(dict(sd), {1: 11})
+        with self.assertRaises(KeyError):
+            del sd[-2]
+
+        # Deleted slots are reused and never break probe sequences.
+        sd.clear()
+        expected = {}
+        for i in range(2000):
+            key = (i * 7919) % 300
+            if key in expected and i % 3:
+                del sd[key]
+                del expected[key]
+            elif key in expected or len(expected) < 100:
+                sd[key] = i
+                expected[key] = i
+        self.assertEqual(len(sd), len(expected))
+        self.assertEqual(dict(sd.items()), expected)
+
+        sd.clear()
+        self.assertEqual(len(sd), 0)
+        sd.update((i, i) for i in range(100))
+        with self.assertRaises(ValueError):
+            sd[100] = 100
+        sd[99] = 0  # Updating an existing key still works when full.
+        self.assertEqual(sd[99], 0)
+
+        with self.assertRaises(ValueError):
+            shared_memory.ShareableDict(capacity=1, key_format='2q')
+        with self.assertRaises(ValueError):
+            shared_memory.ShareableDict({1: 1, 2: 2}, capacity=1)
+        sd.shm.close()
+
+    def test_shared_memory_ShareableDict_fixed_width(self):
+        sd = shared_memory.ShareableDict(
+            {b'spam': 1.5}, capacity=4, key_format='8s', value_format='d')
+        self.addCleanup(sd.shm.unlink)
+        self.assertEqual(sd[b'spam'], 1.5)
+        self.assertEqual(list(sd), [b'spam'])
+        with self.assertRaises(ValueError):
+            sd[b'123456789'] = 0.0
+        self.assertNotIn(b'123456789', sd)
+
+        sd_tethered = pickle.loads(pickle.dumps(sd))
+        self.assertIsInstance(sd_tethered, shared_memory.ShareableDict)
+        self.assertEqual(sd_tethered.key_format, '8s')
+        sd_tethered[b'eggs'] = 2.5
+        self.assertEqual(sd[b'eggs'], 2.5)
+        sd_tethered.shm.close()
+        sd.shm.close()
+
+    def test_shared_memory_ShareableDict_tombstones(self):
+        sd = shared_memory.ShareableDict(capacity=12)
+        self.addCleanup(sd.shm.unlink)
+        nslots = sd._nslots
+        expected = {}
+        for i in range(1000):
+            if len(expected) == sd.capacity:
+                key = next(iter(expected))
+                del sd[key]
+                del expected[key]
+            sd[i] = i
+            expected[i] = i
+            count, deleted = sd._counts.unpack_from(sd.shm.buf,
+                                                    sd._offset_count)
+            # Tombstones are reclaimed before they fill the empty slots.
+            self.assertLessEqual((count + deleted) * 4, nslots * 3)
+        self.assertEqual(dict(sd), expected)
+        self.assertEqual(sd.get(-1), None)
+        sd.shm.close()
+
+    def test_shared_memory_ShareableDict_dead_writer(self):
+        sd = shared_memory.ShareableDict({1: 10}, capacity=4)
+        self.addCleanup(sd.shm.unlink)
+        sd._read_timeout = 0.01
+        offset, _ = sd._lookup(sd._pack_key(1))
+        buf = sd.shm.buf
+        # A writer died in the middle of a write to the slot.
+        seq = sd._seq.unpack_from(buf, offset)[0]
+        sd._seq.pack_into(buf, offset, seq + 1)
+        with self.assertRaises(RuntimeError):
+            sd[1]
+        # The next write of the slot makes it readable again.
+        sd[1] = 11
+        self.assertEqual(sd[1], 11)
+
+        # Likewise for a writer dying while it rehashes the table.
+        generation = sd._seq.unpack_from(buf, sd._offset_generation)[0]
+        sd._seq.pack_into(buf, sd._offset_generation, generation + 1)
+        with self.assertRaises(RuntimeError):
+            sd[1]
+        sd._seq.pack_into(buf, sd._offset_generation, generation)
+        del buf
+        sd.shm.close()
+
+    def test_shared_memory_ShareableDict_read_timeout(self):
+        # Readers wait longer for a large table, which takes longer to
+        # rehash.
+        small = shared_memory.ShareableDict(capacity=4)
+        self.addCleanup(small.shm.unlink)
+        self.addCleanup(small.shm.close)
+        large = shared_memory.ShareableDict(capacity=100000)
+        self.addCleanup(large.shm.unlink)
+        self.addCleanup(large.shm.close)
+        now = time.monotonic()
+        self.assertGreaterEqual(small._check_deadline(None) - now,
+                                small._read_timeout)
+        self.assertGreater(large._check_deadline(None) - now,
+                           small._check_deadline(None) - now + 10)
+
+    @classmethod
+    def _read_shareable_dict(cls, sd, keys, conn):
+        conn.send([sd.get(key) for key in keys])
+        sd.shm.close()
+
+    def test_shared_memory_ShareableDict_across_processes(self):
+        sd = shared_memory.ShareableDict({i: i * i for i in range(500)})
+        self.addCleanup(sd.shm.unlink)
+        reader, writer = self.Pipe(duplex=False)
+        p = self.Process(target=self._read_shareable_dict,
+                         args=(sd, [0, 10, 499, 500], writer))
+        p.daemon = True
+        p.start()
+        self.assertEqual(reader.recv(), [0, 100, 499 * 499, None])
+        p.join()
+        sd.shm.close()
+
+    def test_shared_memory_pickle(self):
+        obj = [b'x' * 10000, bytearray(b'y' * 20000), b'small', 42]
+        wrapper = shared_memory._SharedMemoryPickle(obj, 1000)
+        loader, (data, name, layout) = wrapper.__reduce__()
+        self.assertIsNotNone(name)
+        self.assertEqual([nbytes for offset, nbytes in layout], [10000, 20000])
+        self.assertLess(len(data), 1000)
+        result = loader(data, name, layout)
+        self.assertEqual(result, obj)
+        self.assertIs(type(result[1]), bytearray)
+        # The block is unlinked once loaded
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
+        # Without large buffers, no block is created
+        loader, (data, name, layout) = shared_memory._SharedMemoryPickle(
+            obj, 100000).__reduce__()
+        self.assertIsNone(name)
+        self.assertEqual(loader(data, name, layout), obj)
+
+        # Out-of-band buffers are mapped from the block
+        buf = pickle.PickleBuffer(b'z' * 5000)
+        result = pickle.loads(pickle.dumps(
+            shared_memory._SharedMemoryPickle(buf, 1000)))
+        self.assertIsInstance(result, memoryview)
+        self.assertEqual(result, b'z' * 5000)
+
+    def test_pool_shared_memory_results(self):
+        with multiprocessing.Pool(2, shared_memory_threshold=1000) as p:
+            self.assertEqual(p.map(bytes, [10, 10000] * 4),
+                             [bytes(10), bytes(10000)] * 4)
+            self.assertEqual(list(p.imap(bytes, [100000] * 2, chunksize=2)),
+                             [bytes(100000)] * 2)
+        with self.assertRaises(ValueError):
+            multiprocessing.Pool(1, shared_memory_threshold=-1)
+
     def test_shared_memory_cleaned_after_process_termination(self):
         cmd = '''if 1:
             import os, time, sys
@@ -5023,6 +5615,45 @@ class TestStartMethod(unittest.TestCase):
                             methods == ['fork', 'spawn', 'forkserver'] or
                             methods == ['spawn', 'fork', 'forkserver'])
 
+    @unittest.skipIf(sys.platform == "win32",
+                     "test only relevant for 'forkserver' method")
+    def test_forkserver_add_preload(self):
+        from multiprocessing import forkserver
+        server = forkserver.ForkServer()
+        server.set_forkserver_preload(['__main__', 'os'])
+        server._add_preload(['os', 'json'])
+        self.assertEqual(server._preload_modules, ['__main__', 'os', 'json'])
+        self.assertRaises(TypeError, server._add_preload, [1])
+        self.assertRaises(TypeError, server.set_forkserver_preload, [1])
+        # No effect once the forkserver process is running
+        server._forkserver_pid = -1
+        server._add_preload(['sys'])
+        self.assertEqual(server._preload_modules, ['__main__', 'os', 'json'])
+
+    @unittest.skipIf(sys.platform == "win32",
+                     "test only relevant for 'forkserver' method")
+    def test_pool_forkserver_preload(self):
+        from concurrent.futures import ProcessPoolExecutor
+        ctx = multiprocessing.get_context('forkserver')
+        with unittest.mock.patch.object(type(ctx), '_preload') as preload:
+            # The preload list is only changed when asked for
+            with ctx.Pool(1) as pool:
+                pool.close()
+                pool.join()
+            with ProcessPoolExecutor(1, mp_context=ctx):
+                pass
+            preload.assert_not_called()
+            with ctx.Pool(1, forkserver_preload=['json']) as pool:
+                pool.close()
+                pool.join()
+            preload.assert_called_once_with(['multiprocessing.pool', 'json'])
+            preload.reset_mock()
+            with ProcessPoolExecutor(1, mp_context=ctx,
+                                     forkserver_preload=['json']):
+                pass
+            preload.assert_called_once_with(['concurrent.futures.process',
+                                             'json'])
+
     def test_preload_resources(self):
         if multiprocessing.get_start_method() != 'forkserver':
             self.skipTest("test only relevant for 'forkserver' method")
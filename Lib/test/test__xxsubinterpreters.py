@@ -1,4 +1,5 @@
 from collections import namedtuple
+import array
 import contextlib
 import itertools
 import os
@@ -399,6 +400,50 @@ class ShareableTypeTests(unittest.TestCase):
         self._assert_values(itertools.chain(range(-1, 258),
                                             [sys.maxsize, -sys.maxsize - 1]))
 
+    def test_buffers(self):
+        data = bytearray(b'spam')
+        for obj in [memoryview(b'spam'), data, memoryview(data),
+                    pickle.PickleBuffer(data)]:
+            with self.subTest(obj):
+                interpreters.channel_send(self.cid, obj)
+                got = interpreters.channel_recv(self.cid)
+
+                # Buffers are received as a memoryview of the original memory
+                self.assertIs(type(got), memoryview)
+                self.assertEqual(got, b'spam')
+                self.assertEqual(got.readonly, memoryview(obj).readonly)
+                if not got.readonly:
+                    got[0] = ord('S')
+                    self.assertEqual(data, b'Spam')
+                    data[0] = ord('s')
+                del got
+
+    def test_buffer_format(self):
+        obj = memoryview(array.array('i', range(6))).cast('B').cast('i',
+                                                                  (2, 3))
+        interpreters.channel_send(self.cid, obj)
+        got = interpreters.channel_recv(self.cid)
+
+        self.assertEqual(got.format, 'i')
+        self.assertEqual(got.shape, (2, 3))
+        self.assertEqual(got.tolist(), [[0, 1, 2], [3, 4, 5]])
+
+    def test_buffer_exports(self):
+        data = bytearray(b'spam')
+        interpreters.channel_send(self.cid, data)
+        # The buffer is exported until the received memoryview is released
+        with self.assertRaises(BufferError):
+            data.append(0)
+        got = interpreters.channel_recv(self.cid)
+        with self.assertRaises(BufferError):
+            data.append(0)
+        got.release()
+        data.append(0)
+
+    def test_non_contiguous_buffer(self):
+        with self.assertRaises(ValueError):
+            interpreters.channel_send(self.cid, memoryview(b'spam')[::2])
+
     def test_non_shareable_int(self):
         ints = [
             sys.maxsize + 1,
@@ -1244,6 +1289,26 @@ class ChannelTests(TestBase):
 
         self.assertEqual(obj, b'spam')
 
+    def test_send_recv_buffer_different_interpreters(self):
+        cid = interpreters.channel_create()
+        data = bytearray(b'spam')
+        interpreters.channel_send(cid, data)
+        id1 = interpreters.create()
+        out = _run_output(id1, dedent(f"""
+            import _xxsubinterpreters as _interpreters
+            obj = _interpreters.channel_recv({cid})
+            obj[0] = ord('S')
+            _interpreters.channel_send({cid}, bytearray(b'eggs'))
+            """))
+        self.assertEqual(data, b'Spam')
+        obj = interpreters.channel_recv(cid)
+        # The memoryview outlives the interpreter which sent it
+        interpreters.destroy(id1)
+
+        self.assertEqual(obj, b'eggs')
+        obj[0] = ord('E')
+        self.assertEqual(obj, b'Eggs')
+
     def test_send_recv_different_threads(self):
         cid = interpreters.channel_create()
 
@@ -1,6 +1,7 @@
 """Tests for base_events.py"""
 
 import concurrent.futures
+import contextvars
 import errno
 import math
 import os
@@ -240,6 +241,84 @@ class BaseEventLoopTests(test_utils.TestCase):
         with self.assertRaisesRegex(TypeError, 'a callable object'):
             self.loop.call_soon(1)
 
+    def test_call_soon_many(self):
+        calls = []
+        var = contextvars.ContextVar('var', default='default')
+
+        def cb(*args):
+            calls.append((args, var.get()))
+
+        ctx = contextvars.copy_context()
+        ctx.run(var.set, 'ctx')
+        handle = self.loop.call_soon_many([cb, (cb, ctx), (cb, None)], 1, 2)
+        self.assertIsInstance(handle, asyncio.Handle)
+        self.assertEqual(list(self.loop._ready), [handle])
+        self.assertEqual(handle._args, (1, 2))
+        self.assertIn('callbacks=[', repr(handle))
+
+        handle._run()
+        self.assertEqual(calls, [((1, 2), 'default'), ((1, 2), 'ctx'),
+                                 ((1, 2), 'default')])
+
+    def test_call_soon_many_allocations(self):
+        # A batch makes one Handle and one copy of the current context,
+        # instead of one of each per callback.
+        with mock.patch('contextvars.copy_context',
+                        wraps=contextvars.copy_context) as copy_context, \
+             mock.patch('asyncio.events.Handle.__init__',
+                        side_effect=AssertionError):
+            self.loop.call_soon_many([lambda: None] * 10)
+        self.assertEqual(copy_context.call_count, 1)
+        self.assertEqual(len(self.loop._ready), 1)
+
+    def test_call_soon_many_context_shared(self):
+        var = contextvars.ContextVar('var', default='default')
+        values = []
+
+        def set_var():
+            var.set('changed')
+
+        def get_var():
+            values.append(var.get())
+
+        self.loop.call_soon_many([set_var, get_var])._run()
+        self.assertEqual(values, ['changed'])
+        self.assertEqual(var.get(), 'default')
+
+    def test_call_soon_many_exception(self):
+        calls = []
+
+        def fail():
+            raise ValueError
+
+        self.loop.call_exception_handler = mock.Mock()
+        handle = self.loop.call_soon_many(
+            [fail, lambda: calls.append(1)])
+        handle._run()
+        self.assertEqual(calls, [1])
+        context = self.loop.call_exception_handler.call_args[0][0]
+        self.assertIsInstance(context['exception'], ValueError)
+        self.assertIs(context['handle'], handle)
+
+    def test_call_soon_many_cancel(self):
+        calls = []
+        handle = self.loop.call_soon_many([calls.append], 1)
+        handle.cancel()
+        self.assertTrue(handle.cancelled())
+        self.assertIsNone(handle._callbacks)
+        handle._run()
+        self.assertEqual(calls, [])
+
+    def test_call_soon_many_non_callable(self):
+        self.loop.set_debug(True)
+        with self.assertRaisesRegex(TypeError, 'a callable object'):
+            self.loop.call_soon_many([lambda: None, 1])
+
+    def test_call_soon_many_closed(self):
+        self.loop.close()
+        with self.assertRaises(RuntimeError):
+            self.loop.call_soon_many([lambda: None])
+
     def test_call_later(self):
         def cb():
             pass
@@ -465,6 +544,64 @@ class BaseEventLoopTests(test_utils.TestCase):
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def test_set_timer_wheel(self):
+        def cb():
+            pass
+
+        h1 = self.loop.call_later(10, cb)
+        h2 = self.loop.call_later(20, cb)
+        h2.cancel()
+
+        self.loop.set_timer_wheel(0.01)
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(list(self.loop._timer_wheel), [h1])
+        self.assertFalse(h2._scheduled)
+
+        h3 = self.loop.call_later(30, cb)
+        self.assertTrue(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 2)
+        h3.cancel()
+        self.assertFalse(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop._timer_wheel)
+        self.assertEqual(self.loop._scheduled, [h1])
+
+        for resolution in (0, -1):
+            with self.assertRaises(ValueError):
+                self.loop.set_timer_wheel(resolution)
+
+    def test__run_once_timer_wheel(self):
+        calls = []
+        self.loop.set_timer_wheel(0.001)
+        self.loop._process_events = mock.Mock()
+        now = self.loop.time()
+        h1 = self.loop.call_at(now + 5.0, calls.append, 1)
+        self.loop.call_at(now + 10.0, calls.append, 2)
+        self.loop.call_at(now - 1.0, calls.append, 3)
+        self.loop.call_at(now - 2.0, calls.append, 4)
+        h1.cancel()
+
+        self.loop._run_once()
+        self.assertEqual(calls, [4, 3])
+        self.assertEqual(self.loop._selector.select.call_args[0][0], 0)
+
+        # The wheel may wake up the loop earlier to cascade the timer
+        # to a lower level, but never later than the deadline.
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(0 <= t <= 10.0, t)
+        self.assertEqual(calls, [4, 3])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+    def test_close_timer_wheel(self):
+        self.loop.set_timer_wheel(0.001)
+        self.loop.call_later(10, lambda: None)
+        self.loop.close()
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
@@ -1945,6 +2082,178 @@ class RunningLoopTests(unittest.TestCase):
             outer_loop.close()
 
 
+class DefaultExecutorLimitsTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        executor = self.loop._default_executor
+        self.loop.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super().tearDown()
+
+    async def wait_started(self, event):
+        while not event.is_set():
+            await asyncio.sleep(0.001)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            self.loop.set_default_executor_limits(max_workers=0)
+        with self.assertRaises(ValueError):
+            self.loop.set_default_executor_limits(max_queue_size=-1)
+
+    def test_max_workers(self):
+        self.loop.set_default_executor_limits(max_workers=3)
+        self.loop.run_until_complete(
+            self.loop.run_in_executor(None, lambda: None))
+        self.assertEqual(self.loop._default_executor._max_workers, 3)
+        self.assertEqual(
+            self.loop.get_default_executor_stats()['max_workers'], 3)
+
+    def test_max_workers_after_creation(self):
+        self.loop.run_until_complete(
+            self.loop.run_in_executor(None, lambda: None))
+        with self.assertRaises(RuntimeError):
+            self.loop.set_default_executor_limits(max_workers=3)
+
+    def test_stats(self):
+        stats = self.loop.get_default_executor_stats()
+        self.assertIsNone(stats['max_workers'])
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['active_workers'], 0)
+        self.assertEqual(stats['completed'], 0)
+
+        async def main():
+            await asyncio.gather(
+                *[self.loop.run_in_executor(None, time.sleep, 0)
+                  for _ in range(5)])
+
+        self.loop.run_until_complete(main())
+        stats = self.loop.get_default_executor_stats()
+        self.assertEqual(stats['completed'], 5)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['active_workers'], 0)
+        histogram = stats['wait_time_histogram']
+        self.assertEqual(histogram[-1][0], math.inf)
+        self.assertEqual(sum(count for bound, count in histogram), 5)
+
+    def blocked_executor(self, max_queue_size):
+        # Start a default executor of one worker, blocked until the
+        # returned event is set, with a full queue.
+        self.loop.set_default_executor_limits(max_workers=1,
+                                              max_queue_size=max_queue_size)
+        started = threading.Event()
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        def blocker():
+            started.set()
+            event.wait()
+            return 'blocker'
+
+        async def main():
+            futs = [self.loop.run_in_executor(None, blocker)]
+            await self.wait_started(started)
+            futs += [self.loop.run_in_executor(None, event.wait)
+                     for _ in range(max_queue_size)]
+            return futs
+
+        return event, self.loop.run_until_complete(main())
+
+    def test_queue_full(self):
+        event, futs = self.blocked_executor(2)
+        with self.assertRaises(asyncio.QueueFull):
+            self.loop.run_in_executor(None, lambda: None)
+        stats = self.loop.get_default_executor_stats()
+        self.assertEqual(stats['queue_depth'], 2)
+        self.assertEqual(stats['active_workers'], 1)
+        event.set()
+        res = self.loop.run_until_complete(asyncio.gather(*futs))
+        self.assertEqual(res, ['blocker', True, True])
+        self.loop.run_until_complete(
+            self.loop.run_in_executor(None, lambda: None))
+
+    def test_to_thread_backpressure(self):
+        event, futs = self.blocked_executor(1)
+        results = []
+
+        async def main():
+            tasks = [asyncio.ensure_future(asyncio.to_thread(results.append, i))
+                     for i in range(10)]
+            await asyncio.sleep(0)
+            # All the callers wait for room in the queue.
+            stats = self.loop.get_default_executor_stats()
+            self.assertEqual(stats['queue_depth'], 1)
+            self.assertEqual(stats['backlog'], 10)
+            event.set()
+            await asyncio.gather(*futs, *tasks)
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(results, list(range(10)))
+        stats = self.loop.get_default_executor_stats()
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['backlog'], 0)
+        self.assertEqual(stats['completed'], 12)
+
+    def test_to_thread_backpressure_cancel(self):
+        event, futs = self.blocked_executor(1)
+        func = mock.Mock()
+
+        async def main():
+            t1 = asyncio.ensure_future(asyncio.to_thread(func, 1))
+            t2 = asyncio.ensure_future(asyncio.to_thread(func, 2))
+            await asyncio.sleep(0)
+            self.assertEqual(
+                self.loop.get_default_executor_stats()['backlog'], 2)
+            t1.cancel()
+            event.set()
+            await asyncio.gather(*futs, t2)
+            with self.assertRaises(asyncio.CancelledError):
+                await t1
+
+        self.loop.run_until_complete(main())
+        func.assert_called_once_with(2)
+
+    def test_close_cancels_waiting_callers(self):
+        event, futs = self.blocked_executor(1)
+        task = self.loop.create_task(asyncio.to_thread(lambda: None))
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(
+            self.loop.get_default_executor_stats()['backlog'], 1)
+        waiter, = self.loop._default_executor_waiters
+        event.set()
+        self.loop._default_executor.shutdown(wait=True)
+        ready = len(self.loop._ready)
+        self.loop.close()
+        self.assertTrue(waiter.cancelled())
+        self.assertEqual(
+            self.loop.get_default_executor_stats()['backlog'], 0)
+        # The wakeup of the task is kept, not discarded.
+        self.assertEqual(len(self.loop._ready), ready + 1)
+        task._log_destroy_pending = False
+
+    def test_raise_queue_size_limit(self):
+        event, futs = self.blocked_executor(1)
+
+        async def main():
+            tasks = [asyncio.ensure_future(asyncio.to_thread(event.wait))
+                     for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertEqual(
+                self.loop.get_default_executor_stats()['backlog'], 3)
+            self.loop.set_default_executor_limits(max_queue_size=0)
+            self.assertEqual(
+                self.loop.get_default_executor_stats()['backlog'], 0)
+            event.set()
+            await asyncio.gather(*futs, *tasks)
+
+        self.loop.run_until_complete(main())
+
+
 class BaseLoopSockSendfileTests(test_utils.TestCase):
 
     DATA = b"12345abcde" * 16 * 1024  # 160 KiB
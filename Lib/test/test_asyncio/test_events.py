@@ -1415,8 +1415,13 @@ class EventLoopTestsMixin:
         transport.write(b'1')
 
         data = bytearray()
+        # proactor event loops write asynchronously: don't block on reads
+        os.set_blocking(rpipe, False)
         def reader(data):
-            chunk = os.read(rpipe, 1024)
+            try:
+                chunk = os.read(rpipe, 1024)
+            except BlockingIOError:
+                return len(data)
             data += chunk
             return len(data)
 
@@ -1480,8 +1485,13 @@ class EventLoopTestsMixin:
         transport.write(b'1')
 
         data = bytearray()
+        # proactor event loops write asynchronously: don't block on reads
+        os.set_blocking(master, False)
         def reader(data):
-            chunk = os.read(master, 1024)
+            try:
+                chunk = os.read(master, 1024)
+            except BlockingIOError:
+                return len(data)
             data += chunk
             return len(data)
 
@@ -1536,8 +1546,13 @@ class EventLoopTestsMixin:
         self.assertEqual('CONNECTED', write_proto.state)
 
         data = bytearray()
+        # proactor event loops write asynchronously: don't block on reads
+        os.set_blocking(master, False)
         def reader(data):
-            chunk = os.read(master, 1024)
+            try:
+                chunk = os.read(master, 1024)
+            except BlockingIOError:
+                return len(data)
             data += chunk
             return len(data)
 
@@ -2092,6 +2107,58 @@ else:
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    class UnixProactorEventLoopTestsMixin(UnixEventLoopTestsMixin):
+
+        def test_reader_callback(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_reader()")
+
+        def test_reader_callback_cancel(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_reader()")
+
+        def test_writer_callback(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_writer()")
+
+        def test_writer_callback_cancel(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_writer()")
+
+        def test_remove_fds_after_closing(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_reader()")
+
+        def test_add_fds_after_closing(self):
+            raise unittest.SkipTest("ProactorEventLoop does not have "
+                                    "add_reader()")
+
+        def test_unclosed_pipe_transport(self):
+            raise unittest.SkipTest("proactor pipe transports don't show "
+                                    "their state in repr()")
+
+    class SelectorProactorEventLoopTests(UnixProactorEventLoopTestsMixin,
+                                         SubprocessTestsMixin,
+                                         test_utils.TestCase):
+
+        def create_event_loop(self):
+            return asyncio.ProactorEventLoop(asyncio.SelectorProactor())
+
+    def _has_io_uring():
+        try:
+            asyncio.UringProactor().close()
+        except OSError:
+            return False
+        return True
+
+    @unittest.skipUnless(_has_io_uring(), 'io_uring is not available')
+    class UringProactorEventLoopTests(UnixProactorEventLoopTestsMixin,
+                                      SubprocessTestsMixin,
+                                      test_utils.TestCase):
+
+        def create_event_loop(self):
+            return asyncio.ProactorEventLoop(asyncio.UringProactor())
+
 
 def noop(*args, **kwargs):
     pass
@@ -2421,10 +2488,16 @@ class AbstractEventLoopTests(unittest.TestCase):
             NotImplementedError, loop.call_soon, None)
         self.assertRaises(
             NotImplementedError, loop.time)
+        self.assertRaises(
+            NotImplementedError, loop.set_timer_wheel, 0.001)
         self.assertRaises(
             NotImplementedError, loop.call_soon_threadsafe, None)
         self.assertRaises(
             NotImplementedError, loop.set_default_executor, f)
+        self.assertRaises(
+            NotImplementedError, loop.set_default_executor_limits)
+        self.assertRaises(
+            NotImplementedError, loop.get_default_executor_stats)
         self.assertRaises(
             NotImplementedError, loop.add_reader, 1, f)
         self.assertRaises(
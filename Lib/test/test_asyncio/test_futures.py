@@ -1,6 +1,7 @@
 """Tests for futures.py."""
 
 import concurrent.futures
+import contextvars
 import gc
 import re
 import sys
@@ -109,6 +110,25 @@ class BaseFutureTests:
         self.loop = self.new_test_loop()
         self.addCleanup(self.loop.close)
 
+    def test_callbacks_loop_without_call_soon_many(self):
+        class MinimalLoop:
+            def __init__(self):
+                self.scheduled = []
+
+            def get_debug(self):
+                return False
+
+            def call_soon(self, callback, *args, context=None):
+                self.scheduled.append(callback)
+
+        loop = MinimalLoop()
+        f = self._new_future(loop=loop)
+        callbacks = [mock.Mock() for _ in range(3)]
+        for callback in callbacks:
+            f.add_done_callback(callback)
+        f.set_result(None)
+        self.assertEqual(loop.scheduled, callbacks)
+
     def test_isfuture(self):
         class MyFuture:
             _asyncio_future_blocking = None
@@ -696,6 +716,39 @@ class BaseFutureDoneCallbackTests():
         self.assertEqual(bag, [42, 17])
         self.assertEqual(f.result(), 'foo')
 
+    def test_many_callbacks_scheduled_at_once(self):
+        bag = []
+        f = self._new_future()
+        for i in range(10):
+            f.add_done_callback(self._make_callback(bag, i))
+
+        with mock.patch('contextvars.copy_context') as copy_context:
+            f.set_result('foo')
+        # A single Handle runs all the callbacks, in their own contexts.
+        self.assertEqual(len(self.loop._ready), 1)
+        copy_context.assert_not_called()
+
+        self.run_briefly()
+        self.assertEqual(bag, list(range(10)))
+
+    def test_many_callbacks_keep_their_context(self):
+        var = contextvars.ContextVar('var', default='default')
+        bag = []
+
+        def callback(fut):
+            bag.append(var.get())
+
+        f = self._new_future()
+        for i in range(3):
+            ctx = contextvars.copy_context()
+            ctx.run(var.set, i)
+            f.add_done_callback(callback, context=ctx)
+        f.add_done_callback(callback)
+        f.set_result(None)
+
+        self.run_briefly()
+        self.assertEqual(bag, [0, 1, 2, 'default'])
+
     def test_callbacks_invoked_on_set_exception(self):
         bag = []
         f = self._new_future()
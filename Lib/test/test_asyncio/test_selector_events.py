@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import selectors
 import socket
 import unittest
@@ -14,6 +15,7 @@ from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSocketTransport
 from asyncio.selector_events import _SelectorDatagramTransport
+from test import support
 from test.test_asyncio import utils as test_utils
 
 
@@ -39,6 +41,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+def list_to_deque(l=()):
+    return collections.deque(l)
+
+
 def close_transport(transport):
     # Don't call transport.close() because the event loop and the selector
     # are mocked
@@ -509,9 +515,10 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock = mock.Mock(socket.socket)
         self.sock_fd = self.sock.fileno.return_value = 7
 
-    def socket_transport(self, waiter=None):
+    def socket_transport(self, waiter=None, sendmsg=False):
         transport = _SelectorSocketTransport(self.loop, self.sock,
                                              self.protocol, waiter=waiter)
+        transport._use_sendmsg = sendmsg
         self.addCleanup(close_transport, transport)
         return transport
 
@@ -680,17 +687,17 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
                          transport._buffer)
 
     def test_write_partial(self):
@@ -701,7 +708,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -711,7 +718,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -722,7 +729,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -733,7 +740,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -743,7 +750,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -784,7 +791,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -796,7 +803,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -814,45 +821,223 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = list_to_deque([b'data1', b'data2'])
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data1data2']), transport._buffer)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
+        transport._write_ready()
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal write error on socket transport')
+
+    def test_write_partial_bytearray_copied(self):
+        data = bytearray(b'data')
+        self.sock.send.return_value = 0
+
+        transport = self.socket_transport()
+        transport.write(data)
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
+
+    def test_write_buffer_chunks_not_joined(self):
+        data = b'data'
+        self.sock.send.return_value = 0
+
+        transport = self.socket_transport()
+        transport.write(data)
+        transport.write(b'more')
+        self.assertIs(transport._buffer[0], data)
+        self.assertEqual(list_to_deque([b'data', b'more']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    def test_write_sendmsg_full(self):
+        data = memoryview(b'data')
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = len(data)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(data)
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertTrue(self.sock.sendmsg.called)
+        self.assertFalse(self.loop.writers)
+
+    def test_write_sendmsg_partial(self):
+        self.sock.sendmsg = mock.Mock()
+        # Sent: b'data1' and b'da'
+        self.sock.sendmsg.return_value = 7
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.extend([b'data1', b'data2', b'data3'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertTrue(self.sock.sendmsg.called)
+        self.assertTrue(self.loop.writers)
+        self.assertEqual(list_to_deque([b'ta2', b'data3']), transport._buffer)
+
+    def test_write_sendmsg_tryagain(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.side_effect = BlockingIOError
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.extend([b'data1', b'data2'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
+                         transport._buffer)
+
+    @mock.patch('asyncio.selector_events.logger')
+    def test_write_sendmsg_OSError(self, m_log):
+        self.sock.sendmsg = mock.Mock()
+        err = self.sock.sendmsg.side_effect = OSError()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._fatal_error = mock.Mock()
+        transport._buffer.extend([b'data1', b'data2'])
         transport._write_ready()
+        self.assertFalse(transport._buffer)
         transport._fatal_error.assert_called_with(
                                    err,
                                    'Fatal write error on socket transport')
 
+    def test_write_ready_subclass_override(self):
+        calls = []
+
+        class Transport(_SelectorSocketTransport):
+            def _write_ready(self):
+                calls.append(self)
+                super()._write_ready()
+
+        self.sock.send.return_value = 0
+        transport = Transport(self.loop, self.sock, self.protocol)
+        self.addCleanup(close_transport, transport)
+        transport._use_sendmsg = False
+        transport.write(b'data')
+        self.loop.assert_writer(7, transport._write_ready)
+        self.loop.writers[7]._run()
+        self.assertEqual(calls, [transport])
+
+    def test_sc_iov_max_indeterminate(self):
+        # The package attribute is restored along with sys.modules.
+        with mock.patch('os.sysconf', return_value=-1), \
+             support.swap_attr(asyncio, 'selector_events',
+                               asyncio.selector_events):
+            module = support.import_fresh_module('asyncio.selector_events')
+        self.assertTrue(module._HAS_SENDMSG)
+        self.assertEqual(module.SC_IOV_MAX, 1024)
+
+    def test_writelines_send_full(self):
+        data = memoryview(b'data')
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = len(data) * 2
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([data, bytearray(b'data')])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_send_partial(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 5
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(iter([b'data1', b'', b'data2']))
+        self.assertTrue(self.sock.sendmsg.called)
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'data2']), transport._buffer)
+
+    def test_writelines_buffered(self):
+        self.sock.sendmsg = mock.Mock()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(b'data1')
+        transport.writelines([b'data2', b'data3'])
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list_to_deque([b'data1', b'data2', b'data3']),
+                         transport._buffer)
+
+    def test_writelines_pauses_protocol(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 0
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=4)
+        transport.writelines([b'data1', b'data2'])
+        self.assertTrue(self.protocol.pause_writing.called)
+
+    def test_write_buffer_size(self):
+        self.sock.send.side_effect = BlockingIOError
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 7
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.write(b'data1')
+        transport.writelines([b'data2', bytearray(b'data3')])
+        self.assertEqual(transport.get_write_buffer_size(), 15)
+        transport._write_ready()
+        self.assertEqual(list_to_deque([b'ta2', b'data3']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+        transport.write(memoryview(b'data4'))
+        self.assertEqual(transport.get_write_buffer_size(), 13)
+
+        self.sock.sendmsg.side_effect = OSError()
+        transport._fatal_error = mock.Mock()
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_write_buffer_size_force_close(self):
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport.write(b'data')
+        self.assertEqual(transport.get_write_buffer_size(), 4)
+        transport.abort()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_writelines_str(self):
+        transport = self.socket_transport(sendmsg=True)
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_after_write_eof(self):
+        transport = self.socket_transport(sendmsg=True)
+        transport.write_eof()
+        with self.assertRaises(RuntimeError):
+            transport.writelines([b'data'])
+
     def test_write_eof(self):
         tr = self.socket_transport()
         self.assertTrue(tr.can_write_eof())
@@ -867,7 +1052,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, list_to_deque([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -904,9 +1089,10 @@ class SelectorSocketTransportBufferedProtocolTests(test_utils.TestCase):
         self.sock = mock.Mock(socket.socket)
         self.sock_fd = self.sock.fileno.return_value = 7
 
-    def socket_transport(self, waiter=None):
+    def socket_transport(self, waiter=None, sendmsg=False):
         transport = _SelectorSocketTransport(self.loop, self.sock,
                                              self.protocol, waiter=waiter)
+        transport._use_sendmsg = sendmsg
         self.addCleanup(close_transport, transport)
         return transport
 
@@ -141,13 +141,13 @@ class StreamTests(test_utils.TestCase):
         stream = asyncio.StreamReader(loop=self.loop)
 
         stream.feed_data(b'')
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_feed_nonempty_data(self):
         stream = asyncio.StreamReader(loop=self.loop)
 
         stream.feed_data(self.DATA)
-        self.assertEqual(self.DATA, stream._buffer)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
 
     def test_read_zero(self):
         # Read zero bytes.
@@ -156,7 +156,7 @@ class StreamTests(test_utils.TestCase):
 
         data = self.loop.run_until_complete(stream.read(0))
         self.assertEqual(b'', data)
-        self.assertEqual(self.DATA, stream._buffer)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
 
     def test_read(self):
         # Read bytes.
@@ -169,7 +169,7 @@ class StreamTests(test_utils.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA, data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_read_line_breaks(self):
         # Read bytes without line breaks.
@@ -180,7 +180,7 @@ class StreamTests(test_utils.TestCase):
         data = self.loop.run_until_complete(stream.read(5))
 
         self.assertEqual(b'line1', data)
-        self.assertEqual(b'line2', stream._buffer)
+        self.assertEqual(b'line2', bytes(stream._buffer))
 
     def test_read_eof(self):
         # Read bytes, stop at eof.
@@ -193,7 +193,7 @@ class StreamTests(test_utils.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(b'', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_read_until_eof(self):
         # Read all bytes until eof.
@@ -209,7 +209,7 @@ class StreamTests(test_utils.TestCase):
         data = self.loop.run_until_complete(read_task)
 
         self.assertEqual(b'chunk1\nchunk2', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_read_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -234,7 +234,7 @@ class StreamTests(test_utils.TestCase):
         stream.feed_data(b'chunk')
         data = self.loop.run_until_complete(stream.read(5))
         self.assertEqual(b'chunk', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readline(self):
         # Read one line. 'readline' will need to wait for the data
@@ -251,7 +251,7 @@ class StreamTests(test_utils.TestCase):
 
         line = self.loop.run_until_complete(read_task)
         self.assertEqual(b'chunk1 chunk2 chunk3 \n', line)
-        self.assertEqual(b' chunk4', stream._buffer)
+        self.assertEqual(b' chunk4', bytes(stream._buffer))
 
     def test_readline_limit_with_existing_data(self):
         # Read one line. The data is in StreamReader's buffer
@@ -264,7 +264,7 @@ class StreamTests(test_utils.TestCase):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
         # The buffer should contain the remaining data after exception
-        self.assertEqual(b'line2\n', stream._buffer)
+        self.assertEqual(b'line2\n', bytes(stream._buffer))
 
         stream = asyncio.StreamReader(limit=3, loop=self.loop)
         stream.feed_data(b'li')
@@ -278,7 +278,7 @@ class StreamTests(test_utils.TestCase):
         # the entire buffer, and since the length of the consumed data
         # is more than 3, it will raise a ValueError. The buffer is
         # expected to be empty now.
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_at_eof(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -311,7 +311,7 @@ class StreamTests(test_utils.TestCase):
             ValueError, self.loop.run_until_complete, stream.readline())
         # The buffer had just one line of data, and after raising
         # a ValueError it should be empty.
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream = asyncio.StreamReader(limit=7, loop=self.loop)
         def cb():
@@ -323,24 +323,24 @@ class StreamTests(test_utils.TestCase):
 
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual(b'chunk3\n', stream._buffer)
+        self.assertEqual(b'chunk3\n', bytes(stream._buffer))
 
         # check strictness of the limit
         stream = asyncio.StreamReader(limit=7, loop=self.loop)
         stream.feed_data(b'1234567\n')
         line = self.loop.run_until_complete(stream.readline())
         self.assertEqual(b'1234567\n', line)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'12345678\n')
         with self.assertRaises(ValueError) as cm:
             self.loop.run_until_complete(stream.readline())
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'12345678')
         with self.assertRaises(ValueError) as cm:
             self.loop.run_until_complete(stream.readline())
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readline_nolimit_nowait(self):
         # All needed data for the first 'readline' call will be
@@ -352,7 +352,7 @@ class StreamTests(test_utils.TestCase):
         line = self.loop.run_until_complete(stream.readline())
 
         self.assertEqual(b'line1\n', line)
-        self.assertEqual(b'line2\nline3\n', stream._buffer)
+        self.assertEqual(b'line2\nline3\n', bytes(stream._buffer))
 
     def test_readline_eof(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -378,7 +378,7 @@ class StreamTests(test_utils.TestCase):
         data = self.loop.run_until_complete(stream.read(7))
 
         self.assertEqual(b'line2\nl', data)
-        self.assertEqual(b'ine3\n', stream._buffer)
+        self.assertEqual(b'ine3\n', bytes(stream._buffer))
 
     def test_readline_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -390,7 +390,7 @@ class StreamTests(test_utils.TestCase):
         stream.set_exception(ValueError())
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readuntil_separator(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -403,17 +403,17 @@ class StreamTests(test_utils.TestCase):
         stream.feed_data(b'lineAAA')
         data = self.loop.run_until_complete(stream.readuntil(separator=b'AAA'))
         self.assertEqual(b'lineAAA', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'lineAAA')
         data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
         self.assertEqual(b'lineAAA', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'lineAAAxxx')
         data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
         self.assertEqual(b'lineAAA', data)
-        self.assertEqual(b'xxx', stream._buffer)
+        self.assertEqual(b'xxx', bytes(stream._buffer))
 
     def test_readuntil_multi_chunks_1(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -423,24 +423,24 @@ class StreamTests(test_utils.TestCase):
         stream.feed_data(b'a')
         data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
         self.assertEqual(b'QWEaaXYaaa', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'QWEaa')
         stream.feed_data(b'XYa')
         stream.feed_data(b'aa')
         data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
         self.assertEqual(b'QWEaaXYaaa', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'aaa')
         data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
         self.assertEqual(b'aaa', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'Xaaa')
         data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
         self.assertEqual(b'Xaaa', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
         stream.feed_data(b'XXX')
         stream.feed_data(b'a')
@@ -448,7 +448,7 @@ class StreamTests(test_utils.TestCase):
         stream.feed_data(b'a')
         data = self.loop.run_until_complete(stream.readuntil(b'aaa'))
         self.assertEqual(b'XXXaaa', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readuntil_eof(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -461,7 +461,7 @@ class StreamTests(test_utils.TestCase):
             self.loop.run_until_complete(stream.readuntil(b'AAA'))
         self.assertEqual(cm.exception.partial, data)
         self.assertIsNone(cm.exception.expected)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readuntil_limit_found_sep(self):
         stream = asyncio.StreamReader(loop=self.loop, limit=3)
@@ -470,14 +470,14 @@ class StreamTests(test_utils.TestCase):
                                     'not found') as cm:
             self.loop.run_until_complete(stream.readuntil(b'AAA'))
 
-        self.assertEqual(b'some dataAA', stream._buffer)
+        self.assertEqual(b'some dataAA', bytes(stream._buffer))
 
         stream.feed_data(b'A')
         with self.assertRaisesRegex(asyncio.LimitOverrunError,
                                     'is found') as cm:
             self.loop.run_until_complete(stream.readuntil(b'AAA'))
 
-        self.assertEqual(b'some dataAAA', stream._buffer)
+        self.assertEqual(b'some dataAAA', bytes(stream._buffer))
 
     def test_readexactly_zero_or_less(self):
         # Read exact number of bytes (zero or less).
@@ -486,11 +486,11 @@ class StreamTests(test_utils.TestCase):
 
         data = self.loop.run_until_complete(stream.readexactly(0))
         self.assertEqual(b'', data)
-        self.assertEqual(self.DATA, stream._buffer)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
 
         with self.assertRaisesRegex(ValueError, 'less than zero'):
             self.loop.run_until_complete(stream.readexactly(-1))
-        self.assertEqual(self.DATA, stream._buffer)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
 
     def test_readexactly(self):
         # Read exact number of bytes.
@@ -507,14 +507,14 @@ class StreamTests(test_utils.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA + self.DATA, data)
-        self.assertEqual(self.DATA, stream._buffer)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
 
     def test_readexactly_limit(self):
         stream = asyncio.StreamReader(limit=3, loop=self.loop)
         stream.feed_data(b'chunk')
         data = self.loop.run_until_complete(stream.readexactly(5))
         self.assertEqual(b'chunk', data)
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readexactly_eof(self):
         # Read exact number of bytes (eof).
@@ -533,7 +533,7 @@ class StreamTests(test_utils.TestCase):
         self.assertEqual(cm.exception.expected, n)
         self.assertEqual(str(cm.exception),
                          '18 bytes read on a total of 36 expected bytes')
-        self.assertEqual(b'', stream._buffer)
+        self.assertEqual(b'', bytes(stream._buffer))
 
     def test_readexactly_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
@@ -546,6 +546,161 @@ class StreamTests(test_utils.TestCase):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readexactly_view(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        data = self.loop.run_until_complete(stream.readexactly(4, view=True))
+        self.assertIsInstance(data, memoryview)
+        self.assertTrue(data.readonly)
+        self.assertEqual(b'line', data)
+
+        # The remaining data of the chunk is returned without a copy.
+        data = self.loop.run_until_complete(
+            stream.readexactly(len(self.DATA) - 4, view=True))
+        self.assertIs(data.obj, self.DATA)
+        self.assertEqual(self.DATA[4:], data)
+        self.assertEqual(b'', bytes(stream._buffer))
+
+    def test_readexactly_view_several_chunks(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'frame')
+        stream.feed_data(b'header')
+
+        data = self.loop.run_until_complete(stream.readexactly(8, view=True))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'framehea', data)
+        self.assertEqual(b'der', bytes(stream._buffer))
+
+        data = self.loop.run_until_complete(stream.readexactly(0, view=True))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'', data)
+
+    def test_readexactly_whole_chunk_not_copied(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        data = self.loop.run_until_complete(stream.readexactly(len(self.DATA)))
+        self.assertIs(data, self.DATA)
+
+    def test_writelines_large_chunks(self):
+        # Header and body chunks are queued without being joined and
+        # reach the peer in order.
+        rsock, wsock = socket.socketpair()
+        chunks = [b'HTTP/1.1 200 OK\r\n\r\n']
+        chunks += [bytes([i]) * 300000 for i in range(4)]
+        chunks.append(memoryview(b'trailer'))
+        chunks.append(bytearray(b'end'))
+        expected = b''.join(chunks)
+
+        async def main():
+            reader, _ = await asyncio.open_connection(sock=rsock)
+            _, writer = await asyncio.open_connection(sock=wsock)
+            writer.writelines(chunks)
+            chunks[-1][:] = b'xxx'  # The transport made its own copy
+            data = await reader.readexactly(len(expected))
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            return data
+
+        self.assertEqual(self.loop.run_until_complete(main()), expected)
+        rsock.close()
+
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(8)
+
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'chunk1')
+            stream.feed_data(b'chunk2')
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(8, n)
+        self.assertEqual(b'chunk1ch', buf)
+        self.assertEqual(b'unk2', bytes(stream._buffer))
+
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(4, n)
+        self.assertEqual(b'unk2k1ch', buf)
+        self.assertEqual(b'', bytes(stream._buffer))
+
+    def test_readinto_memoryview(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(
+            stream.readinto(memoryview(buf)[2:6]))
+        self.assertEqual(4, n)
+        self.assertEqual(b'\0\0line\0\0\0\0', buf)
+
+    def test_readinto_zero(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(0, n)
+        self.assertEqual(self.DATA, bytes(stream._buffer))
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(4)))
+
+        def cb():
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        self.assertEqual(0, self.loop.run_until_complete(read_task))
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line\n')
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
+    def test_readuntil_separator_across_chunks(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        for chunk in (b'some da', b'ta\r', b'\n', b'\r\nmore'):
+            stream.feed_data(chunk)
+
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertEqual(b'some data\r\n', data)
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertEqual(b'\r\n', data)
+        self.assertEqual(b'more', bytes(stream._buffer))
+
+    def test_chunked_buffer_find(self):
+        data = b'abcabcdabcdeabcdef'
+        for sizes in ((18,), (1,) * 18, (2, 3, 5, 8), (7, 1, 10), (4, 14)):
+            buf = asyncio.streams._ChunkedBuffer()
+            pos = 0
+            for size in sizes:
+                buf.append(data[pos:pos + size])
+                pos += size
+            for sub in (b'a', b'abcd', b'cdea', b'def', b'zz', data):
+                for start in range(len(data) + 1):
+                    with self.subTest(sizes=sizes, sub=sub, start=start):
+                        self.assertEqual(buf.find(sub, start),
+                                         data.find(sub, start))
+
+    def test_chunked_buffer_consume(self):
+        buf = asyncio.streams._ChunkedBuffer()
+        for chunk in (b'abc', bytearray(b'def'), memoryview(b'ghij')):
+            buf.append(chunk)
+        self.assertEqual(10, len(buf))
+        self.assertEqual(b'ab', buf.consume(2))
+        self.assertEqual(b'cdefg', buf.consume(5))
+        buf.discard(1)
+        self.assertEqual(b'ij', bytes(buf))
+        self.assertTrue(buf.startswith(b'j', 1))
+        self.assertFalse(buf.startswith(b'jk', 1))
+        self.assertEqual(b'ij', buf.consume(10))
+        self.assertFalse(buf)
+        self.assertEqual(b'', buf.consume(1))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -990,5 +1145,162 @@ os.close(fd)
         self.assertEqual(messages, [])
 
 
+
+class ConnectionPoolTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.accepted = 0
+
+        async def echo(reader, writer):
+            self.accepted += 1
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(line)
+            writer.close()
+
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(echo, support.HOST, 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        test_utils.run_briefly(self.loop)
+        self.loop.close()
+        gc.collect()
+        super().tearDown()
+
+    async def echo(self, pool, data):
+        async with pool.connection(support.HOST, self.port) as (r, w):
+            w.write(data)
+            return await r.readline()
+
+    def test_reuse(self):
+        async def main():
+            async with asyncio.ConnectionPool() as pool:
+                for i in range(3):
+                    self.assertEqual(await self.echo(pool, b'ping\n'),
+                                     b'ping\n')
+                return pool.stats()
+
+        stats = self.loop.run_until_complete(main())
+        self.assertEqual(self.accepted, 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+
+    def test_lifo(self):
+        async def main():
+            async with asyncio.ConnectionPool() as pool:
+                r1, w1 = await pool.acquire(support.HOST, self.port)
+                r2, w2 = await pool.acquire(support.HOST, self.port)
+                pool.release(w1)
+                pool.release(w2)
+                r, w = await pool.acquire(support.HOST, self.port)
+                self.assertIs(w, w2)
+                pool.release(w)
+
+        self.loop.run_until_complete(main())
+
+    def test_max_size(self):
+        async def main():
+            async with asyncio.ConnectionPool(max_size=1) as pool:
+                r1, w1 = await pool.acquire(support.HOST, self.port)
+                task = self.loop.create_task(
+                    pool.acquire(support.HOST, self.port))
+                await asyncio.sleep(0.01)
+                self.assertFalse(task.done())
+                pool.release(w1)
+                r2, w2 = await task
+                self.assertIs(w2, w1)
+                pool.release(w2)
+                return pool.stats()
+
+        stats = self.loop.run_until_complete(main())
+        self.assertEqual(self.accepted, 1)
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['wait_time'], 0)
+        self.assertEqual(stats['wait_time'], stats['max_wait_time'])
+
+    def test_idle_timeout(self):
+        async def main():
+            pool = asyncio.ConnectionPool(idle_timeout=0.01)
+            r, w = await pool.acquire(support.HOST, self.port)
+            pool.release(w)
+            self.assertEqual(pool.stats()['idle'], 1)
+            await asyncio.sleep(0.05)
+            self.assertEqual(pool.stats()['idle'], 0)
+            self.assertTrue(w.is_closing())
+            await self.echo(pool, b'ping\n')
+            await pool.close()
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(self.accepted, 2)
+
+    def test_health_check(self):
+        checked = []
+
+        async def health_check(reader, writer):
+            checked.append(writer)
+            return len(checked) > 1
+
+        async def main():
+            async with asyncio.ConnectionPool(
+                    health_check=health_check) as pool:
+                for i in range(3):
+                    await self.echo(pool, b'ping\n')
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(len(checked), 2)
+        self.assertEqual(self.accepted, 2)
+
+    def test_discard(self):
+        async def main():
+            async with asyncio.ConnectionPool() as pool:
+                with self.assertRaises(ZeroDivisionError):
+                    async with pool.connection(support.HOST, self.port):
+                        1 / 0
+                self.assertEqual(pool.stats()['idle'], 0)
+
+                # unread data
+                r, w = await pool.acquire(support.HOST, self.port)
+                w.write(b'ping\n')
+                await asyncio.sleep(0.01)
+                pool.release(w)
+                self.assertTrue(w.is_closing())
+
+                with self.assertRaises(ValueError):
+                    pool.release(w)
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(self.accepted, 2)
+
+    def test_closed(self):
+        async def main():
+            pool = asyncio.ConnectionPool()
+            r, w = await pool.acquire(support.HOST, self.port)
+            await pool.close()
+            self.assertTrue(pool.is_closed())
+            with self.assertRaises(RuntimeError):
+                await pool.acquire(support.HOST, self.port)
+            pool.release(w)
+            self.assertTrue(w.is_closing())
+
+        self.loop.run_until_complete(main())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(max_size=0)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(idle_timeout=-1)
+
+
 if __name__ == '__main__':
     unittest.main()
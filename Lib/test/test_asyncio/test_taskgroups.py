@@ -0,0 +1,289 @@
+"""Tests for asyncio.TaskGroup."""
+
+import asyncio
+import unittest
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class MyExc(Exception):
+    pass
+
+
+class TaskGroupTests(unittest.TestCase):
+
+    def test_taskgroup_01(self):
+        async def foo1():
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def foo2():
+            await asyncio.sleep(0.02)
+            return 11
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                t1 = g.create_task(foo1())
+                t2 = g.create_task(foo2())
+            return t1, t2
+
+        t1, t2 = asyncio.run(runner())
+        self.assertEqual(t1.result(), 42)
+        self.assertEqual(t2.result(), 11)
+
+    def test_taskgroup_task_name(self):
+        async def foo():
+            pass
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                t = g.create_task(foo(), name='spam')
+            return t
+
+        t = asyncio.run(runner())
+        self.assertEqual(t.get_name(), 'spam')
+
+    def test_taskgroup_child_error_cancels_siblings(self):
+        cancelled = 0
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise MyExc('boom')
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                for _ in range(10):
+                    g.create_task(slow())
+                g.create_task(fail())
+
+        with self.assertRaises(asyncio.TaskGroupError) as cm:
+            asyncio.run(runner())
+
+        self.assertEqual(cancelled, 10)
+        self.assertEqual(len(cm.exception.errors), 1)
+        self.assertIsInstance(cm.exception.errors[0], MyExc)
+
+    def test_taskgroup_collects_all_errors(self):
+        async def fail(n):
+            raise MyExc(n)
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(fail(1))
+                g.create_task(fail(2))
+
+        with self.assertRaises(asyncio.TaskGroupError) as cm:
+            asyncio.run(runner())
+
+        self.assertEqual(sorted(e.args[0] for e in cm.exception.errors),
+                         [1, 2])
+
+    def test_taskgroup_body_interrupted_by_child_error(self):
+        body_cancelled = False
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise MyExc
+
+        async def runner():
+            nonlocal body_cancelled
+            async with asyncio.TaskGroup() as g:
+                g.create_task(fail())
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    body_cancelled = True
+                    raise
+
+        with self.assertRaises(asyncio.TaskGroupError):
+            asyncio.run(runner())
+        self.assertTrue(body_cancelled)
+
+    def test_taskgroup_body_error(self):
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(slow())
+                await asyncio.sleep(0)
+                raise MyExc('body')
+
+        with self.assertRaises(asyncio.TaskGroupError) as cm:
+            asyncio.run(runner())
+        self.assertTrue(cancelled)
+        self.assertEqual(len(cm.exception.errors), 1)
+        self.assertIsInstance(cm.exception.errors[0], MyExc)
+
+    def test_taskgroup_outer_cancellation(self):
+        cancelled = 0
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        async def body():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(slow())
+                g.create_task(slow())
+                await asyncio.sleep(10)
+
+        async def runner():
+            t = asyncio.create_task(body())
+            await asyncio.sleep(0.01)
+            t.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await t
+
+        asyncio.run(runner())
+        self.assertEqual(cancelled, 2)
+
+    def test_taskgroup_outer_cancellation_while_exiting(self):
+        cancelled = 0
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        async def body():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(slow())
+
+        async def runner():
+            t = asyncio.create_task(body())
+            await asyncio.sleep(0.01)
+            t.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await t
+
+        asyncio.run(runner())
+        self.assertEqual(cancelled, 1)
+
+    def test_taskgroup_base_error(self):
+        async def crash():
+            raise KeyboardInterrupt
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(crash())
+                await asyncio.sleep(10)
+
+        loop = asyncio.new_event_loop()
+        try:
+            task = loop.create_task(runner())
+            # The first KeyboardInterrupt escapes from the crashing task
+            # itself, the second one is re-raised by the group.
+            with self.assertRaises(KeyboardInterrupt):
+                loop.run_until_complete(task)
+            with self.assertRaises(KeyboardInterrupt):
+                loop.run_until_complete(task)
+            self.assertIsInstance(task.exception(), KeyboardInterrupt)
+        finally:
+            loop.close()
+
+    def test_taskgroup_create_task_after_exit(self):
+        async def coro():
+            pass
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                pass
+            c = coro()
+            with self.assertRaisesRegex(RuntimeError, 'is finished'):
+                g.create_task(c)
+            c.close()
+
+        asyncio.run(runner())
+
+    def test_taskgroup_create_task_not_entered(self):
+        g = asyncio.TaskGroup()
+
+        async def coro():
+            pass
+
+        c = coro()
+        with self.assertRaisesRegex(RuntimeError, 'has not been entered'):
+            g.create_task(c)
+        c.close()
+
+    def test_taskgroup_double_enter(self):
+        async def runner():
+            g = asyncio.TaskGroup()
+            async with g:
+                with self.assertRaisesRegex(RuntimeError, 'already entered'):
+                    async with g:
+                        pass
+
+        asyncio.run(runner())
+
+    def test_taskgroup_create_task_while_aborting(self):
+        async def fail():
+            raise MyExc
+
+        async def spawner(g):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                async def coro():
+                    pass
+                with self.assertRaisesRegex(RuntimeError, 'shutting down'):
+                    g.create_task(coro())
+                raise
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                g.create_task(spawner(g))
+                g.create_task(fail())
+
+        with self.assertRaises(asyncio.TaskGroupError):
+            asyncio.run(runner())
+
+    def test_taskgroup_error_pickle(self):
+        import pickle
+        exc = asyncio.TaskGroupError('msg', [MyExc(1)])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=proto):
+                e = pickle.loads(pickle.dumps(exc, proto))
+                self.assertEqual(e.args, ('msg',))
+                self.assertEqual(len(e.errors), 1)
+
+    def test_taskgroup_many_tasks(self):
+        async def noop(i):
+            await asyncio.sleep(0)
+            return i
+
+        async def runner():
+            async with asyncio.TaskGroup() as g:
+                tasks = [g.create_task(noop(i)) for i in range(1000)]
+            return sum(t.result() for t in tasks)
+
+        self.assertEqual(asyncio.run(runner()), sum(range(1000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
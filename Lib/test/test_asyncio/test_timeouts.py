@@ -0,0 +1,269 @@
+"""Tests for asyncio/timeouts.py"""
+
+import asyncio
+import unittest
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class TimeoutTests(unittest.TestCase):
+
+    def test_timeout_basic(self):
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                async with asyncio.timeout(0.01) as cm:
+                    await asyncio.sleep(10)
+            self.assertTrue(cm.expired())
+
+        asyncio.run(main())
+
+    def test_timeout_at_basic(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            with self.assertRaises(asyncio.TimeoutError):
+                deadline = loop.time() + 0.01
+                async with asyncio.timeout_at(deadline) as cm:
+                    await asyncio.sleep(10)
+            self.assertTrue(cm.expired())
+            self.assertEqual(deadline, cm.when())
+
+        asyncio.run(main())
+
+    def test_nested_timeouts(self):
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                async with asyncio.timeout(10) as cm1:
+                    async with asyncio.timeout(0.01) as cm2:
+                        await asyncio.sleep(10)
+            self.assertFalse(cm1.expired())
+            self.assertTrue(cm2.expired())
+
+        asyncio.run(main())
+
+    def test_waiter_cancelled(self):
+        async def main():
+            cancelled = False
+            with self.assertRaises(asyncio.TimeoutError):
+                async with asyncio.timeout(0.01):
+                    try:
+                        await asyncio.sleep(10)
+                    except asyncio.CancelledError:
+                        cancelled = True
+                        raise
+            self.assertTrue(cancelled)
+
+        asyncio.run(main())
+
+    def test_timeout_not_called(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            async with asyncio.timeout(10) as cm:
+                await asyncio.sleep(0.01)
+            t1 = loop.time()
+
+            self.assertFalse(cm.expired())
+            # 2 sec for slow CI boxes
+            self.assertLess(t1 - t0, 2)
+            self.assertGreater(cm.when(), t1)
+
+        asyncio.run(main())
+
+    def test_timeout_disabled(self):
+        async def main():
+            async with asyncio.timeout(None) as cm:
+                await asyncio.sleep(0.01)
+            self.assertFalse(cm.expired())
+            self.assertIsNone(cm.when())
+
+        asyncio.run(main())
+
+    def test_timeout_zero(self):
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                async with asyncio.timeout(0) as cm:
+                    await asyncio.sleep(10)
+            self.assertTrue(cm.expired())
+
+        asyncio.run(main())
+
+    def test_timeout_in_the_past_no_await(self):
+        async def main():
+            # The body is not interrupted if it does not await.
+            async with asyncio.timeout(-11) as cm:
+                pass
+            self.assertFalse(cm.expired())
+
+        asyncio.run(main())
+
+    def test_foreign_exception_passed(self):
+        async def main():
+            with self.assertRaises(KeyError):
+                async with asyncio.timeout(0.01) as cm:
+                    raise KeyError
+            self.assertFalse(cm.expired())
+
+        asyncio.run(main())
+
+    def test_foreign_cancel_doesnt_timeout(self):
+        async def main():
+            async def inner():
+                async with asyncio.timeout(10) as cm:
+                    await asyncio.sleep(10)
+                return cm
+
+            task = asyncio.create_task(inner())
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+    def test_outer_task_is_not_cancelled(self):
+        async def main():
+            async def outer():
+                with self.assertRaises(asyncio.TimeoutError):
+                    async with asyncio.timeout(0.001):
+                        await asyncio.sleep(10)
+                return 'done'
+
+            self.assertEqual(await asyncio.create_task(outer()), 'done')
+
+        asyncio.run(main())
+
+    def test_timeout_reschedule(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            with self.assertRaises(asyncio.TimeoutError):
+                async with asyncio.timeout(None) as cm:
+                    self.assertIsNone(cm.when())
+                    deadline = loop.time() + 0.01
+                    cm.reschedule(deadline)
+                    self.assertEqual(cm.when(), deadline)
+                    await asyncio.sleep(10)
+            self.assertTrue(cm.expired())
+
+            async with asyncio.timeout(0.01) as cm:
+                cm.reschedule(None)
+                await asyncio.sleep(0.02)
+            self.assertFalse(cm.expired())
+
+        asyncio.run(main())
+
+    def test_timeout_reschedule_outside(self):
+        cm = asyncio.Timeout(None)
+        with self.assertRaisesRegex(RuntimeError, 'created Timeout'):
+            cm.reschedule(10)
+
+        async def main():
+            async with cm:
+                pass
+            with self.assertRaisesRegex(RuntimeError, 'finished Timeout'):
+                cm.reschedule(10)
+            with self.assertRaisesRegex(RuntimeError, 'already been entered'):
+                async with cm:
+                    pass
+
+        asyncio.run(main())
+
+    def test_timeout_without_task(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            cm = asyncio.timeout(0.01)
+
+            def enter_without_task():
+                try:
+                    cm.__aenter__().send(None)
+                except BaseException as exc:
+                    fut.set_result(exc)
+
+            loop.call_soon(enter_without_task)
+            exc = await fut
+            self.assertIsInstance(exc, RuntimeError)
+            self.assertIn('inside a task', str(exc))
+
+        asyncio.run(main())
+
+    def test_repr(self):
+        async def main():
+            cm = asyncio.timeout(10)
+            self.assertEqual(repr(cm), '<Timeout [created]>')
+            async with cm:
+                self.assertRegex(repr(cm), r'<Timeout \[active\] when=\d+')
+            self.assertEqual(repr(cm), '<Timeout [finished]>')
+
+        asyncio.run(main())
+
+    def test_timeout_single_timer(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            async with asyncio.timeout(10) as cm:
+                handle = cm._timeout_handler
+                self.assertIsInstance(handle, asyncio.TimerHandle)
+                self.assertIn(handle, loop._scheduled)
+            self.assertTrue(handle.cancelled())
+            self.assertEqual(len(asyncio.all_tasks()), 1)
+
+        asyncio.run(main())
+
+    def test_cancel_before_deadline_same_iteration(self):
+        # A cancellation pending when the deadline expires is not turned
+        # into a TimeoutError.
+        async def main():
+            loop = asyncio.get_running_loop()
+            with self.assertRaises(asyncio.CancelledError):
+                async with asyncio.timeout(None) as cm:
+                    asyncio.current_task().cancel()
+                    cm.reschedule(loop.time())
+                    await asyncio.sleep(10)
+            self.assertFalse(cm.expired())
+
+        asyncio.run(main())
+
+    def test_block_finishes_at_deadline(self):
+        # The block finishes normally in the iteration in which the
+        # deadline expires, before the cancellation reaches the task.
+        async def main():
+            async with asyncio.timeout(10) as cm:
+                await asyncio.sleep(0)
+                cm._timeout_handler._run()
+            self.assertTrue(cm.expired())
+            self.assertFalse(asyncio.current_task()._must_cancel)
+            await asyncio.sleep(0)
+            return 'done'
+
+        for task_class in (asyncio.tasks._PyTask, asyncio.tasks._CTask):
+            with self.subTest(task_class=task_class):
+                loop = asyncio.new_event_loop()
+                try:
+                    loop.set_task_factory(
+                        lambda loop, coro: task_class(coro, loop=loop))
+                    self.assertEqual(loop.run_until_complete(main()),
+                                     'done')
+                finally:
+                    loop.close()
+
+    def test_wait_for_cancel_at_deadline(self):
+        # The caller of wait_for() is cancelled in the same iteration of
+        # the event loop as the deadline expires.
+        async def main():
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(
+                asyncio.wait_for(asyncio.sleep(10), 0.01))
+            await asyncio.sleep(0)
+            deadline = max(handle.when() for handle in loop._scheduled
+                           if not handle.cancelled())
+            loop.call_at(deadline, task.cancel)
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        for _ in range(5):
+            asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
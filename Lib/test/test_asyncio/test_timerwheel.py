@@ -0,0 +1,180 @@
+"""Tests for the timer wheel of the event loop."""
+
+import asyncio
+import random
+import unittest
+from unittest import mock
+
+from asyncio import events
+from asyncio import timerwheel
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = mock.Mock()
+        self.loop.get_debug.return_value = False
+
+    def new_handle(self, when):
+        return events.TimerHandle(when, lambda: None, (), self.loop)
+
+    def test_add_remove(self):
+        wheel = timerwheel.TimerWheel(0.01, 100.0)
+        handles = [self.new_handle(100.0 + delay)
+                   for delay in (0.0, 0.5, 30.0, 3600.0)]
+        for handle in handles:
+            wheel.add(handle)
+        self.assertEqual(len(wheel), 4)
+        self.assertCountEqual(wheel, handles)
+
+        wheel.remove(handles[2])
+        self.assertEqual(len(wheel), 3)
+        self.assertNotIn(handles[2], list(wheel))
+        self.assertIsNone(handles[2]._wheel_bucket)
+        # Removing a handle twice is a no-op
+        wheel.remove(handles[2])
+        self.assertEqual(len(wheel), 3)
+
+        wheel.clear()
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(list(wheel), [])
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_pop_due_never_early(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        h1 = self.new_handle(10.2)
+        h2 = self.new_handle(10.7)
+        wheel.add(h2)
+        wheel.add(h1)
+
+        self.assertEqual(wheel.next_deadline(), 10.2)
+        self.assertEqual(wheel.pop_due(10.2), [])
+        self.assertEqual(wheel.pop_due(10.5), [h1])
+        # The partially elapsed tick gives the exact deadline
+        self.assertEqual(wheel.next_deadline(), 10.7)
+        self.assertEqual(wheel.pop_due(10.7), [])
+        self.assertEqual(wheel.pop_due(10.8), [h2])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(h2._wheel_bucket)
+
+    def test_pop_due_sorted(self):
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        whens = [random.uniform(0, 1000) for _ in range(500)]
+        for when in whens:
+            wheel.add(self.new_handle(when))
+        due = wheel.pop_due(500.0)
+        self.assertEqual([h.when() for h in due],
+                         sorted(w for w in whens if w < 500.0))
+        due = wheel.pop_due(2000.0)
+        self.assertEqual([h.when() for h in due],
+                         sorted(w for w in whens if w >= 500.0))
+
+    def test_past_deadline(self):
+        wheel = timerwheel.TimerWheel(0.1, 100.0)
+        wheel.pop_due(200.0)
+        h = self.new_handle(50.0)
+        wheel.add(h)
+        self.assertEqual(wheel.next_deadline(), 50.0)
+        self.assertEqual(wheel.pop_due(60.0), [h])
+
+    def test_cascade(self):
+        # Deadlines spread over all the levels of the wheel
+        wheel = timerwheel.TimerWheel(0.001, 0.0)
+        handles = [self.new_handle(0.001 * 64 ** level + 0.0005)
+                   for level in range(timerwheel._LEVELS)]
+        for h in reversed(handles):
+            wheel.add(h)
+        for h in handles:
+            when = h.when()
+            deadline = wheel.next_deadline()
+            self.assertLessEqual(deadline, when)
+            # Waking up until the deadline, possibly several times to
+            # cascade the handle to the lower levels.
+            while deadline < when:
+                self.assertEqual(wheel.pop_due(deadline), [])
+                deadline = wheel.next_deadline()
+            self.assertEqual(deadline, when)
+            self.assertEqual(wheel.pop_due(when + 0.0001), [h])
+
+    def test_overflow(self):
+        wheel = timerwheel.TimerWheel(1.0, 0.0)
+        far = 64.0 ** timerwheel._LEVELS * 3
+        h1 = self.new_handle(far)
+        h2 = self.new_handle(float('inf'))
+        h3 = self.new_handle(float('-inf'))
+        for h in (h1, h2, h3):
+            wheel.add(h)
+        self.assertEqual(len(wheel), 3)
+        self.assertEqual(wheel.pop_due(1.0), [h3])
+        self.assertEqual(wheel.pop_due(far), [])
+        self.assertEqual(wheel.pop_due(far + 1), [h1])
+        self.assertEqual(list(wheel), [h2])
+        wheel.remove(h2)
+        self.assertEqual(len(wheel), 0)
+
+    def test_matches_heap(self):
+        rng = random.Random(42)
+        wheel = timerwheel.TimerWheel(0.01, 0.0)
+        now = 0.0
+        scheduled = set()
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.5:
+                h = self.new_handle(now + rng.expovariate(0.1))
+                wheel.add(h)
+                scheduled.add(h)
+            elif op < 0.7 and scheduled:
+                h = rng.choice(sorted(scheduled, key=id))
+                wheel.remove(h)
+                scheduled.remove(h)
+            else:
+                deadline = wheel.next_deadline()
+                if scheduled:
+                    self.assertLessEqual(deadline,
+                                         min(h.when() for h in scheduled))
+                now += rng.uniform(0, 5)
+                expected = sorted((h for h in scheduled if h.when() < now),
+                                  key=events.TimerHandle.when)
+                self.assertEqual(wheel.pop_due(now), expected)
+                scheduled.difference_update(expected)
+            self.assertEqual(len(wheel), len(scheduled))
+
+
+class TimerWheelLoopTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_timer_wheel(0.001)
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_call_later_order(self):
+        calls = []
+        for delay in (0.03, 0.01, 0.02, 0.01):
+            self.loop.call_later(delay, calls.append, delay)
+        self.loop.call_later(0.04, self.loop.stop)
+        t0 = self.loop.time()
+        self.loop.run_forever()
+        self.assertGreaterEqual(self.loop.time() - t0, 0.04)
+        self.assertEqual(calls, [0.01, 0.01, 0.02, 0.03])
+
+    def test_timeouts(self):
+        async def main():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(10), 0.01)
+            return await asyncio.wait_for(asyncio.sleep(0.01, 'ok'), 10)
+
+        self.assertEqual(self.loop.run_until_complete(main()), 'ok')
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
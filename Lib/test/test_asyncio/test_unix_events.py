@@ -1094,6 +1094,152 @@ class UnixWritePipeTransportTests(test_utils.TestCase):
         self.assertFalse(self.protocol.connection_lost.called)
 
 
+class ProactorEventLoopTests(test_utils.TestCase):
+
+    def test_selector_proactor_fallback(self):
+        with mock.patch('asyncio.unix_events._uring', None):
+            loop = asyncio.ProactorEventLoop()
+        self.addCleanup(loop.close)
+        self.assertIsInstance(loop._proactor, asyncio.SelectorProactor)
+
+    def test_uring_proactor_unavailable(self):
+        with mock.patch('asyncio.unix_events._uring', None):
+            with self.assertRaises(OSError) as cm:
+                asyncio.UringProactor()
+        self.assertEqual(cm.exception.errno, errno.ENOSYS)
+
+    def test_policy(self):
+        policy = asyncio.ProactorEventLoopPolicy()
+        loop = policy.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertIsInstance(loop, asyncio.ProactorEventLoop)
+
+    def check_sock_operations(self, proactor):
+        loop = asyncio.ProactorEventLoop(proactor)
+        self.addCleanup(loop.close)
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(rsock.close)
+        self.addCleanup(wsock.close)
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+
+        async def main():
+            reader = loop.create_task(read_all())
+            await loop.sock_sendall(wsock, b'x' * 100000)
+            wsock.close()
+            return await reader
+
+        async def read_all():
+            data = bytearray()
+            while True:
+                chunk = await loop.sock_recv(rsock, 65536)
+                if not chunk:
+                    return bytes(data)
+                data += chunk
+
+        self.assertEqual(loop.run_until_complete(main()), b'x' * 100000)
+
+    def test_selector_proactor_sock_operations(self):
+        self.check_sock_operations(asyncio.SelectorProactor())
+
+    @unittest.skipIf(unix_events._uring is None, 'requires io_uring')
+    def test_uring_proactor_sock_operations(self):
+        try:
+            proactor = asyncio.UringProactor()
+        except OSError as exc:
+            self.skipTest(f'io_uring is not usable: {exc}')
+        self.check_sock_operations(proactor)
+
+    @unittest.skipIf(unix_events._uring is None, 'requires io_uring')
+    def test_uring_proactor_interrupted_wait(self):
+        try:
+            proactor = asyncio.UringProactor()
+        except OSError as exc:
+            self.skipTest(f'io_uring is not usable: {exc}')
+        loop = asyncio.ProactorEventLoop(proactor)
+        self.addCleanup(loop.close)
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(rsock.close)
+        self.addCleanup(wsock.close)
+        rsock.setblocking(False)
+        wsock.setblocking(False)
+
+        # Waits returning before their timeout expires, on a completion
+        # or interrupted by a signal: the timeout must not end a later
+        # wait
+        wsock.send(b'x')
+        fut = proactor._wait_readable(rsock)
+        self.assertEqual(proactor.select(0.3), [fut])
+        rsock.recv(1)
+        handler = signal.signal(signal.SIGALRM, lambda *args: None)
+        self.addCleanup(signal.signal, signal.SIGALRM, handler)
+        fut = proactor._wait_readable(rsock)
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        self.assertEqual(proactor.select(0.3), [])
+
+        timer = threading.Timer(0.5, wsock.send, (b'y',))
+        timer.start()
+        self.addCleanup(timer.join)
+        self.assertEqual(proactor.select(None), [fut])
+
+    def new_ring(self):
+        try:
+            return unix_events._uring.Ring()
+        except OSError as exc:
+            self.skipTest(f'io_uring is not usable: {exc}')
+
+    @unittest.skipIf(unix_events._uring is None, 'requires io_uring')
+    def test_uring_ring_close_pending_buffers(self):
+        ring = self.new_ring()
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(rsock.close)
+        self.addCleanup(wsock.close)
+        submitted = bytearray(10)
+        queued = bytearray(10)
+        ring.recv(1, rsock.fileno(), submitted)
+        self.assertEqual(ring.submit_and_wait(0), [])
+        ring.recv(2, rsock.fileno(), queued)
+        # The buffers are exported until the operations complete
+        self.assertRaises(BufferError, submitted.extend, b'x')
+        self.assertRaises(BufferError, queued.extend, b'x')
+
+        # close() cancels the submitted operation before releasing its
+        # buffer: data sent later is not written to it
+        ring.close()
+        self.assertTrue(ring.closed)
+        wsock.send(b'data')
+        submitted.extend(b'x')
+        queued.extend(b'x')
+        self.assertEqual(submitted, bytes(10) + b'x')
+        self.assertEqual(rsock.recv(10), b'data')
+
+    @unittest.skipIf(unix_events._uring is None, 'requires io_uring')
+    def test_uring_ring_dealloc_pending_buffer(self):
+        ring = self.new_ring()
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(rsock.close)
+        self.addCleanup(wsock.close)
+        buf = bytearray(10)
+        ring.recv(1, rsock.fileno(), buf)
+        self.assertEqual(ring.submit_and_wait(0), [])
+        del ring
+        support.gc_collect()
+        wsock.send(b'data')
+        buf.extend(b'x')
+        self.assertEqual(buf, bytes(10) + b'x')
+        self.assertEqual(rsock.recv(10), b'data')
+
+    @unittest.skipIf(unix_events._uring is None, 'requires io_uring')
+    def test_uring_ring_invalid_timeout(self):
+        ring = self.new_ring()
+        self.addCleanup(ring.close)
+        self.assertRaises(ValueError, ring.submit_and_wait, float('nan'))
+        self.assertRaises(ValueError, ring.submit_and_wait, -1.0)
+        self.assertRaises(OverflowError, ring.submit_and_wait, 1e300)
+        self.assertRaises(TypeError, ring.submit_and_wait, 'x')
+        self.assertEqual(ring.submit_and_wait(0), [])
+
+
 class AbstractChildWatcherTests(unittest.TestCase):
 
     def test_not_implemented(self):
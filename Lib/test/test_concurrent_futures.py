@@ -7,6 +7,7 @@ test.support.skip_if_broken_multiprocessing_synchronize()
 
 from test.support.script_helper import assert_python_ok
 
+import array
 import contextlib
 import itertools
 import logging
@@ -17,6 +18,7 @@ import sys
 import threading
 import time
 import unittest
+from unittest import mock
 import weakref
 from pickle import PicklingError
 
@@ -25,6 +27,10 @@ from concurrent.futures._base import (
     PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future,
     BrokenExecutor)
 from concurrent.futures.process import BrokenProcessPool
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:
+    InterpreterPoolExecutor = None
 from multiprocessing import get_context
 
 import multiprocessing.process
@@ -64,6 +70,14 @@ def sleep_and_print(t, msg):
     print(msg)
     sys.stdout.flush()
 
+def fill(buffer, value):
+    for i in range(len(buffer)):
+        buffer[i] = value
+
+def get_interpreter_id(_=None):
+    import _xxsubinterpreters
+    return int(_xxsubinterpreters.get_current())
+
 def init(x):
     global INITIALIZER_STATUS
     INITIALIZER_STATUS = x
@@ -153,6 +167,16 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.WorkStealingThreadPoolExecutor
+
+
+@unittest.skipIf(InterpreterPoolExecutor is None,
+                 'requires _xxsubinterpreters')
+class InterpreterPoolMixin(ExecutorMixin):
+    executor_type = InterpreterPoolExecutor
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
@@ -277,6 +301,14 @@ class FailingInitializerMixin(ExecutorMixin):
 
 create_executor_tests(InitializerMixin)
 create_executor_tests(FailingInitializerMixin)
+create_executor_tests(InitializerMixin,
+                      executor_mixins=(WorkStealingThreadPoolMixin,))
+create_executor_tests(FailingInitializerMixin,
+                      executor_mixins=(WorkStealingThreadPoolMixin,))
+create_executor_tests(InitializerMixin,
+                      executor_mixins=(InterpreterPoolMixin,))
+create_executor_tests(FailingInitializerMixin,
+                      executor_mixins=(InterpreterPoolMixin,))
 
 
 class ExecutorShutdownTest:
@@ -553,6 +585,29 @@ class WaitTests:
 
 class ThreadPoolWaitTests(ThreadPoolMixin, WaitTests, BaseTestCase):
 
+    def test_first_exception_completed_meanwhile(self):
+        future1 = futures.Future()
+        future2 = futures.Future()
+        future3 = futures.Future()
+        get = futures._base.CompletionQueue.get
+        def get_after_completions(queue, timeout=None):
+            # Both futures complete before wait() gets the first one.
+            if not future1.done():
+                future1.set_result(42)
+                future2.set_exception(ZeroDivisionError())
+            return get(queue, timeout)
+
+        with mock.patch.object(futures._base.CompletionQueue, 'get',
+                               get_after_completions):
+            t = time.monotonic()
+            finished, pending = futures.wait(
+                    [future1, future2, future3], timeout=10,
+                    return_when=futures.FIRST_EXCEPTION)
+            self.assertLess(time.monotonic() - t, 5)
+
+        self.assertEqual(set([future1, future2]), finished)
+        self.assertEqual(set([future3]), pending)
+
     def test_pending_calls_race(self):
         # Issue #14406: multi-threaded race condition when waiting on all
         # futures.
@@ -570,7 +625,9 @@ class ThreadPoolWaitTests(ThreadPoolMixin, WaitTests, BaseTestCase):
 
 
 create_executor_tests(WaitTests,
-                      executor_mixins=(ProcessPoolForkMixin,
+                      executor_mixins=(WorkStealingThreadPoolMixin,
+                                       InterpreterPoolMixin,
+                                       ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
                                        ProcessPoolSpawnMixin))
 
@@ -656,6 +713,89 @@ class AsCompletedTests:
 
 
 create_executor_tests(AsCompletedTests)
+create_executor_tests(AsCompletedTests,
+                      executor_mixins=(WorkStealingThreadPoolMixin,
+                                       InterpreterPoolMixin))
+
+
+class CompletionQueueTests(BaseTestCase):
+    def test_completion_order(self):
+        f1, f2, f3 = Future(), Future(), Future()
+        queue = futures.CompletionQueue([f1, f2, SUCCESSFUL_FUTURE])
+        queue.add(f3)
+        self.assertEqual(len(queue), 4)
+        # Futures which already completed come first
+        self.assertIs(queue.get(), SUCCESSFUL_FUTURE)
+        f3.set_result(3)
+        f1.set_exception(OSError())
+        self.assertTrue(f2.cancel())
+        self.assertFalse(f2.set_running_or_notify_cancel())
+        self.assertEqual([queue.get(), queue.get(), queue.get()], [f3, f1, f2])
+        self.assertEqual(len(queue), 0)
+        for f in (f1, f2, f3):
+            self.assertEqual(f._waiters, [])
+
+    def test_get_timeout(self):
+        f = Future()
+        queue = futures.CompletionQueue([f])
+        with self.assertRaises(futures.TimeoutError):
+            queue.get(timeout=0)
+        with self.assertRaises(futures.TimeoutError):
+            queue.get(timeout=0.01)
+        self.assertEqual(len(queue), 1)
+
+    def test_get_blocking(self):
+        f = Future()
+        queue = futures.CompletionQueue([f])
+        t = threading.Timer(0.05, f.set_result, (42,))
+        t.start()
+        try:
+            self.assertIs(queue.get(timeout=5.0), f)
+        finally:
+            t.join()
+
+    def test_duplicates(self):
+        f = Future()
+        queue = futures.CompletionQueue([f, f])
+        queue.add(f)
+        self.assertEqual(len(queue), 1)
+        f.set_result(None)
+        self.assertIs(queue.get(), f)
+        self.assertEqual(len(queue), 0)
+
+    def test_drain(self):
+        f1, f2 = Future(), Future()
+        queue = futures.CompletionQueue([f1, f2, SUCCESSFUL_FUTURE])
+        f1.set_result(1)
+        self.assertEqual(queue.drain(), [SUCCESSFUL_FUTURE, f1])
+        self.assertEqual(queue.drain(), [])
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(f1._waiters, [])
+
+    def test_close(self):
+        f1, f2 = Future(), Future()
+        queue = futures.CompletionQueue([f1, f2])
+        f1.set_result(1)
+        queue.close()
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(f1._waiters, [])
+        self.assertEqual(f2._waiters, [])
+        f2.set_result(2)
+        self.assertEqual(len(queue), 0)
+
+    def test_many_futures(self):
+        fs = [Future() for i in range(1000)]
+        queue = futures.CompletionQueue(fs)
+        def complete():
+            for f in reversed(fs):
+                f.set_result(None)
+        t = threading.Thread(target=complete)
+        t.start()
+        try:
+            got = [queue.get(timeout=5.0) for f in fs]
+        finally:
+            t.join()
+        self.assertEqual(got, fs[::-1])
 
 
 class ExecutorTest:
@@ -685,6 +825,34 @@ class ExecutorTest:
                 list(self.executor.map(pow, range(10), range(10), chunksize=3)),
                 list(map(pow, range(10), range(10))))
 
+    def test_map_buffersize(self):
+        self.assertEqual(
+                list(self.executor.map(pow, range(10), range(10),
+                                       buffersize=3)),
+                list(map(pow, range(10), range(10))))
+        for buffersize in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor.map(pow, range(10), range(10),
+                                  buffersize=buffersize)
+
+    def test_map_buffersize_lazy(self):
+        consumed = []
+        def items():
+            for i in range(6):
+                consumed.append(i)
+                yield i
+
+        results = self.executor.map(abs, items(), buffersize=2)
+        self.assertEqual(len(consumed), 2)
+        self.assertEqual(next(results), 0)
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual(next(results), 1)
+        self.assertEqual(len(consumed), 4)
+        # Drain the results rather than dropping the iterator: cancelling
+        # the pending calls of a process pool can hang its shutdown.
+        self.assertEqual(list(results), [2, 3, 4, 5])
+        self.assertEqual(len(consumed), 6)
+
     def test_map_exception(self):
         i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
         self.assertEqual(i.__next__(), (0, 1))
@@ -782,6 +950,298 @@ class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, BaseTestCase):
         executor.shutdown(wait=True)
 
 
+class WorkStealingThreadPoolShutdownTest(WorkStealingThreadPoolMixin,
+                                         ExecutorShutdownTest, BaseTestCase):
+    def _prime_executor(self):
+        pass
+
+    def test_threads_terminate(self):
+        sem = threading.Semaphore(0)
+        for i in range(3):
+            self.executor.submit(sem.acquire)
+        self.assertEqual(len(self.executor._threads), 3)
+        for i in range(3):
+            sem.release()
+        threads = list(self.executor._threads)
+        self.executor.shutdown()
+        self.assertEqual(len(self.executor._threads), 0)
+        for t in threads:
+            self.assertFalse(t.is_alive())
+
+    def test_del_shutdown(self):
+        executor = futures.WorkStealingThreadPoolExecutor(max_workers=5)
+        executor.map(abs, range(-5, 5))
+        threads = list(executor._threads)
+        del executor
+
+        for t in threads:
+            t.join()
+
+    def test_thread_names_assigned(self):
+        executor = futures.WorkStealingThreadPoolExecutor(
+            max_workers=5, thread_name_prefix='SpecialPool')
+        executor.map(abs, range(-5, 5))
+        threads = list(executor._threads)
+        executor.shutdown()
+
+        for t in threads:
+            self.assertRegex(t.name, r'^SpecialPool_[0-4]$')
+
+
+class WorkStealingThreadPoolExecutorTest(WorkStealingThreadPoolMixin,
+                                         ExecutorTest, BaseTestCase):
+    def test_map_submits_without_iteration(self):
+        finished = []
+        self.executor.map(finished.append, range(10))
+        self.executor.shutdown(wait=True)
+        self.assertCountEqual(finished, range(10))
+
+    def test_idle_timeout_argument(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(idle_timeout=-1)
+
+    def test_saturation(self):
+        executor = self.executor_type(4)
+        sem = threading.Semaphore(0)
+        fs = [executor.submit(sem.acquire)
+              for i in range(15 * executor._max_workers)]
+        self.assertEqual(len(executor._threads), executor._max_workers)
+        for i in range(15 * executor._max_workers):
+            sem.release()
+        executor.shutdown(wait=True)
+        self.assertTrue(all(f.result() for f in fs))
+
+    def test_priority(self):
+        with self.executor_type(1) as executor:
+            started = threading.Event()
+            event = threading.Event()
+            def block():
+                started.set()
+                event.wait()
+            executor.submit(block)
+            started.wait()
+            order = []
+            fs = [executor.submit(order.append, i, priority=p)
+                  for i, p in enumerate([5, 1, 3, 1, 0])]
+            # priority is not passed to the callable
+            f = executor.submit(capture, 1, key=2, priority=-1)
+            event.set()
+        self.assertEqual(order, [4, 1, 3, 2, 0])
+        self.assertEqual(f.result(), ((1,), {'key': 2}))
+
+    def test_submit_to_busy_workers_without_lock(self):
+        with self.executor_type(2) as executor:
+            event = threading.Event()
+            for i in range(2):
+                executor.submit(event.wait)
+            self.assertEqual(executor.stats()['idle_workers'], 0)
+            fs = []
+            def submit():
+                fs.extend(executor.submit(mul, i, 2) for i in range(10))
+            # The busy workers' queues are used without the executor lock
+            with executor._shutdown_lock:
+                t = threading.Thread(target=submit)
+                t.start()
+                t.join(5)
+                self.assertFalse(t.is_alive())
+            event.set()
+        self.assertEqual([f.result() for f in fs], list(range(0, 20, 2)))
+
+    def test_work_stealing(self):
+        first = threading.Event()
+        block = threading.Event()
+        def spawn():
+            # Work items submitted by a worker are queued to its own queue
+            # when no worker is idle
+            first.wait()
+            return [executor.submit(time.sleep, 0.01) for i in range(10)]
+        with self.executor_type(2) as executor:
+            f = executor.submit(spawn)
+            executor.submit(block.wait)
+            first.set()
+            fs = f.result()
+            block.set()
+        self.assertTrue(all(f.done() for f in fs))
+        stats = executor.stats()
+        self.assertEqual(stats['completed'], 12)
+        self.assertGreater(stats['steals'], 0)
+
+    def test_submit_races_with_worker_going_idle(self):
+        class StaleIdle(list):
+            # The next check misses the idle workers, as if they went idle
+            # right after it
+            stale = False
+            def __bool__(self):
+                if self.stale:
+                    self.stale = False
+                    return False
+                return len(self) > 0
+
+        def fork_join():
+            executor._idle.stale = True
+            # Queued behind this work item, unless the idle worker steals it
+            child = executor.submit(mul, 6, 7)
+            return child.result(timeout=5)
+
+        with self.executor_type(2) as executor:
+            barrier = threading.Barrier(2)
+            futures.wait([executor.submit(barrier.wait) for i in range(2)])
+            deadline = time.monotonic() + 5
+            while executor.stats()['idle_workers'] < 2:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            with executor._shutdown_lock:
+                executor._idle = StaleIdle(executor._idle)
+            self.assertEqual(executor.submit(fork_join).result(), 42)
+
+    def test_idle_timeout(self):
+        with self.executor_type(4, idle_timeout=0.05) as executor:
+            sem = threading.Semaphore(0)
+            fs = [executor.submit(sem.acquire) for i in range(4)]
+            self.assertEqual(len(executor._threads), 4)
+            threads = list(executor._threads)
+            for i in range(4):
+                sem.release()
+            futures.wait(fs)
+            for t in threads:
+                t.join(5)
+                self.assertFalse(t.is_alive())
+            self.assertEqual(len(executor._threads), 0)
+            self.assertEqual(executor.stats()['workers'], 0)
+            # Reaped workers are started again when needed
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(executor.stats()['completed'], 5)
+
+    def test_stats(self):
+        with self.executor_type(2) as executor:
+            started = threading.Barrier(3)
+            event = threading.Event()
+            def block():
+                started.wait()
+                event.wait()
+            executor.submit(block)
+            executor.submit(block)
+            started.wait()
+            fs = [executor.submit(mul, i, 2) for i in range(3)]
+            stats = executor.stats()
+            self.assertEqual(stats['max_workers'], 2)
+            self.assertEqual(stats['workers'], 2)
+            self.assertEqual(stats['queue_depth'], 3)
+            time.sleep(0.05)
+            event.set()
+        self.assertEqual([f.result() for f in fs], [0, 2, 4])
+        stats = executor.stats()
+        self.assertEqual(stats['workers'], 0)
+        self.assertEqual(stats['idle_workers'], 0)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['completed'], 5)
+        self.assertGreaterEqual(stats['wait_time_max'], 0.05)
+        self.assertGreaterEqual(stats['wait_time_total'],
+                                stats['wait_time_max'])
+
+
+class InterpreterPoolShutdownTest(InterpreterPoolMixin, ExecutorShutdownTest,
+                                  BaseTestCase):
+    def _prime_executor(self):
+        pass
+
+    def test_interpreters_destroyed(self):
+        import _xxsubinterpreters
+        before = _xxsubinterpreters.list_all()
+        self.assertEqual(len(list(self.executor.map(mul, range(10),
+                                                    range(10)))), 10)
+        self.assertGreater(len(_xxsubinterpreters.list_all()), len(before))
+        self.executor.shutdown()
+        self.assertEqual(_xxsubinterpreters.list_all(), before)
+
+    def test_del_shutdown(self):
+        executor = self.executor_type(max_workers=5)
+        executor.map(abs, range(-5, 5))
+        threads = list(executor._threads)
+        del executor
+
+        for t in threads:
+            t.join()
+
+    def test_thread_names_assigned(self):
+        executor = self.executor_type(max_workers=2,
+                                      thread_name_prefix='SpecialPool')
+        executor.map(abs, range(-5, 5))
+        threads = list(executor._threads)
+        executor.shutdown()
+
+        for t in threads:
+            self.assertRegex(t.name, r'^SpecialPool_[0-1]$')
+
+
+class InterpreterPoolExecutorTest(InterpreterPoolMixin, ExecutorTest,
+                                  BaseTestCase):
+    worker_count = 2
+
+    def test_default_workers(self):
+        executor = self.executor_type()
+        self.assertEqual(executor._max_workers, min(4, os.cpu_count() or 1))
+
+    def test_run_in_subinterpreter(self):
+        import _xxsubinterpreters
+        ids = set(self.executor.map(get_interpreter_id, range(10)))
+        self.assertNotIn(int(_xxsubinterpreters.get_main()), ids)
+        self.assertLessEqual(len(ids), self.worker_count)
+
+    def test_isolation(self):
+        global INITIALIZER_STATUS
+        INITIALIZER_STATUS = 'main'
+        with self.executor_type(1) as executor:
+            executor.submit(init, 'worker').result()
+            self.assertEqual(executor.submit(get_init_status).result(),
+                             'worker')
+        self.assertEqual(INITIALIZER_STATUS, 'main')
+
+    def test_shared_buffer(self):
+        # memoryview arguments give access to the memory of the caller
+        data = bytearray(100000)
+        self.executor.submit(fill, memoryview(data), 7).result()
+        self.assertEqual(data, bytes([7]) * len(data))
+        a = array.array('i', range(10))
+        m = memoryview(a)
+        self.executor.submit(fill, m[2:5], -1).result()
+        self.assertEqual(a.tolist(), [0, 1, -1, -1, -1, 5, 6, 7, 8, 9])
+
+    def test_buffer_results(self):
+        m = memoryview(array.array('d', [1.5, 2.5])).cast('B').cast('d',
+                                                                  (1, 2))
+        result = self.executor.submit(memoryview, m).result()
+        self.assertIsInstance(result, memoryview)
+        self.assertEqual(result.format, 'd')
+        self.assertEqual(result.shape, (1, 2))
+        self.assertEqual(result.tolist(), [[1.5, 2.5]])
+        # Non-contiguous views are copied
+        result = self.executor.submit(memoryview, memoryview(b'abcdef')[::2])
+        self.assertEqual(result.result().tobytes(), b'ace')
+        # bytearray objects are copied
+        data = bytearray(b'x' * 100000)
+        result = self.executor.submit(bytearray, data).result()
+        self.assertEqual(result, data)
+        self.assertIsNot(result, data)
+
+    def test_remote_traceback(self):
+        future = self.executor.submit(sleep_and_raise, 0)
+        with self.assertRaises(Exception) as cm:
+            future.result()
+        self.assertEqual(str(cm.exception), 'this is an exception')
+        self.assertIn('in sleep_and_raise', str(cm.exception.__cause__))
+
+    def test_unpicklable(self):
+        future = self.executor.submit(lambda: None)
+        with self.assertRaises((PicklingError, AttributeError)):
+            future.result()
+        future = self.executor.submit(make_dummy_object, threading.Lock())
+        with self.assertRaises(TypeError):
+            future.result()
+        # The workers are still usable
+        self.assertEqual(self.executor.submit(mul, 6, 7).result(), 42)
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -818,6 +1278,128 @@ class ProcessPoolExecutorTest(ExecutorTest):
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_auto_chunksize(self):
+        ref = list(map(pow, range(1000), range(1000)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize=None)),
+            ref)
+        # An iterator without len() is also chunked automatically.  The
+        # results are drained: cancelling the pending calls of a process
+        # pool can hang its shutdown.
+        results = self.executor.map(abs, iter(range(300)), chunksize=None)
+        self.assertEqual(list(results), list(range(300)))
+
+    def test_chunk_sizer(self):
+        def chunk_done(sizer, item_time, overhead):
+            size = sizer.chunksize
+            run_time = size * item_time
+            future = futures.Future()
+            future.set_result(([None] * size, run_time))
+            start = time.perf_counter() - run_time - overhead
+            sizer._chunk_done(size, start, future)
+
+        # Cheap items: the chunksize doubles up to the overhead ratio
+        sizer = futures.process._ChunkSizer()
+        sizes = []
+        for i in range(20):
+            chunk_done(sizer, 1e-5, 1e-3)
+            sizes.append(sizer.chunksize)
+        self.assertEqual(sizes[:4], [2, 4, 8, 16])
+        self.assertGreater(sizer.chunksize, 1000)
+        self.assertLessEqual(sizer.chunksize,
+                             futures.process._AUTO_CHUNK_MAX_TIME / 1e-5)
+
+        # Expensive items are sent one at a time
+        sizer = futures.process._ChunkSizer()
+        for i in range(5):
+            chunk_done(sizer, 0.5, 1e-3)
+        self.assertEqual(sizer.chunksize, 1)
+
+        # Failed chunks are ignored
+        future = futures.Future()
+        future.set_exception(ZeroDivisionError())
+        sizer._chunk_done(1, time.perf_counter(), future)
+        self.assertEqual(sizer.chunksize, 1)
+
+    def test_shared_memory_results(self):
+        executor = self.executor_type(
+            2, mp_context=self.get_context(), shared_memory_threshold=1000)
+        with executor:
+            self.assertEqual(executor.submit(bytes, 100000).result(),
+                             bytes(100000))
+            self.assertEqual(list(executor.map(bytes, [10, 10000] * 4)),
+                             [bytes(10), bytes(10000)] * 4)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=-1)
+
+    def test_max_tasks_per_child(self):
+        context = self.get_context()
+        if context.get_start_method() == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context,
+                                   max_tasks_per_child=3)
+            return
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(
+            1, mp_context=context, max_tasks_per_child=3)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is started, with a different pid, while the previous
+        # one was reaped.
+        f4 = executor.submit(os.getpid)
+        self.assertNotEqual(f4.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+
+        executor.shutdown()
+
+    def test_max_tasks_per_child_default_context(self):
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.assertNotEqual(executor._mp_context.get_start_method(), "fork")
+        executor.shutdown()
+        with self.assertRaises(ValueError):
+            self.executor_type(1, max_tasks_per_child=0)
+        with self.assertRaises(TypeError):
+            self.executor_type(1, max_tasks_per_child=1.5)
+
+    def test_max_tasks_early_shutdown(self):
+        context = self.get_context()
+        if context.get_start_method() == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(
+            3, mp_context=context, max_tasks_per_child=1)
+        fs = [executor.submit(mul, i, i) for i in range(6)]
+        executor.shutdown()
+        for i, f in enumerate(fs):
+            self.assertEqual(f.result(), mul(i, i))
+
+    def test_max_memory_per_child(self):
+        context = self.get_context()
+        if context.get_start_method() == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context,
+                                   max_memory_per_child=1)
+            return
+        if multiprocessing.util._resident_memory() is None:
+            raise unittest.SkipTest("Memory usage not available.")
+        with self.assertRaises(ValueError):
+            self.executor_type(1, mp_context=context, max_memory_per_child=0)
+        # Every worker uses more than a byte: each one runs a single task
+        executor = self.executor_type(
+            2, mp_context=context, max_memory_per_child=1)
+        with executor:
+            pids = [executor.submit(os.getpid).result() for i in range(3)]
+        self.assertEqual(len(set(pids)), 3)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
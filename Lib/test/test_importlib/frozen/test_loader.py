@@ -4,6 +4,8 @@ from .. import util
 machinery = util.import_importlib('importlib.machinery')
 
 from test.support import captured_stdout
+import _imp
+import os
 import types
 import unittest
 import warnings
@@ -77,6 +79,34 @@ class ExecModuleTests(abc.LoaderTests):
     # No way to trigger an error in a frozen module.
     test_state_after_failure = None
 
+    def exec_stdlib_module(self, name):
+        with util.uncache(name):
+            spec = self.machinery.FrozenImporter.find_spec(name)
+            module = types.ModuleType(name)
+            module.__spec__ = spec
+            if spec.submodule_search_locations is not None:
+                module.__path__ = spec.submodule_search_locations
+            self.machinery.FrozenImporter.exec_module(module)
+            return module
+
+    def test_stdlib_module(self):
+        # Modules frozen from the standard library by _freeze_importlib
+        # refer to their source.
+        module = self.exec_stdlib_module('zipimport')
+        self.assertEqual(module.__spec__.origin, 'frozen')
+        self.assertEqual(os.path.normcase(module.__file__),
+                         os.path.normcase(os.path.join(
+                             os.path.dirname(os.__file__), 'zipimport.py')))
+
+    @unittest.skipUnless(_imp.is_frozen('encodings'),
+                         'requires --with-frozen-modules')
+    def test_stdlib_package(self):
+        module = self.exec_stdlib_module('encodings')
+        package_dir = os.path.join(os.path.dirname(os.__file__), 'encodings')
+        self.assertEqual(module.__path__, [package_dir])
+        self.assertEqual(module.__file__,
+                         os.path.join(package_dir, '__init__.py'))
+
     def test_unloadable(self):
         assert self.machinery.FrozenImporter.find_module('_not_real') is None
         with self.assertRaises(ImportError) as cm:
@@ -4,11 +4,14 @@ from .. import util
 machinery = util.import_importlib('importlib.machinery')
 
 import errno
+import marshal
 import os
 import py_compile
 import stat
 import sys
 import tempfile
+import time
+from test import support
 from test.support import make_legacy_pyc
 import unittest
 import warnings
@@ -186,6 +189,86 @@ class FinderTests(abc.FinderTests):
             found = self._find(finder, 'doesnotexist')
             self.assertEqual(found, self.NOT_FOUND)
 
+    def test_import_index(self):
+        # The listing of the directory is saved to __pycache__.
+        with util.create_modules('mod') as mapping, \
+             support.swap_item(sys._xoptions, 'import_index', True), \
+             support.swap_attr(sys, 'dont_write_bytecode', False):
+            root = mapping['.root']
+            os.mkdir(os.path.join(root, '__pycache__'))
+            os.utime(root, (1, 1))
+            found = self._find(self.get_finder(root), 'mod',
+                               loader_only=True)
+            self.assertIsNotNone(found)
+            index = os.path.join(root, '__pycache__', '__index__.{}.idx'
+                                 .format(sys.implementation.cache_tag))
+            self.assertTrue(os.path.exists(index))
+            # A valid index is trusted...
+            with open(index, 'rb') as file:
+                data = marshal.load(file)
+            self.assertEqual(data[1], 1)
+            self.assertIn('mod.py', data[2])
+            self.assertIn('mod.py', data[3])
+            with open(index, 'wb') as file:
+                marshal.dump((data[0], 1, ['fake.py'],
+                              frozenset(['fake.py'])), file)
+            os.utime(root, (1, 1))
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'fake', loader_only=True))
+            self.assertIsNone(self._find(finder, 'mod', loader_only=True))
+            # ... until the directory is modified.
+            os.utime(root, (2, 2))
+            finder = self.get_finder(root)
+            self.assertIsNone(self._find(finder, 'fake', loader_only=True))
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+
+    def test_import_index_racy_mtime(self):
+        # The index is not saved when the directory could still be modified
+        # without its mtime changing.
+        with util.create_modules('mod') as mapping, \
+             support.swap_item(sys._xoptions, 'import_index', True), \
+             support.swap_attr(sys, 'dont_write_bytecode', False):
+            root = mapping['.root']
+            os.mkdir(os.path.join(root, '__pycache__'))
+            future = time.time() + 3600
+            os.utime(root, (future, future))
+            found = self._find(self.get_finder(root), 'mod',
+                               loader_only=True)
+            self.assertIsNotNone(found)
+            self.assertEqual(os.listdir(os.path.join(root, '__pycache__')),
+                             [])
+
+    def test_import_index_dont_write_bytecode(self):
+        # The index is not saved when sys.dont_write_bytecode is true.
+        with util.create_modules('mod') as mapping, \
+             support.swap_item(sys._xoptions, 'import_index', True), \
+             support.swap_attr(sys, 'dont_write_bytecode', True):
+            root = mapping['.root']
+            os.utime(root, (1, 1))
+            found = self._find(self.get_finder(root), 'mod',
+                               loader_only=True)
+            self.assertIsNotNone(found)
+            self.assertNotIn('__pycache__', os.listdir(root))
+
+    def test_import_index_pycache_prefix(self):
+        # The index is saved to sys.pycache_prefix when it is set.
+        with util.create_modules('mod') as mapping, \
+             support.temp_dir() as prefix, \
+             support.swap_item(sys._xoptions, 'import_index', True), \
+             support.swap_attr(sys, 'dont_write_bytecode', False), \
+             util.temporary_pycache_prefix(prefix):
+            root = mapping['.root']
+            os.utime(root, (1, 1))
+            found = self._find(self.get_finder(root), 'mod',
+                               loader_only=True)
+            self.assertIsNotNone(found)
+            self.assertNotIn('__pycache__', os.listdir(root))
+            index = os.path.join(prefix,
+                                 os.path.abspath(root).lstrip(os.sep),
+                                 '__index__.{}.idx'
+                                 .format(sys.implementation.cache_tag))
+            self.assertTrue(os.path.exists(index))
+
 
 class FinderTestsPEP451(FinderTests):
 
@@ -1,7 +1,10 @@
+import contextlib
 import importlib
 from importlib import abc
 from importlib import util
 import sys
+from test import support
+import threading
 import types
 import unittest
 
@@ -126,13 +129,26 @@ class LazyLoaderTests(unittest.TestCase):
         self.assertFalse(hasattr(module, '__name__'))
 
     def test_module_substitution_error(self):
+        source_code = ('import sys, types; '
+                       'sys.modules[__name__] = types.ModuleType(__name__)')
         with test_util.uncache(TestingImporter.module_name):
-            fresh_module = types.ModuleType(TestingImporter.module_name)
-            sys.modules[TestingImporter.module_name] = fresh_module
-            module = self.new_module()
+            module = self.new_module(source_code)
+            sys.modules[TestingImporter.module_name] = module
             with self.assertRaisesRegex(ValueError, "substituted"):
                 module.__name__
 
+    def test_module_replaced_before_load(self):
+        # Replacing the entry of sys.modules outside of the load, like
+        # test.support.import_fresh_module() does, is fine.
+        with test_util.uncache(TestingImporter.module_name):
+            module = self.new_module()
+            sys.modules[TestingImporter.module_name] = module
+            fresh_module = types.ModuleType(TestingImporter.module_name)
+            sys.modules[TestingImporter.module_name] = fresh_module
+            self.assertEqual(module.attr, 42)
+            self.assertIs(sys.modules[TestingImporter.module_name],
+                          fresh_module)
+
     def test_module_already_in_sys(self):
         with test_util.uncache(TestingImporter.module_name):
             module = self.new_module()
@@ -140,6 +156,99 @@ class LazyLoaderTests(unittest.TestCase):
             # Force the load; just care that no exception is raised.
             module.__name__
 
+    def test_exec_error(self):
+        # A failed load is raised on every access and the module is removed
+        # from sys.modules.
+        with test_util.uncache(TestingImporter.module_name):
+            module = self.new_module('attr = 1; 1/0')
+            sys.modules[TestingImporter.module_name] = module
+            for i in range(2):
+                with self.assertRaises(ZeroDivisionError):
+                    module.attr
+            self.assertNotIn(TestingImporter.module_name, sys.modules)
+            self.assertIs(object.__getattribute__(module, '__class__'),
+                          util._LazyModule)
+
+    def test_concurrent_access(self):
+        # Threads accessing the module while it loads wait for the load.
+        module = self.new_module('import time; time.sleep(0.1); attr = 42')
+        results = []
+        def access():
+            results.append(module.attr)
+        threads = [threading.Thread(target=access) for i in range(5)]
+        with support.start_threads(threads):
+            pass
+        self.assertEqual(results, [42] * 5)
+
+
+class LazyImportsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(util.disable_lazy_imports)
+
+    @contextlib.contextmanager
+    def create_modules(self, *names):
+        # test_util.create_modules() with the default finders.
+        meta_path = sys.meta_path[:]
+        path_hooks = sys.path_hooks[:]
+        with test_util.create_modules(*names) as mapping:
+            with test_util.import_state(meta_path=meta_path,
+                                        path=[mapping['.root']],
+                                        path_hooks=path_hooks,
+                                        path_importer_cache={}):
+                yield mapping
+
+    def test_lazy(self):
+        with self.create_modules('mod'):
+            util.enable_lazy_imports()
+            module = __import__('mod')
+            self.assertIs(type(module), util._LazyModule)
+            # Importing the module again does not load it.
+            self.assertIs(__import__('mod'), module)
+            self.assertIs(type(module), util._LazyModule)
+            self.assertEqual(module.attr, 'mod')
+            self.assertIs(type(module), types.ModuleType)
+            self.assertIsInstance(module.__loader__,
+                                  importlib.machinery.SourceFileLoader)
+
+    def test_from_import_submodule(self):
+        with self.create_modules('pkg.__init__', 'pkg.sub'):
+            util.enable_lazy_imports()
+            namespace = {}
+            exec('from pkg import sub', namespace)
+            # The package is loaded to look for the name, but the submodule
+            # is not.
+            self.assertIs(type(sys.modules['pkg']), types.ModuleType)
+            self.assertIs(type(namespace['sub']), util._LazyModule)
+            self.assertEqual(namespace['sub'].attr, 'pkg.sub')
+
+    def test_allow_deny(self):
+        names = 'mod', 'pkg.__init__', 'pkg.sub', 'pkg.other'
+        with self.create_modules(*names):
+            util.enable_lazy_imports(allow=['pkg'], deny=['pkg.sub'])
+            mod = importlib.import_module('mod')
+            pkg = importlib.import_module('pkg')
+            self.assertIs(type(mod), types.ModuleType)
+            self.assertIs(type(pkg), util._LazyModule)
+            sub = importlib.import_module('pkg.sub')
+            other = importlib.import_module('pkg.other')
+            self.assertIs(type(sub), types.ModuleType)
+            self.assertIs(type(other), util._LazyModule)
+
+    def test_disable(self):
+        with self.create_modules('mod'):
+            util.enable_lazy_imports()
+            util.disable_lazy_imports()
+            module = importlib.import_module('mod')
+            self.assertIs(type(module), types.ModuleType)
+
+    def test_missing_module(self):
+        # Modules are still found when they are imported.
+        with self.create_modules('mod'):
+            util.enable_lazy_imports()
+            with self.assertRaises(ModuleNotFoundError):
+                importlib.import_module('doesnotexist')
+
 
 if __name__ == '__main__':
     unittest.main()
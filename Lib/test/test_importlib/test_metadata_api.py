@@ -1,5 +1,7 @@
+import os
 import re
 import textwrap
+import importlib
 import unittest
 
 from collections.abc import Iterator
@@ -51,6 +53,41 @@ class APITests(
         self.assertEqual(ep.value, 'mod:main')
         self.assertEqual(ep.extras, [])
 
+    def test_entry_points_select(self):
+        eps = entry_points(group='entries')
+        self.assertIsInstance(eps, tuple)
+        self.assertEqual(
+            sorted(ep.name for ep in eps), ['main', 'main', 'ns:sub'])
+        eps = entry_points(name='main')
+        self.assertEqual(len(eps), 2)
+        self.assertEqual({ep.group for ep in eps}, {'entries'})
+        eps = entry_points(group='entries', name='ns:sub')
+        self.assertEqual([ep.value for ep in eps], ['mod:main'])
+        self.assertEqual(entry_points(group='missing'), ())
+        self.assertEqual(entry_points(group='entries', name='missing'), ())
+
+    def test_entry_points_new_distribution(self):
+        self.assertEqual(entry_points(group='new'), ())
+        fixtures.build_files({
+            'new_pkg-1.0.dist-info': {
+                'entry_points.txt': '[new]\nnew = mod:new\n',
+                },
+            }, self.site_dir)
+        # The directory may have been modified within the resolution of
+        # its modification time.
+        mtime = os.stat(self.site_dir).st_mtime + 10
+        os.utime(self.site_dir, (mtime, mtime))
+        eps = entry_points(group='new')
+        self.assertEqual([ep.name for ep in eps], ['new'])
+
+    def test_entry_points_invalidate_caches(self):
+        self.assertEqual(entry_points(group='changed'), ())
+        path = self.site_dir / 'distinfo_pkg-1.0.0.dist-info'
+        (path / 'entry_points.txt').write_text('[changed]\nmain = mod:main\n')
+        importlib.invalidate_caches()
+        eps = entry_points(group='changed')
+        self.assertEqual([ep.name for ep in eps], ['main'])
+
     def test_metadata_for_this_package(self):
         md = metadata('egginfo-pkg')
         assert md['author'] == 'Steven Ma'
@@ -8,6 +8,7 @@ import tempfile
 import unittest
 import zipapp
 import zipfile
+import zipimport
 from test.support import requires_zlib
 
 from unittest.mock import patch
@@ -116,6 +117,30 @@ class ZipAppTest(unittest.TestCase):
                 self.assertEqual(z.getinfo(name).compress_type,
                                  zipfile.ZIP_DEFLATED)
 
+    def test_create_archive_with_index(self):
+        # Test writing an index next to the archive.
+        source = self.tmpdir / 'source'
+        source.mkdir()
+        (source / '__main__.py').touch()
+        (source / 'test.py').touch()
+        target = self.tmpdir / 'source.pyz'
+
+        zipapp.create_archive(source, target, index=True)
+        index = self.tmpdir / 'source.pyz.idx'
+        self.assertTrue(index.is_file())
+        st = target.stat()
+        files = zipimport._read_index(str(target), st)
+        self.assertEqual(files, zipimport._read_directory(str(target)))
+
+    def test_create_archive_with_index_to_fileobj(self):
+        # An index can't be written for a file object.
+        source = self.tmpdir / 'source'
+        source.mkdir()
+        (source / '__main__.py').touch()
+        target = io.BytesIO()
+        with self.assertRaises(zipapp.ZipAppError):
+            zipapp.create_archive(source, target, index=True)
+
     def test_no_main(self):
         # Test that packing a directory with no __main__.py fails.
         source = self.tmpdir / 'source'
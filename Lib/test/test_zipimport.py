@@ -253,6 +253,54 @@ class UncompressedZipImportTestCase(ImportHooksBaseTestCase):
                  TESTMOD + pyc_ext: (NOW, badtime_pyc)}
         self.doTest(".py", files, TESTMOD)
 
+    def testIndex(self):
+        files = {TESTMOD + ".py": (NOW, test_src),
+                 TESTPACK + os.sep + "__init__.py": (NOW, test_src)}
+        self.makeZip(files)
+        self.addCleanup(support.unlink, TEMP_ZIP + ".idx")
+        zipimport._write_index(TEMP_ZIP)
+        expected = zipimport._read_directory(TEMP_ZIP)
+
+        # The central directory is not read when there is an index.
+        with unittest.mock.patch.object(zipimport, '_read_directory',
+                                        side_effect=AssertionError):
+            zi = zipimport.zipimporter(TEMP_ZIP)
+            self.assertEqual(zi._files, expected)
+            sys.path.insert(0, TEMP_ZIP)
+            mod = importlib.import_module(TESTMOD)
+            self.assertEqual(mod.get_file(),
+                             os.path.join(TEMP_ZIP, TESTMOD) + ".py")
+
+    def testIndexMovedArchive(self):
+        files = {TESTMOD + ".py": (NOW, test_src)}
+        self.makeZip(files)
+        zipimport._write_index(TEMP_ZIP)
+        moved = TEMP_ZIP + ".moved"
+        self.addCleanup(support.unlink, moved)
+        self.addCleanup(support.unlink, moved + ".idx")
+        os.rename(TEMP_ZIP, moved)
+        os.rename(TEMP_ZIP + ".idx", moved + ".idx")
+
+        with unittest.mock.patch.object(zipimport, '_read_directory',
+                                        side_effect=AssertionError):
+            zi = zipimport.zipimporter(moved)
+            mod = zi.load_module(TESTMOD)
+        self.assertEqual(mod.get_file(),
+                         os.path.join(moved, TESTMOD) + ".py")
+
+    def testStaleIndex(self):
+        self.makeZip({TESTMOD + ".py": (NOW, test_src)})
+        self.addCleanup(support.unlink, TEMP_ZIP + ".idx")
+        zipimport._write_index(TEMP_ZIP)
+        self.makeZip({TESTMOD + "2.py": (NOW, test_src)})
+        # The archive may have been rewritten within the resolution of its
+        # modification time.
+        mtime = os.stat(TEMP_ZIP).st_mtime + 10
+        os.utime(TEMP_ZIP, (mtime, mtime))
+
+        zi = zipimport.zipimporter(TEMP_ZIP)
+        self.assertEqual(list(zi._files), [TESTMOD + "2.py"])
+
     def testPackage(self):
         packdir = TESTPACK + os.sep
         files = {packdir + "__init__" + pyc_ext: (NOW, test_pyc),
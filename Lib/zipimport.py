@@ -7,6 +7,9 @@ This module exports three objects:
 - _zip_directory_cache: a dict, mapping archive paths to zip directory
   info dicts, as used in zipimporter._files.
 
+The zip directory info of an archive is read from the index written next to
+it by _write_index(), if there is one that matches the archive.
+
 It is usually not needed to use the zipimport module explicitly; it is
 used by the builtin import mechanism for sys.path items that are paths
 to Zip archives.
@@ -91,7 +94,9 @@ class zipimporter:
         try:
             files = _zip_directory_cache[path]
         except KeyError:
-            files = _read_directory(path)
+            files = _read_index(path, st)
+            if files is None:
+                files = _read_directory(path)
             _zip_directory_cache[path] = files
         self._files = files
         self.archive = path
@@ -467,6 +472,55 @@ def _read_directory(archive):
     _bootstrap._verbose_message('zipimport: found {} names in {!r}', count, archive)
     return files
 
+# The index of an archive is a file next to it, holding the marshalled tuple
+#
+# (_INDEX_VERSION,
+#  archive,         # path of the archive when the index was written
+#  size,            # size of the archive
+#  mtime,           # modification time of the archive
+#  files,           # the dict returned by _read_directory(archive)
+# )
+#
+# Loading it replaces parsing the central directory with a single read and
+# marshal.loads().  The index is ignored if the archive changed since.
+_INDEX_VERSION = 1
+
+def _index_path(archive):
+    extsep = '/' if _bootstrap_external._RISCOS else '.'
+    return archive + extsep + 'idx'
+
+def _read_index(archive, st):
+    try:
+        with _io.open_code(_index_path(archive)) as fp:
+            data = fp.read()
+        version, path, size, mtime, files = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (version != _INDEX_VERSION or size != st.st_size
+            or mtime != st.st_mtime or type(files) is not dict):
+        return None
+    if path != archive:
+        # The archive was moved: update the paths used for __file__.
+        start = len(path)
+        files = {name: (archive + toc_entry[0][start:],) + toc_entry[1:]
+                 for name, toc_entry in files.items()}
+    _bootstrap._verbose_message('zipimport: found {} names in index of {!r}',
+                                len(files), archive)
+    return files
+
+def _write_index(archive):
+    """Write the index of the Zip archive 'archive' next to it.
+
+    zipimporter loads the index instead of parsing the central directory of
+    the archive, as long as the size and the modification time of the
+    archive are unchanged.
+    """
+    st = _bootstrap_external._path_stat(archive)
+    files = _read_directory(archive)
+    data = marshal.dumps(
+        (_INDEX_VERSION, archive, st.st_size, st.st_mtime, files))
+    _bootstrap_external._write_atomic(_index_path(archive), data)
+
 # During bootstrap, we may need to load the encodings
 # package from a ZIP file. But the cp437 encoding is implemented
 # in Python in the encodings package.
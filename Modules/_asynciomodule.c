@@ -14,6 +14,7 @@ _Py_IDENTIFIER(_asyncio_future_blocking);
 _Py_IDENTIFIER(add_done_callback);
 _Py_IDENTIFIER(_all_tasks_compat);
 _Py_IDENTIFIER(call_soon);
+_Py_IDENTIFIER(call_soon_many);
 _Py_IDENTIFIER(cancel);
 _Py_IDENTIFIER(current_task);
 _Py_IDENTIFIER(get_event_loop);
@@ -411,12 +412,93 @@ future_ensure_alive(FutureObj *fut)
     } while(0);
 
 
+/* Schedule all the callbacks of the future with a single call to
+   loop.call_soon_many().  Return 1 on success, 0 if the loop does not
+   provide call_soon_many(), and -1 on error. */
+static int
+future_schedule_callback_batch(FutureObj *fut)
+{
+    PyObject *call_soon_many;
+    PyObject *callbacks;
+    PyObject *handle;
+    Py_ssize_t len = PyList_GET_SIZE(fut->fut_callbacks);
+    Py_ssize_t i;
+
+    if (_PyObject_LookupAttrId(fut->fut_loop, &PyId_call_soon_many,
+                               &call_soon_many) < 0) {
+        return -1;
+    }
+    if (call_soon_many == NULL) {
+        return 0;
+    }
+
+    if (fut->fut_callback0 == NULL) {
+        /* The items of 'fut_callbacks' are already the (callback, context)
+           pairs expected by loop.call_soon_many(). */
+        callbacks = fut->fut_callbacks;
+        fut->fut_callbacks = NULL;
+    }
+    else {
+        PyObject *cb_tup;
+
+        callbacks = PyList_New(len + 1);
+        if (callbacks == NULL) {
+            Py_DECREF(call_soon_many);
+            return -1;
+        }
+        cb_tup = PyTuple_Pack(2, fut->fut_callback0, fut->fut_context0);
+        if (cb_tup == NULL) {
+            Py_DECREF(callbacks);
+            Py_DECREF(call_soon_many);
+            return -1;
+        }
+        PyList_SET_ITEM(callbacks, 0, cb_tup);
+        for (i = 0; i < len; i++) {
+            cb_tup = PyList_GET_ITEM(fut->fut_callbacks, i);
+            Py_INCREF(cb_tup);
+            PyList_SET_ITEM(callbacks, i + 1, cb_tup);
+        }
+        Py_CLEAR(fut->fut_callback0);
+        Py_CLEAR(fut->fut_context0);
+        Py_CLEAR(fut->fut_callbacks);
+    }
+
+    handle = PyObject_CallFunctionObjArgs(
+        call_soon_many, callbacks, (PyObject *)fut, NULL);
+    Py_DECREF(call_soon_many);
+    Py_DECREF(callbacks);
+    if (handle == NULL) {
+        return -1;
+    }
+    Py_DECREF(handle);
+    return 1;
+}
+
+
 static int
 future_schedule_callbacks(FutureObj *fut)
 {
     Py_ssize_t len;
     Py_ssize_t i;
 
+    if (fut->fut_callbacks != NULL &&
+        PyList_GET_SIZE(fut->fut_callbacks) +
+            (fut->fut_callback0 != NULL) > 1)
+    {
+        /* Run several callbacks from a single handle. */
+        int ret = future_schedule_callback_batch(fut);
+        if (ret != 0) {
+            if (ret < 0) {
+                /* If an error occurs in pure-Python implementation,
+                   all callbacks are cleared. */
+                Py_CLEAR(fut->fut_callback0);
+                Py_CLEAR(fut->fut_context0);
+                Py_CLEAR(fut->fut_callbacks);
+            }
+            return ret < 0 ? -1 : 0;
+        }
+    }
+
     if (fut->fut_callback0 != NULL) {
         /* There's a 1st callback */
 
@@ -2065,6 +2147,21 @@ TaskObj_get_must_cancel(TaskObj *task, void *Py_UNUSED(ignored))
     }
 }
 
+static int
+TaskObj_set_must_cancel(TaskObj *task, PyObject *val, void *Py_UNUSED(ignored))
+{
+    if (val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    int is_true = PyObject_IsTrue(val);
+    if (is_true < 0) {
+        return -1;
+    }
+    task->task_must_cancel = is_true;
+    return 0;
+}
+
 static PyObject *
 TaskObj_get_coro(TaskObj *task, void *Py_UNUSED(ignored))
 {
@@ -2480,7 +2577,8 @@ static PyGetSetDef TaskType_getsetlist[] = {
     FUTURE_COMMON_GETSETLIST
     {"_log_destroy_pending", (getter)TaskObj_get_log_destroy_pending,
                              (setter)TaskObj_set_log_destroy_pending, NULL},
-    {"_must_cancel", (getter)TaskObj_get_must_cancel, NULL, NULL},
+    {"_must_cancel", (getter)TaskObj_get_must_cancel,
+                     (setter)TaskObj_set_must_cancel, NULL},
     {"_coro", (getter)TaskObj_get_coro, NULL, NULL},
     {"_fut_waiter", (getter)TaskObj_get_fut_waiter, NULL, NULL},
     {NULL} /* Sentinel */
@@ -0,0 +1,1033 @@
+/*
+ * io_uring support for the proactor event loop of asyncio on Linux.
+ *
+ * A Ring object owns an io_uring instance.  Operations are queued in the
+ * submission queue by the read(), write(), recv(), send(), accept() and
+ * poll() methods, each one being identified by an integer key chosen by
+ * the caller.  They are handed to the kernel in a single batch by
+ * submit_and_wait(), which also returns the completions as a list of
+ * (key, result) tuples.
+ *
+ * The buffers used by the operations are kept alive, and cannot be
+ * resized, until the completion of the operation has been returned.
+ */
+
+#include "Python.h"
+
+#include <linux/io_uring.h>
+#include <sys/mman.h>
+#include <sys/socket.h>
+#include <sys/syscall.h>
+#include <string.h>
+#include <unistd.h>
+
+#ifndef __NR_io_uring_setup
+#  define __NR_io_uring_setup 425
+#endif
+#ifndef __NR_io_uring_enter
+#  define __NR_io_uring_enter 426
+#endif
+#ifndef __NR_io_uring_register
+#  define __NR_io_uring_register 427
+#endif
+
+/* Keys of internal requests: their completions are not reported */
+#define TIMEOUT_KEY UINT64_MAX
+#define IGNORED_KEY (UINT64_MAX - 1)
+
+#define DEFAULT_ENTRIES 256
+
+#define load_acquire(p) __atomic_load_n((p), __ATOMIC_ACQUIRE)
+#define store_release(p, v) __atomic_store_n((p), (v), __ATOMIC_RELEASE)
+
+/* Operations used by the proactor, checked when creating a ring */
+static const int required_ops[] = {
+    IORING_OP_NOP, IORING_OP_READ, IORING_OP_WRITE, IORING_OP_RECV,
+    IORING_OP_SEND, IORING_OP_ACCEPT, IORING_OP_POLL_ADD,
+    IORING_OP_ASYNC_CANCEL, IORING_OP_TIMEOUT, IORING_OP_TIMEOUT_REMOVE,
+};
+
+typedef struct {
+    PyObject_HEAD
+    int fd;
+    unsigned sq_entries;
+    unsigned sq_mask;
+    unsigned *sq_head;
+    unsigned *sq_tail;
+    struct io_uring_sqe *sqes;
+    unsigned cq_mask;
+    unsigned *cq_head;
+    unsigned *cq_tail;
+    struct io_uring_cqe *cqes;
+    void *sq_ring;
+    size_t sq_ring_size;
+    void *cq_ring;
+    size_t cq_ring_size;
+    size_t sqes_size;
+    /* key => memoryview of the buffer of a pending operation */
+    PyObject *buffers;
+    /* Set while the GIL is released by submit_and_wait() */
+    int waiting;
+    struct __kernel_timespec timeout;
+    /* Number of timeouts submitted which have not completed yet */
+    unsigned timeouts;
+} RingObject;
+
+static PyTypeObject Ring_Type;
+
+
+static int
+sys_io_uring_enter(int fd, unsigned to_submit, unsigned min_complete,
+                   unsigned flags)
+{
+    return (int)syscall(__NR_io_uring_enter, fd, to_submit, min_complete,
+                        flags, NULL, 0);
+}
+
+static int
+key_converter(PyObject *obj, void *ptr)
+{
+    unsigned long long key = PyLong_AsUnsignedLongLong(obj);
+    if (key == (unsigned long long)-1 && PyErr_Occurred()) {
+        return 0;
+    }
+    if (key >= IGNORED_KEY) {
+        PyErr_SetString(PyExc_OverflowError, "key is too large");
+        return 0;
+    }
+    *(unsigned long long *)ptr = key;
+    return 1;
+}
+
+static int
+check_ring(RingObject *self)
+{
+    if (self->fd < 0) {
+        PyErr_SetString(PyExc_ValueError, "I/O operation on closed ring");
+        return -1;
+    }
+    if (self->waiting) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "ring is being waited on by another thread");
+        return -1;
+    }
+    return 0;
+}
+
+/* Submit the queued entries to the kernel without waiting */
+static int
+submit(RingObject *self)
+{
+    unsigned pending = *self->sq_tail - load_acquire(self->sq_head);
+    int ret;
+
+    if (!pending) {
+        return 0;
+    }
+    do {
+        ret = sys_io_uring_enter(self->fd, pending, 0, 0);
+    } while (ret < 0 && errno == EINTR);
+    if (ret < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    return 0;
+}
+
+/* Return a cleared entry at the tail of the submission queue.  The entry
+   is only queued by push_sqe(). */
+static struct io_uring_sqe *
+get_sqe(RingObject *self)
+{
+    unsigned tail = *self->sq_tail;
+    struct io_uring_sqe *sqe;
+
+    if (tail - load_acquire(self->sq_head) >= self->sq_entries) {
+        if (submit(self) < 0) {
+            return NULL;
+        }
+        if (tail - load_acquire(self->sq_head) >= self->sq_entries) {
+            errno = EBUSY;
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+    }
+    sqe = &self->sqes[tail & self->sq_mask];
+    memset(sqe, 0, sizeof(*sqe));
+    return sqe;
+}
+
+static void
+push_sqe(RingObject *self)
+{
+    store_release(self->sq_tail, *self->sq_tail + 1);
+}
+
+/* Consume the completions of internal requests at the head of the
+   completion queue.  Return 1 if completions of operations remain. */
+static int
+reap_internal(RingObject *self)
+{
+    unsigned head = *self->cq_head;
+    unsigned tail = load_acquire(self->cq_tail);
+    struct io_uring_cqe *cqe;
+
+    for (; head != tail; head++) {
+        cqe = &self->cqes[head & self->cq_mask];
+        if (cqe->user_data < IGNORED_KEY) {
+            break;
+        }
+        if (cqe->user_data == TIMEOUT_KEY) {
+            self->timeouts--;
+        }
+    }
+    store_release(self->cq_head, head);
+    return head != tail;
+}
+
+/* Drop the reference to the buffer of the operation *key*, if any */
+static int
+forget_buffer(RingObject *self, unsigned long long key)
+{
+    PyObject *keyobj = PyLong_FromUnsignedLongLong(key);
+
+    if (keyobj == NULL) {
+        return -1;
+    }
+    if (PyDict_DelItem(self->buffers, keyobj) < 0) {
+        if (!PyErr_ExceptionMatches(PyExc_KeyError)) {
+            Py_DECREF(keyobj);
+            return -1;
+        }
+        PyErr_Clear();
+    }
+    Py_DECREF(keyobj);
+    return 0;
+}
+
+/* Cancel the submitted operations which use a buffer and wait for their
+   completions: the kernel could otherwise access the buffers once they
+   are released.  The entries which were not submitted are discarded.
+   On error, the buffers still referenced must never be released. */
+static int
+ring_cancel_buffers(RingObject *self)
+{
+    PyObject *keyobj, *view;
+    Py_ssize_t pos;
+    struct io_uring_sqe *sqe;
+    struct io_uring_cqe *cqe;
+    unsigned head, tail, pending;
+    unsigned long long key;
+    int cancelled = 0;
+    int ret;
+
+    tail = *self->sq_tail;
+    for (head = load_acquire(self->sq_head); head != tail; head++) {
+        sqe = &self->sqes[head & self->sq_mask];
+        if (sqe->user_data < IGNORED_KEY &&
+            forget_buffer(self, sqe->user_data) < 0)
+        {
+            return -1;
+        }
+    }
+    store_release(self->sq_tail, load_acquire(self->sq_head));
+
+    while (1) {
+        tail = load_acquire(self->cq_tail);
+        for (head = *self->cq_head; head != tail; head++) {
+            cqe = &self->cqes[head & self->cq_mask];
+            if (cqe->user_data < IGNORED_KEY &&
+                forget_buffer(self, cqe->user_data) < 0)
+            {
+                store_release(self->cq_head, head);
+                return -1;
+            }
+        }
+        store_release(self->cq_head, tail);
+        if (PyDict_GET_SIZE(self->buffers) == 0) {
+            return 0;
+        }
+
+        if (!cancelled) {
+            pos = 0;
+            while (PyDict_Next(self->buffers, &pos, &keyobj, &view)) {
+                key = PyLong_AsUnsignedLongLong(keyobj);
+                if (key == (unsigned long long)-1 && PyErr_Occurred()) {
+                    return -1;
+                }
+                sqe = get_sqe(self);
+                if (sqe == NULL) {
+                    return -1;
+                }
+                sqe->opcode = IORING_OP_ASYNC_CANCEL;
+                sqe->fd = -1;
+                sqe->addr = key;
+                sqe->user_data = IGNORED_KEY;
+                push_sqe(self);
+            }
+            cancelled = 1;
+        }
+
+        /* An operation which is already running, like a read from a
+           regular file, cannot be cancelled: wait for its completion. */
+        pending = *self->sq_tail - load_acquire(self->sq_head);
+        self->waiting = 1;
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->fd, pending, 1,
+                                 IORING_ENTER_GETEVENTS);
+        Py_END_ALLOW_THREADS
+        self->waiting = 0;
+        if (ret < 0 && errno != EINTR && errno != EAGAIN && errno != EBUSY) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+    }
+}
+
+static void
+ring_release(RingObject *self)
+{
+    if (self->sqes != NULL) {
+        munmap(self->sqes, self->sqes_size);
+        self->sqes = NULL;
+    }
+    if (self->cq_ring != NULL && self->cq_ring != self->sq_ring) {
+        munmap(self->cq_ring, self->cq_ring_size);
+    }
+    self->cq_ring = NULL;
+    if (self->sq_ring != NULL) {
+        munmap(self->sq_ring, self->sq_ring_size);
+        self->sq_ring = NULL;
+    }
+    if (self->fd >= 0) {
+        close(self->fd);
+        self->fd = -1;
+    }
+}
+
+static int
+check_operations(int fd)
+{
+    struct io_uring_probe *probe;
+    size_t size = sizeof(*probe) + 256 * sizeof(struct io_uring_probe_op);
+    size_t i;
+    int op;
+
+    probe = PyMem_Calloc(1, size);
+    if (probe == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (syscall(__NR_io_uring_register, fd, IORING_REGISTER_PROBE,
+                probe, 256) < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        PyMem_Free(probe);
+        return -1;
+    }
+    for (i = 0; i < Py_ARRAY_LENGTH(required_ops); i++) {
+        op = required_ops[i];
+        if (op > probe->last_op ||
+            !(probe->ops[op].flags & IO_URING_OP_SUPPORTED))
+        {
+            PyErr_Format(PyExc_OSError,
+                         "io_uring operation %d is not supported", op);
+            PyMem_Free(probe);
+            return -1;
+        }
+    }
+    PyMem_Free(probe);
+    return 0;
+}
+
+static void *
+map_ring(int fd, size_t size, off_t offset)
+{
+    void *ptr = mmap(NULL, size, PROT_READ | PROT_WRITE,
+                     MAP_SHARED | MAP_POPULATE, fd, offset);
+    if (ptr == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    return ptr;
+}
+
+PyDoc_STRVAR(
+    Ring_doc,
+    "Ring(entries=256)\n\n"
+    "io_uring instance with a submission queue of *entries* entries.\n\n"
+    "OSError is raised if io_uring is not available or does not support\n"
+    "the operations used by the proactor.");
+
+static PyObject *
+Ring_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"entries", NULL};
+    unsigned int entries = DEFAULT_ENTRIES;
+    struct io_uring_params params;
+    RingObject *self;
+    char *sq_ring;
+    char *cq_ring;
+    unsigned *array;
+    unsigned i;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|I:Ring", kwlist,
+                                     &entries))
+        return NULL;
+    if (entries == 0) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+
+    self = (RingObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->fd = -1;
+    self->buffers = PyDict_New();
+    if (self->buffers == NULL) {
+        goto error;
+    }
+
+    memset(&params, 0, sizeof(params));
+    params.flags = IORING_SETUP_CLAMP;
+    self->fd = (int)syscall(__NR_io_uring_setup, entries, &params);
+    if (self->fd < 0) {
+        self->fd = -1;
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+    if (!(params.features & IORING_FEAT_NODROP)) {
+        PyErr_SetString(PyExc_OSError,
+                        "io_uring does not support IORING_FEAT_NODROP");
+        goto error;
+    }
+    if (check_operations(self->fd) < 0) {
+        goto error;
+    }
+
+    self->sq_ring_size = params.sq_off.array
+                         + params.sq_entries * sizeof(unsigned);
+    self->cq_ring_size = params.cq_off.cqes
+                         + params.cq_entries * sizeof(struct io_uring_cqe);
+    if (params.features & IORING_FEAT_SINGLE_MMAP) {
+        if (self->cq_ring_size > self->sq_ring_size) {
+            self->sq_ring_size = self->cq_ring_size;
+        }
+        self->cq_ring_size = self->sq_ring_size;
+    }
+    self->sq_ring = map_ring(self->fd, self->sq_ring_size,
+                             IORING_OFF_SQ_RING);
+    if (self->sq_ring == NULL) {
+        goto error;
+    }
+    if (params.features & IORING_FEAT_SINGLE_MMAP) {
+        self->cq_ring = self->sq_ring;
+    }
+    else {
+        self->cq_ring = map_ring(self->fd, self->cq_ring_size,
+                                 IORING_OFF_CQ_RING);
+        if (self->cq_ring == NULL) {
+            goto error;
+        }
+    }
+    self->sqes_size = params.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = map_ring(self->fd, self->sqes_size, IORING_OFF_SQES);
+    if (self->sqes == NULL) {
+        goto error;
+    }
+
+    sq_ring = self->sq_ring;
+    cq_ring = self->cq_ring;
+    self->sq_entries = params.sq_entries;
+    self->sq_mask = *(unsigned *)(sq_ring + params.sq_off.ring_mask);
+    self->sq_head = (unsigned *)(sq_ring + params.sq_off.head);
+    self->sq_tail = (unsigned *)(sq_ring + params.sq_off.tail);
+    self->cq_mask = *(unsigned *)(cq_ring + params.cq_off.ring_mask);
+    self->cq_head = (unsigned *)(cq_ring + params.cq_off.head);
+    self->cq_tail = (unsigned *)(cq_ring + params.cq_off.tail);
+    self->cqes = (struct io_uring_cqe *)(cq_ring + params.cq_off.cqes);
+    /* Submission queue entries are always used in order */
+    array = (unsigned *)(sq_ring + params.sq_off.array);
+    for (i = 0; i < params.sq_entries; i++) {
+        array[i] = i;
+    }
+    return (PyObject *)self;
+
+error:
+    Py_DECREF(self);
+    return NULL;
+}
+
+static void
+Ring_dealloc(RingObject *self)
+{
+    PyObject *exc, *val, *tb;
+
+    if (self->fd >= 0) {
+        PyErr_Fetch(&exc, &val, &tb);
+        if (ring_cancel_buffers(self) < 0) {
+            PyErr_WriteUnraisable((PyObject *)self);
+            /* The kernel may still access the buffers */
+            self->buffers = NULL;
+        }
+        PyErr_Restore(exc, val, tb);
+    }
+    ring_release(self);
+    Py_CLEAR(self->buffers);
+    Py_TYPE(self)->tp_free(self);
+}
+
+/* Queue an operation on the buffer *obj* */
+static PyObject *
+prep_buffer(RingObject *self, int opcode, unsigned long long key, int fd,
+            PyObject *obj, int writable, int flags)
+{
+    PyObject *view;
+    PyObject *keyobj;
+    Py_buffer *buf;
+    struct io_uring_sqe *sqe;
+    int res;
+
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+    view = PyMemoryView_FromObject(obj);
+    if (view == NULL) {
+        return NULL;
+    }
+    buf = PyMemoryView_GET_BUFFER(view);
+    if (!PyBuffer_IsContiguous(buf, 'C')) {
+        PyErr_SetString(PyExc_TypeError, "a contiguous buffer is required");
+        goto error;
+    }
+    if (writable && buf->readonly) {
+        PyErr_SetString(PyExc_TypeError, "a writable buffer is required");
+        goto error;
+    }
+    keyobj = PyLong_FromUnsignedLongLong(key);
+    if (keyobj == NULL) {
+        goto error;
+    }
+    res = PyDict_Contains(self->buffers, keyobj);
+    if (res > 0) {
+        PyErr_SetString(PyExc_ValueError, "key is already in use");
+        res = -1;
+    }
+    /* The entry is only queued by push_sqe() */
+    sqe = res < 0 ? NULL : get_sqe(self);
+    if (sqe == NULL || PyDict_SetItem(self->buffers, keyobj, view) < 0) {
+        Py_DECREF(keyobj);
+        goto error;
+    }
+    Py_DECREF(keyobj);
+    Py_DECREF(view);
+
+    sqe->opcode = opcode;
+    sqe->fd = fd;
+    sqe->addr = (unsigned long long)(uintptr_t)buf->buf;
+    sqe->len = (unsigned)Py_MIN(buf->len, (Py_ssize_t)UINT32_MAX);
+    if (opcode == IORING_OP_READ || opcode == IORING_OP_WRITE) {
+        /* Use the current file position, like read() and write() */
+        sqe->off = (unsigned long long)-1;
+    }
+    else {
+        sqe->msg_flags = flags;
+    }
+    sqe->user_data = key;
+    push_sqe(self);
+    Py_RETURN_NONE;
+
+error:
+    Py_DECREF(view);
+    return NULL;
+}
+
+PyDoc_STRVAR(
+    Ring_read_doc,
+    "read(key, fd, buffer) -> None\n\n"
+    "Queue a read() from the file descriptor into the writable buffer.\n"
+    "The result is the number of bytes read.");
+
+static PyObject *
+Ring_read(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    PyObject *obj;
+
+    if (!PyArg_ParseTuple(args, "O&iO:read", key_converter, &key, &fd, &obj))
+        return NULL;
+    return prep_buffer(self, IORING_OP_READ, key, fd, obj, 1, 0);
+}
+
+PyDoc_STRVAR(
+    Ring_write_doc,
+    "write(key, fd, buffer) -> None\n\n"
+    "Queue a write() of the buffer to the file descriptor.\n"
+    "The result is the number of bytes written.");
+
+static PyObject *
+Ring_write(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    PyObject *obj;
+
+    if (!PyArg_ParseTuple(args, "O&iO:write",
+                          key_converter, &key, &fd, &obj))
+        return NULL;
+    return prep_buffer(self, IORING_OP_WRITE, key, fd, obj, 0, 0);
+}
+
+PyDoc_STRVAR(
+    Ring_recv_doc,
+    "recv(key, fd, buffer, flags=0) -> None\n\n"
+    "Queue a recv() from the socket into the writable buffer.\n"
+    "The result is the number of bytes received.");
+
+static PyObject *
+Ring_recv(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    PyObject *obj;
+    int flags = 0;
+
+    if (!PyArg_ParseTuple(args, "O&iO|i:recv",
+                          key_converter, &key, &fd, &obj, &flags))
+        return NULL;
+    return prep_buffer(self, IORING_OP_RECV, key, fd, obj, 1, flags);
+}
+
+PyDoc_STRVAR(
+    Ring_send_doc,
+    "send(key, fd, buffer, flags=0) -> None\n\n"
+    "Queue a send() of the buffer to the socket.\n"
+    "The result is the number of bytes sent, which can be less than the\n"
+    "size of the buffer.");
+
+static PyObject *
+Ring_send(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    PyObject *obj;
+    int flags = 0;
+
+    if (!PyArg_ParseTuple(args, "O&iO|i:send",
+                          key_converter, &key, &fd, &obj, &flags))
+        return NULL;
+    return prep_buffer(self, IORING_OP_SEND, key, fd, obj, 0,
+                       flags | MSG_NOSIGNAL);
+}
+
+PyDoc_STRVAR(
+    Ring_accept_doc,
+    "accept(key, fd) -> None\n\n"
+    "Queue an accept() on the listening socket.\n"
+    "The result is the file descriptor of the non-blocking,\n"
+    "close-on-exec, connected socket.");
+
+static PyObject *
+Ring_accept(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    struct io_uring_sqe *sqe;
+
+    if (!PyArg_ParseTuple(args, "O&i:accept", key_converter, &key, &fd))
+        return NULL;
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+    sqe = get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = SOCK_NONBLOCK | SOCK_CLOEXEC;
+    sqe->user_data = key;
+    push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(
+    Ring_poll_doc,
+    "poll(key, fd, events) -> None\n\n"
+    "Queue a one-shot poll of the file descriptor for the select.POLL*\n"
+    "events.  The result is the mask of the events which occurred.");
+
+static PyObject *
+Ring_poll(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    int fd;
+    unsigned int events;
+    struct io_uring_sqe *sqe;
+
+    if (!PyArg_ParseTuple(args, "O&iI:poll",
+                          key_converter, &key, &fd, &events))
+        return NULL;
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+    sqe = get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+#if __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+    events = (events << 16) | (events >> 16);
+#endif
+    sqe->poll32_events = events;
+    sqe->user_data = key;
+    push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(
+    Ring_cancel_doc,
+    "cancel(key) -> bool\n\n"
+    "Cancel the operation identified by key.\n\n"
+    "Return True if the operation had not been submitted to the kernel\n"
+    "yet: it is discarded and no completion will be reported for it.\n"
+    "Otherwise, a cancellation request is queued and the operation\n"
+    "completes later, with -ECANCELED if it was cancelled in time.");
+
+static PyObject *
+Ring_cancel(RingObject *self, PyObject *args)
+{
+    unsigned long long key;
+    unsigned head, tail;
+    struct io_uring_sqe *sqe;
+
+    if (!PyArg_ParseTuple(args, "O&:cancel", key_converter, &key))
+        return NULL;
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+
+    /* The file descriptor of an operation which has not been submitted
+       may be closed and reused before the next submission: replace it
+       with a no-op. */
+    tail = *self->sq_tail;
+    for (head = load_acquire(self->sq_head); head != tail; head++) {
+        sqe = &self->sqes[head & self->sq_mask];
+        if (sqe->user_data == key && sqe->opcode != IORING_OP_ASYNC_CANCEL) {
+            memset(sqe, 0, sizeof(*sqe));
+            sqe->opcode = IORING_OP_NOP;
+            sqe->user_data = IGNORED_KEY;
+            if (forget_buffer(self, key) < 0) {
+                return NULL;
+            }
+            Py_RETURN_TRUE;
+        }
+    }
+
+    sqe = get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = key;
+    sqe->user_data = IGNORED_KEY;
+    push_sqe(self);
+    Py_RETURN_FALSE;
+}
+
+PyDoc_STRVAR(
+    Ring_submit_and_wait_doc,
+    "submit_and_wait(timeout=None) -> list\n\n"
+    "Submit the queued operations and wait for completions.\n\n"
+    "Wait for at most *timeout* seconds, or forever if timeout is None.\n"
+    "Return a list of (key, result) tuples; a negative result is an\n"
+    "error number.");
+
+static PyObject *
+Ring_submit_and_wait(RingObject *self, PyObject *args)
+{
+    PyObject *timeout_obj = Py_None;
+    PyObject *result = NULL;
+    PyObject *item;
+    PyObject *keyobj;
+    struct io_uring_cqe *cqe;
+    struct io_uring_sqe *sqe;
+    unsigned head, tail, pending, wait_nr = 1;
+    _PyTime_t timeout = 0;
+    struct timespec ts;
+    int ret;
+
+    if (!PyArg_ParseTuple(args, "|O:submit_and_wait", &timeout_obj))
+        return NULL;
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_CEILING) < 0) {
+            return NULL;
+        }
+        if (timeout < 0) {
+            PyErr_SetString(PyExc_ValueError, "timeout must be non-negative");
+            return NULL;
+        }
+    }
+
+    if (self->timeouts) {
+        /* A previous wait returned before its timeout expired, on a
+           completion or a signal: remove the timeout, which would
+           otherwise end a later wait early. */
+        sqe = get_sqe(self);
+        if (sqe == NULL) {
+            return NULL;
+        }
+        sqe->opcode = IORING_OP_TIMEOUT_REMOVE;
+        sqe->fd = -1;
+        sqe->addr = TIMEOUT_KEY;
+        sqe->user_data = IGNORED_KEY;
+        push_sqe(self);
+        if (submit(self) < 0) {
+            return NULL;
+        }
+    }
+
+    if (reap_internal(self)) {
+        /* Completions are already available */
+        wait_nr = 0;
+    }
+    else if (timeout_obj != Py_None) {
+        if (timeout == 0) {
+            wait_nr = 0;
+        }
+        else {
+            if (_PyTime_AsTimespec(timeout, &ts) < 0) {
+                return NULL;
+            }
+            sqe = get_sqe(self);
+            if (sqe == NULL) {
+                return NULL;
+            }
+            self->timeout.tv_sec = ts.tv_sec;
+            self->timeout.tv_nsec = ts.tv_nsec;
+            /* Expires after the timeout or the next completion */
+            sqe->opcode = IORING_OP_TIMEOUT;
+            sqe->fd = -1;
+            sqe->addr = (unsigned long long)(uintptr_t)&self->timeout;
+            sqe->len = 1;
+            sqe->off = 1;
+            sqe->user_data = TIMEOUT_KEY;
+            push_sqe(self);
+            self->timeouts++;
+        }
+    }
+
+    pending = *self->sq_tail - load_acquire(self->sq_head);
+    if (pending || wait_nr) {
+        self->waiting = 1;
+        Py_BEGIN_ALLOW_THREADS
+        ret = sys_io_uring_enter(self->fd, pending, wait_nr,
+                                 wait_nr ? IORING_ENTER_GETEVENTS : 0);
+        Py_END_ALLOW_THREADS
+        self->waiting = 0;
+        if (ret < 0) {
+            if (errno == EINTR) {
+                if (PyErr_CheckSignals() < 0) {
+                    return NULL;
+                }
+            }
+            else if (errno != EAGAIN && errno != EBUSY) {
+                return PyErr_SetFromErrno(PyExc_OSError);
+            }
+        }
+    }
+
+    /* The completions are only consumed once the list is built, so that
+       none is lost on error. */
+    result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    tail = load_acquire(self->cq_tail);
+    for (head = *self->cq_head; head != tail; head++) {
+        cqe = &self->cqes[head & self->cq_mask];
+        if (cqe->user_data >= IGNORED_KEY) {
+            if (cqe->user_data == TIMEOUT_KEY) {
+                self->timeouts--;
+            }
+            continue;
+        }
+        item = Py_BuildValue("(Ki)", (unsigned long long)cqe->user_data,
+                             (int)cqe->res);
+        if (item == NULL || PyList_Append(result, item) < 0) {
+            Py_XDECREF(item);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    store_release(self->cq_head, tail);
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(result); i++) {
+        keyobj = PyTuple_GET_ITEM(PyList_GET_ITEM(result, i), 0);
+        if (PyDict_DelItem(self->buffers, keyobj) < 0) {
+            /* Operations without buffer */
+            PyErr_Clear();
+        }
+    }
+    return result;
+}
+
+PyDoc_STRVAR(
+    Ring_fileno_doc,
+    "fileno() -> int\n\n"
+    "Return the file descriptor of the ring.");
+
+static PyObject *
+Ring_fileno(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    if (self->fd < 0) {
+        PyErr_SetString(PyExc_ValueError, "I/O operation on closed ring");
+        return NULL;
+    }
+    return PyLong_FromLong(self->fd);
+}
+
+PyDoc_STRVAR(
+    Ring_close_doc,
+    "close() -> None\n\n"
+    "Close the ring.\n\n"
+    "The operations which were not submitted are discarded.  The pending\n"
+    "operations which use a buffer are cancelled, and the buffers are\n"
+    "only released once their completions are received.");
+
+static PyObject *
+Ring_close(RingObject *self, PyObject *Py_UNUSED(ignored))
+{
+    if (self->fd < 0) {
+        Py_RETURN_NONE;
+    }
+    if (check_ring(self) < 0) {
+        return NULL;
+    }
+    if (ring_cancel_buffers(self) < 0) {
+        ring_release(self);
+        /* The kernel may still access the buffers: never release them */
+        self->buffers = NULL;
+        return NULL;
+    }
+    ring_release(self);
+    PyDict_Clear(self->buffers);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+Ring_get_closed(RingObject *self, void *Py_UNUSED(closure))
+{
+    return PyBool_FromLong(self->fd < 0);
+}
+
+static PyObject *
+Ring_get_entries(RingObject *self, void *Py_UNUSED(closure))
+{
+    return PyLong_FromUnsignedLong(self->sq_entries);
+}
+
+static PyMethodDef Ring_methods[] = {
+    {"read", (PyCFunction)Ring_read, METH_VARARGS, Ring_read_doc},
+    {"write", (PyCFunction)Ring_write, METH_VARARGS, Ring_write_doc},
+    {"recv", (PyCFunction)Ring_recv, METH_VARARGS, Ring_recv_doc},
+    {"send", (PyCFunction)Ring_send, METH_VARARGS, Ring_send_doc},
+    {"accept", (PyCFunction)Ring_accept, METH_VARARGS, Ring_accept_doc},
+    {"poll", (PyCFunction)Ring_poll, METH_VARARGS, Ring_poll_doc},
+    {"cancel", (PyCFunction)Ring_cancel, METH_VARARGS, Ring_cancel_doc},
+    {"submit_and_wait", (PyCFunction)Ring_submit_and_wait, METH_VARARGS,
+     Ring_submit_and_wait_doc},
+    {"fileno", (PyCFunction)Ring_fileno, METH_NOARGS, Ring_fileno_doc},
+    {"close", (PyCFunction)Ring_close, METH_NOARGS, Ring_close_doc},
+    {NULL}
+};
+
+static PyGetSetDef Ring_getsets[] = {
+    {"closed", (getter)Ring_get_closed, NULL,
+     "True if the ring is closed.", NULL},
+    {"entries", (getter)Ring_get_entries, NULL,
+     "Size of the submission queue.", NULL},
+    {NULL}
+};
+
+static PyTypeObject Ring_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    /* tp_name           */ "_uring.Ring",
+    /* tp_basicsize      */ sizeof(RingObject),
+    /* tp_itemsize       */ 0,
+    /* tp_dealloc        */ (destructor) Ring_dealloc,
+    /* tp_vectorcall_offset */ 0,
+    /* tp_getattr        */ 0,
+    /* tp_setattr        */ 0,
+    /* tp_as_async       */ 0,
+    /* tp_repr           */ 0,
+    /* tp_as_number      */ 0,
+    /* tp_as_sequence    */ 0,
+    /* tp_as_mapping     */ 0,
+    /* tp_hash           */ 0,
+    /* tp_call           */ 0,
+    /* tp_str            */ 0,
+    /* tp_getattro       */ 0,
+    /* tp_setattro       */ 0,
+    /* tp_as_buffer      */ 0,
+    /* tp_flags          */ Py_TPFLAGS_DEFAULT,
+    /* tp_doc            */ Ring_doc,
+    /* tp_traverse       */ 0,
+    /* tp_clear          */ 0,
+    /* tp_richcompare    */ 0,
+    /* tp_weaklistoffset */ 0,
+    /* tp_iter           */ 0,
+    /* tp_iternext       */ 0,
+    /* tp_methods        */ Ring_methods,
+    /* tp_members        */ 0,
+    /* tp_getset         */ Ring_getsets,
+    /* tp_base           */ 0,
+    /* tp_dict           */ 0,
+    /* tp_descr_get      */ 0,
+    /* tp_descr_set      */ 0,
+    /* tp_dictoffset     */ 0,
+    /* tp_init           */ 0,
+    /* tp_alloc          */ 0,
+    /* tp_new            */ Ring_new,
+};
+
+static struct PyModuleDef uring_module = {
+    PyModuleDef_HEAD_INIT,
+    "_uring",
+    "io_uring support for the asyncio proactor event loop.",
+    -1,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__uring(void)
+{
+    PyObject *m;
+
+    if (PyType_Ready(&Ring_Type) < 0)
+        return NULL;
+
+    m = PyModule_Create(&uring_module);
+    if (m == NULL)
+        return NULL;
+
+    Py_INCREF(&Ring_Type);
+    if (PyModule_AddObject(m, "Ring", (PyObject *)&Ring_Type) < 0) {
+        Py_DECREF(&Ring_Type);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
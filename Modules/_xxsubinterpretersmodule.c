@@ -277,6 +277,156 @@ _sharedexception_apply(_sharedexception *exc, PyObject *wrapperclass)
 }
 
 
+/* Buffers are shared between interpreters without copying: the sending
+   interpreter keeps a buffer export on the object alive until every
+   interpreter that received it has dropped its memoryview. */
+
+typedef struct _sharedbuffer {
+    Py_buffer view;
+    Py_ssize_t refcount;
+    // Used to release the view in the interpreter that exported it.
+    _PyCrossInterpreterData xid;
+} _sharedbuffer;
+
+static void
+_sharedbuffer_release_view(void *data)
+{
+    PyBuffer_Release((Py_buffer *)data);
+}
+
+static void
+_sharedbuffer_decref(void *data)
+{
+    _sharedbuffer *shared = (_sharedbuffer *)data;
+    if (--shared->refcount > 0) {
+        return;
+    }
+    // The exporting interpreter may already be gone, in which case there
+    // is nothing left to release.
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    _PyCrossInterpreterData_Release(&shared->xid);
+    PyErr_Restore(exc, val, tb);
+    PyMem_RawFree(shared);
+}
+
+typedef struct xibufferobject {
+    PyObject_HEAD
+    _sharedbuffer *shared;
+} xibufferobject;
+
+static void
+xibuffer_dealloc(xibufferobject *self)
+{
+    _sharedbuffer_decref(self->shared);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static int
+xibuffer_getbuffer(xibufferobject *self, Py_buffer *view, int flags)
+{
+    Py_buffer *src = &self->shared->view;
+    if (!(flags & PyBUF_FORMAT)) {
+        // The consumer only wants the raw bytes.
+        return PyBuffer_FillInfo(view, (PyObject *)self, src->buf, src->len,
+                                 src->readonly, flags);
+    }
+    if ((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE && src->readonly) {
+        PyErr_SetString(PyExc_BufferError, "shared buffer is read-only");
+        return -1;
+    }
+    *view = *src;
+    Py_INCREF(self);
+    view->obj = (PyObject *)self;
+    view->internal = NULL;
+    if ((flags & PyBUF_STRIDES) != PyBUF_STRIDES) {
+        // The buffer is always C-contiguous.
+        view->strides = NULL;
+    }
+    return 0;
+}
+
+static PyBufferProcs xibuffer_as_buffer = {
+    (getbufferproc)xibuffer_getbuffer,  /* bf_getbuffer */
+    NULL,                               /* bf_releasebuffer */
+};
+
+PyDoc_STRVAR(xibuffer_doc,
+"A buffer shared with another interpreter.");
+
+static PyTypeObject XIBufferType = {
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "_xxsubinterpreters.SharedBuffer",  /* tp_name */
+    sizeof(xibufferobject),             /* tp_basicsize */
+    0,                                  /* tp_itemsize */
+    (destructor)xibuffer_dealloc,       /* tp_dealloc */
+    0,                                  /* tp_vectorcall_offset */
+    0,                                  /* tp_getattr */
+    0,                                  /* tp_setattr */
+    0,                                  /* tp_as_async */
+    0,                                  /* tp_repr */
+    0,                                  /* tp_as_number */
+    0,                                  /* tp_as_sequence */
+    0,                                  /* tp_as_mapping */
+    0,                                  /* tp_hash */
+    0,                                  /* tp_call */
+    0,                                  /* tp_str */
+    0,                                  /* tp_getattro */
+    0,                                  /* tp_setattro */
+    &xibuffer_as_buffer,                /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                 /* tp_flags */
+    xibuffer_doc,                       /* tp_doc */
+};
+
+static PyObject *
+_new_buffer_object(_PyCrossInterpreterData *data)
+{
+    _sharedbuffer *shared = (_sharedbuffer *)data->data;
+    xibufferobject *self = PyObject_New(xibufferobject, &XIBufferType);
+    if (self == NULL) {
+        return NULL;
+    }
+    shared->refcount++;
+    self->shared = shared;
+    PyObject *mv = PyMemoryView_FromObject((PyObject *)self);
+    Py_DECREF(self);
+    return mv;
+}
+
+static int
+_buffer_shared(PyObject *obj, _PyCrossInterpreterData *data)
+{
+    _sharedbuffer *shared = PyMem_RawMalloc(sizeof(_sharedbuffer));
+    if (shared == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (PyObject_GetBuffer(obj, &shared->view, PyBUF_FULL_RO) != 0) {
+        PyMem_RawFree(shared);
+        return -1;
+    }
+    if (!PyBuffer_IsContiguous(&shared->view, 'C')) {
+        PyBuffer_Release(&shared->view);
+        PyMem_RawFree(shared);
+        PyErr_SetString(PyExc_ValueError,
+                        "only C-contiguous buffers may be shared");
+        return -1;
+    }
+    shared->refcount = 1;  // Owned by the channel (or namespace) item.
+    shared->xid = (_PyCrossInterpreterData){0};
+    shared->xid.data = &shared->view;
+    shared->xid.interp = PyInterpreterState_GetID(_get_current());
+    shared->xid.new_object = _new_buffer_object;
+    shared->xid.free = _sharedbuffer_release_view;
+
+    data->data = shared;
+    data->obj = NULL;
+    data->new_object = _new_buffer_object;
+    data->free = _sharedbuffer_decref;
+    return 0;
+}
+
+
 /* channel-specific code ****************************************************/
 
 #define CHANNEL_SEND 1
@@ -2524,6 +2674,9 @@ PyInit__xxsubinterpreters(void)
     if (PyType_Ready(&ChannelIDtype) != 0) {
         return NULL;
     }
+    if (PyType_Ready(&XIBufferType) != 0) {
+        return NULL;
+    }
 
     /* Create the module */
     PyObject *module = PyModule_Create(&interpretersmodule);
@@ -2553,6 +2706,15 @@ PyInit__xxsubinterpreters(void)
     if (_PyCrossInterpreterData_RegisterClass(&ChannelIDtype, _channelid_shared)) {
         return NULL;
     }
+    if (_PyCrossInterpreterData_RegisterClass(&PyMemoryView_Type, _buffer_shared)) {
+        return NULL;
+    }
+    if (_PyCrossInterpreterData_RegisterClass(&PyByteArray_Type, _buffer_shared)) {
+        return NULL;
+    }
+    if (_PyCrossInterpreterData_RegisterClass(&PyPickleBuffer_Type, _buffer_shared)) {
+        return NULL;
+    }
 
     return module;
 }
@@ -5,6 +5,10 @@
 #include "importlib.h"
 #include "importlib_external.h"
 #include "importlib_zipimport.h"
+#ifdef Py_FROZEN_STARTUP_MODULES
+/* Generated by "make Python/frozen_startup.h", see Makefile.pre.in */
+#include "frozen_startup.h"
+#endif
 
 /* In order to test the support for frozen modules, by default we
    define a single frozen module, __hello__.  Loading it will print
@@ -36,6 +40,10 @@ static const struct _frozen _PyImport_FrozenModules[] = {
         (int)sizeof(_Py_M__importlib_bootstrap_external)},
     {"zipimport", _Py_M__zipimport,
         (int)sizeof(_Py_M__zipimport)},
+#ifdef Py_FROZEN_STARTUP_MODULES
+    /* Modules imported at startup (configure --with-frozen-modules) */
+    _Py_FROZEN_STARTUP_MODULES
+#endif
     /* Test module */
     {"__hello__", M___hello__, SIZE},
     /* Test package (negative size indicates package-ness) */
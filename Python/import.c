@@ -1779,8 +1779,21 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *globals,
            __spec__._initializing is true.
            NOTE: because of this, initializing must be set *before*
            stuffing the new module in sys.modules.
+           Look in the namespace of modules first: getting an attribute of a
+           lazy module (see importlib.util.LazyLoader) would execute it.
          */
-        spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+        spec = NULL;
+        if (PyModule_Check(mod)) {
+            spec = _PyDict_GetItemIdWithError(PyModule_GetDict(mod),
+                                              &PyId___spec__);
+            if (spec == NULL && PyErr_Occurred()) {
+                goto error;
+            }
+            Py_XINCREF(spec);
+        }
+        if (spec == NULL) {
+            spec = _PyObject_GetAttrId(mod, &PyId___spec__);
+        }
         if (_PyModuleSpec_IsInitializing(spec)) {
             PyObject *value = _PyObject_CallMethodIdObjArgs(interp->importlib,
                                             &PyId__lock_unlock_module, abs_name,
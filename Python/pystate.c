@@ -1472,8 +1472,13 @@ _call_in_interpreter(struct _gilstate_runtime_state *gilstate,
      */
     PyThreadState *save_tstate = NULL;
     if (interp != _PyRuntimeGILState_GetThreadState(gilstate)->interp) {
-        // XXX Using the "head" thread isn't strictly correct.
-        PyThreadState *tstate = PyInterpreterState_ThreadHead(interp);
+        // Use the thread state of this thread if it has one in interp:
+        // the head thread may be in use by another thread.
+        PyThreadState *tstate = _PyGILState_GetThisThreadState(gilstate);
+        if (tstate == NULL || tstate->interp != interp) {
+            // XXX Using the "head" thread isn't strictly correct.
+            tstate = PyInterpreterState_ThreadHead(interp);
+        }
         // XXX Possible GILState issues?
         save_tstate = _PyThreadState_Swap(gilstate, tstate);
     }
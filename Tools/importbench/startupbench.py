@@ -0,0 +1,67 @@
+"""Benchmark the startup time of one or more interpreters.
+
+Each interpreter is run repeatedly with a few command lines, and the best and
+median wall clock times are reported, as well as the modules imported from
+sys.path, which a build configured --with-frozen-modules does not need to
+look up:
+
+    $ python3 Tools/importbench/startupbench.py ./python /usr/bin/python3.8
+
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+
+COMMANDS = [
+    ('-c pass', ['-c', 'pass']),
+    ('-I -c pass', ['-I', '-c', 'pass']),
+    ('-I -S -c pass', ['-I', '-S', '-c', 'pass']),
+]
+
+# Print the modules imported at startup which are found on sys.path.
+LIST_MODULES = """if True:
+    import sys
+    print(' '.join(sorted(
+        name for name, module in sys.modules.items()
+        if getattr(module, '__spec__', None) is not None
+        and module.__spec__.has_location)))
+    """
+
+
+def bench(args, runs):
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def main(executables, runs):
+    for executable in executables:
+        print(executable)
+        for label, args in COMMANDS:
+            best, median = bench([executable] + args, runs)
+            print('  {:<16} best {:6.2f} ms, median {:6.2f} ms'.format(
+                label, best * 1e3, median * 1e3))
+        modules = subprocess.run([executable, '-c', LIST_MODULES],
+                                 check=True, stdout=subprocess.PIPE,
+                                 universal_newlines=True).stdout.split()
+        print('  {} modules found on sys.path: {}'.format(
+            len(modules), ' '.join(modules) or '-'))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--runs', type=int, default=50,
+                        help='number of runs of each command line '
+                             '(default: %(default)s)')
+    parser.add_argument('executables', nargs='*', default=[sys.executable],
+                        help='interpreters to benchmark '
+                             '(default: the running interpreter)')
+    options = parser.parse_args()
+    main(options.executables, options.runs)
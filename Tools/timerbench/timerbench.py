@@ -0,0 +1,99 @@
+"""Compare the timer heap and the timer wheel of the asyncio event loop.
+
+Each benchmark is run on an event loop using the default binary heap
+and on one using a timer wheel (see loop.set_timer_wheel()):
+
+* churn: many idle timeouts (one per simulated connection) which are
+  constantly cancelled and rescheduled, as when a timeout is reset each
+  time data is received;
+* fire: many short timers which all expire.
+"""
+
+import argparse
+import asyncio
+import time
+
+
+def bench_churn(loop, connections, resets):
+    def on_timeout():
+        raise AssertionError('idle timeout expired')
+
+    async def main():
+        timers = [loop.call_later(60, on_timeout) for _ in range(connections)]
+        for i in range(resets):
+            conn = i % connections
+            timers[conn].cancel()
+            timers[conn] = loop.call_later(60, on_timeout)
+            if not i % 1000:
+                # Let the event loop run an iteration.
+                await asyncio.sleep(0)
+        for timer in timers:
+            timer.cancel()
+
+    t0 = time.perf_counter()
+    loop.run_until_complete(main())
+    return time.perf_counter() - t0
+
+
+def bench_fire(loop, timers, resets):
+    fired = 0
+
+    def on_timer():
+        nonlocal fired
+        fired += 1
+
+    async def main():
+        for i in range(timers):
+            loop.call_later((i % 100) / 1000, on_timer)
+        while fired < timers:
+            await asyncio.sleep(0.01)
+
+    t0 = time.perf_counter()
+    loop.run_until_complete(main())
+    return time.perf_counter() - t0
+
+
+BENCHMARKS = {
+    'churn': bench_churn,
+    'fire': bench_fire,
+}
+
+
+def run(name, args):
+    results = []
+    for resolution in (None, args.resolution):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.set_timer_wheel(resolution)
+            dt = BENCHMARKS[name](loop, args.timers, args.resets)
+        finally:
+            loop.close()
+        results.append(dt)
+    heap, wheel = results
+    print(f'{name:8} heap: {heap:8.3f} s   wheel: {wheel:8.3f} s   '
+          f'(x{heap / wheel:.2f})')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--timers', type=int, default=100_000,
+                        help='number of timers (default: %(default)s)')
+    parser.add_argument('-r', '--resets', type=int, default=1_000_000,
+                        help='number of cancel/reschedule operations for '
+                             'the churn benchmark (default: %(default)s)')
+    parser.add_argument('--resolution', type=float, default=0.001,
+                        help='tick of the timer wheel in seconds '
+                             '(default: %(default)s)')
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark',
+                        help='benchmarks to run among %s (default: all)'
+                             % ', '.join(BENCHMARKS))
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark: {name!r}')
+    for name in args.benchmarks or BENCHMARKS:
+        run(name, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1491,6 +1491,13 @@ class PyBuildExt(build_ext):
         elif not AIX and not RISCOS:
             self.missing.append('ossaudiodev')
 
+        # io_uring backend of the asyncio proactor event loop
+        if (HOST_PLATFORM.startswith('linux') and
+                find_file('linux/io_uring.h', self.inc_dirs, []) is not None):
+            self.add(Extension('_uring', ['_uringmodule.c']))
+        elif HOST_PLATFORM.startswith('linux'):
+            self.missing.append('_uring')
+
         if MACOS:
             self.add(Extension('_scproxy', ['_scproxy.c'],
                                extra_link_args=[